@@ -20,6 +20,15 @@ from .item_service import ItemService
 from .player_matches_service import PlayerMatchesService
 from .player_service import PlayerService, PlayerInfo
 from .utils import format_player_display_name, calculate_per_minute, name_to_slug
+from .wire import (
+    JSON_CONTENT_TYPE,
+    MSGPACK_CONTENT_TYPE,
+    decode_match,
+    encode_match,
+    msgpack_available,
+    slim_match_payload,
+    supported_content_types,
+)
 
 __all__ = [
     "PredecessorAPI",
@@ -50,5 +59,12 @@ __all__ = [
     "format_player_display_name",
     "calculate_per_minute",
     "name_to_slug",
+    "JSON_CONTENT_TYPE",
+    "MSGPACK_CONTENT_TYPE",
+    "decode_match",
+    "encode_match",
+    "msgpack_available",
+    "slim_match_payload",
+    "supported_content_types",
 ]
 
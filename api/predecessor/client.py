@@ -1,9 +1,16 @@
 """GraphQL client for the Predecessor API."""
 import aiohttp
 import base64
+import gzip
+import json
+import logging
 import time
 from typing import Any, Optional
 
+from .compression import CompressionStats, accept_encoding, decompress, operation_name
+
+logger = logging.getLogger("predecessor_api.client")
+
 
 class PredecessorAPI:
     """Async client for the Predecessor GraphQL API with OAuth2 support."""
@@ -14,6 +21,7 @@ class PredecessorAPI:
         oauth_token_url: Optional[str] = None,
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
+        compress_requests_over: int = 0,
     ) -> None:
         """
         Initialize the API client.
@@ -23,6 +31,8 @@ class PredecessorAPI:
             oauth_token_url: OAuth2 token endpoint (optional, enables auth)
             client_id: OAuth2 client ID (required if oauth_token_url set)
             client_secret: OAuth2 client secret (required if oauth_token_url set)
+            compress_requests_over: Gzip request bodies of at least this many
+                bytes (0 disables request compression)
         """
         self.api_url = api_url
         self.oauth_token_url = oauth_token_url
@@ -31,6 +41,10 @@ class PredecessorAPI:
         self._session: aiohttp.ClientSession | None = None
         self._access_token: Optional[str] = None
         self._token_expires_at: float = 0
+        self.compress_requests_over = compress_requests_over
+        self._accept_encoding = accept_encoding()
+        # operation name -> request/response byte counts
+        self._compression_stats: dict[str, CompressionStats] = {}
 
     @property
     def has_auth(self) -> bool:
@@ -40,9 +54,24 @@ class PredecessorAPI:
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create the aiohttp session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            # Bodies are decoded in _read_body so wire sizes can be measured
+            self._session = aiohttp.ClientSession(auto_decompress=False)
         return self._session
 
+    async def _read_body(self, response: aiohttp.ClientResponse) -> tuple[bytes, int]:
+        """
+        Read and decode a response body.
+
+        Returns:
+            Tuple of (decoded body, bytes received on the wire)
+        """
+        raw = await response.read()
+        return decompress(raw, response.headers.get("Content-Encoding")), len(raw)
+
+    def compression_stats(self) -> dict[str, dict[str, float]]:
+        """Get request/response byte counts and compression ratios per GraphQL operation."""
+        return {name: stats.as_dict() for name, stats in self._compression_stats.items()}
+
     async def close(self) -> None:
         """Close the HTTP session."""
         if self._session and not self._session.closed:
@@ -74,14 +103,16 @@ class PredecessorAPI:
             headers={
                 "Content-Type": "application/x-www-form-urlencoded",
                 "Authorization": f"Basic {basic_auth}",
+                "Accept-Encoding": self._accept_encoding,
             },
             data="grant_type=client_credentials",
         ) as response:
+            body, _ = await self._read_body(response)
             if response.status != 200:
-                error_text = await response.text()
+                error_text = body.decode(errors="replace")
                 raise Exception(f"OAuth2 token request failed: {response.status} - {error_text}")
 
-            token_data = await response.json()
+            token_data = json.loads(body)
 
         self._access_token = token_data["access_token"]
         expires_in = token_data.get("expires_in", 1800)  # Default 30 min
@@ -89,6 +120,25 @@ class PredecessorAPI:
 
         return self._access_token
 
+    async def _post_query(
+        self, session: aiohttp.ClientSession, data: bytes, headers: dict[str, str]
+    ) -> Optional[tuple[bytes, int]]:
+        """
+        POST a GraphQL request body and read the response.
+
+        Returns:
+            Tuple of (decoded body, bytes received on the wire), or None if the
+            server refused a compressed body with 415 (the response is released)
+
+        Raises:
+            aiohttp.ClientResponseError: On any other error status
+        """
+        async with session.post(self.api_url, data=data, headers=headers) as response:
+            if response.status == 415 and "Content-Encoding" in headers:
+                return None
+            response.raise_for_status()
+            return await self._read_body(response)
+
     async def query(self, query: str, variables: dict[str, Any] | None = None) -> dict[str, Any]:
         """
         Execute a GraphQL query against the Predecessor API.
@@ -109,20 +159,37 @@ class PredecessorAPI:
         if variables:
             payload["variables"] = variables
 
-        headers = {"Content-Type": "application/json"}
+        headers = {"Content-Type": "application/json", "Accept-Encoding": self._accept_encoding}
 
         # Add auth header if configured
         access_token = await self._get_access_token()
         if access_token:
             headers["Authorization"] = f"Bearer {access_token}"
 
-        async with session.post(
-            self.api_url,
-            json=payload,
-            headers=headers,
-        ) as response:
-            response.raise_for_status()
-            result = await response.json()
+        body = json.dumps(payload).encode()
+        wire_body = body
+        if self.compress_requests_over and len(body) >= self.compress_requests_over:
+            wire_body = gzip.compress(body, compresslevel=6)
+            headers["Content-Encoding"] = "gzip"
+
+        received = await self._post_query(session, wire_body, headers)
+        if received is None:
+            # Server does not accept compressed requests: stop compressing and resend
+            # once, uncompressed (a second 415 is raised like any other error)
+            logger.warning("GraphQL server rejected a gzip request body, disabling request compression")
+            self.compress_requests_over = 0
+            del headers["Content-Encoding"]
+            wire_body = body
+            received = await self._post_query(session, wire_body, headers)
+        response_body, response_wire = received
+
+        name = operation_name(query)
+        stats = self._compression_stats.get(name)
+        if stats is None:
+            stats = self._compression_stats[name] = CompressionStats()
+        stats.record(len(body), len(wire_body), len(response_body), response_wire)
+
+        result = json.loads(response_body)
 
         if "errors" in result:
             raise Exception(f"GraphQL errors: {result['errors']}")
@@ -0,0 +1,100 @@
+"""HTTP content-encoding helpers and per-operation compression stats for the GraphQL client."""
+import gzip
+import re
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+
+try:
+    import brotli
+except ImportError:  # Optional dependency: br is not advertised without it
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency: zstd is not advertised without it
+    zstandard = None
+
+_OPERATION_NAME = re.compile(r"^\s*(?:query|mutation)\s+(\w+)")
+
+
+def accept_encoding() -> str:
+    """Accept-Encoding header value listing every encoding this process can decode."""
+    encodings = ["gzip", "deflate"]
+    if brotli is not None:
+        encodings.append("br")
+    if zstandard is not None:
+        encodings.append("zstd")
+    return ", ".join(encodings)
+
+
+def decompress(body: bytes, encoding: Optional[str]) -> bytes:
+    """
+    Decode a response body according to its Content-Encoding.
+
+    Args:
+        body: Raw response bytes as received
+        encoding: Content-Encoding header value (None or "identity" for uncompressed)
+
+    Returns:
+        Decoded body
+
+    Raises:
+        ValueError: If the encoding is unsupported or the body is corrupt
+    """
+    encoding = (encoding or "identity").strip().lower()
+    try:
+        if encoding == "identity":
+            return body
+        if encoding in ("gzip", "x-gzip"):
+            return gzip.decompress(body)
+        if encoding == "deflate":
+            try:
+                return zlib.decompress(body)
+            except zlib.error:
+                # Some servers send raw deflate without the zlib header
+                return zlib.decompress(body, -zlib.MAX_WBITS)
+        if encoding == "br" and brotli is not None:
+            return brotli.decompress(body)
+        if encoding == "zstd" and zstandard is not None:
+            return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    except Exception as e:
+        # gzip, zlib, brotli and zstandard each raise their own error types
+        raise ValueError(f"Corrupt {encoding} response body: {e}") from e
+    raise ValueError(f"Unsupported Content-Encoding: {encoding}")
+
+
+def operation_name(query: str) -> str:
+    """Get the operation name of a GraphQL document ("anonymous" if it has none)."""
+    match = _OPERATION_NAME.match(query)
+    return match.group(1) if match else "anonymous"
+
+
+@dataclass
+class CompressionStats:
+    """Byte counts for one GraphQL operation, before and after compression."""
+    calls: int = 0
+    request_bytes: int = 0
+    request_wire_bytes: int = 0
+    response_bytes: int = 0
+    response_wire_bytes: int = 0
+
+    def record(self, request_bytes: int, request_wire: int, response_bytes: int, response_wire: int) -> None:
+        """Add one request/response pair."""
+        self.calls += 1
+        self.request_bytes += request_bytes
+        self.request_wire_bytes += request_wire
+        self.response_bytes += response_bytes
+        self.response_wire_bytes += response_wire
+
+    def as_dict(self) -> dict[str, float]:
+        """Totals plus compression ratios (uncompressed / wire bytes)."""
+        return {
+            "calls": self.calls,
+            "request_bytes": self.request_bytes,
+            "request_wire_bytes": self.request_wire_bytes,
+            "request_ratio": round(self.request_bytes / self.request_wire_bytes, 2) if self.request_wire_bytes else None,
+            "response_bytes": self.response_bytes,
+            "response_wire_bytes": self.response_wire_bytes,
+            "response_ratio": round(self.response_bytes / self.response_wire_bytes, 2) if self.response_wire_bytes else None,
+        }
@@ -0,0 +1,251 @@
+"""Wire encoding of raw match payloads sent from the cron workers to the bots.
+
+Two encodings are supported, negotiated via the HTTP Content-Type:
+
+- ``application/json``: the GraphQL match dict, trimmed to the fields
+  ``MatchService.transform_match_data`` reads. Readable by any bot version.
+- ``application/msgpack``: the same fields as positional arrays, with hero
+  names and enum values stored once in a per-payload string table. Requires
+  the optional ``msgpack`` package on both ends.
+
+Both decode back to a dict in the GraphQL shape that ``transform_match_data``
+accepts unchanged.
+"""
+import json
+import sys
+from typing import Any, Optional
+
+try:
+    import msgpack
+except ImportError:  # Optional dependency: fall back to JSON
+    msgpack = None
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+# Bumped whenever the positional layout below changes
+COMPACT_FORMAT_VERSION = 1
+
+
+def msgpack_available() -> bool:
+    """Whether the optional msgpack package is installed."""
+    return msgpack is not None
+
+
+def supported_content_types() -> list[str]:
+    """Content types this process can decode, preferred first."""
+    if msgpack is not None:
+        return [MSGPACK_CONTENT_TYPE, JSON_CONTENT_TYPE]
+    return [JSON_CONTENT_TYPE]
+
+
+def _pick(source: dict, keys: tuple[str, ...]) -> dict:
+    """Copy the given keys, leaving out missing and null ones."""
+    return {key: source[key] for key in keys if source.get(key) is not None}
+
+
+def _slim_player(mp: dict) -> dict:
+    """Keep only the match player fields transform_match_data reads."""
+    slim = _pick(mp, ("team", "role", "kills", "deaths", "assists", "minionsKilled", "gold"))
+    player = mp.get("player")
+    if player is not None:
+        slim["player"] = _pick(player, ("uuid", "name"))
+    hero = mp.get("hero")
+    if hero is not None:
+        slim["hero"] = _pick(hero, ("name",))
+    hero_data = mp.get("heroData")
+    if hero_data is not None:
+        slim["heroData"] = _pick(hero_data, ("name", "displayName", "icon"))
+    rating = mp.get("rating")
+    if rating is not None:
+        slim["rating"] = _pick(rating, ("points", "newPoints"))
+    return slim
+
+
+def slim_match_payload(match_data: dict) -> dict:
+    """
+    Drop every field transform_match_data never reads.
+
+    Detailed queries add per-player damage, wards, items, perks and rank data
+    that the notification path ignores; this removes them. Null fields are
+    dropped too (the compact encoding cannot tell them from missing ones),
+    so both encodings fall back to transform_match_data's defaults alike.
+
+    Args:
+        match_data: Raw match data from GraphQL API
+
+    Returns:
+        New dict with the same shape, containing only the fields that are read
+    """
+    slim = _pick(match_data, ("uuid", "id", "duration", "endTime", "gameMode", "region", "winningTeam"))
+    players = match_data.get("matchPlayers")
+    if players is not None:
+        slim["matchPlayers"] = [_slim_player(mp) for mp in players]
+    return slim
+
+
+class _StringTable:
+    """Assigns each distinct string an index, in first-seen order."""
+
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def ref(self, value: Optional[str]) -> Optional[int]:
+        """Get the table index for a string (None passes through)."""
+        if value is None:
+            return None
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+
+def _to_compact(match_data: dict) -> list:
+    """Convert a match dict to the positional, string-interned layout."""
+    table = _StringTable()
+    players = []
+    for mp in match_data.get("matchPlayers") or []:
+        player = mp.get("player") or {}
+        hero = mp.get("hero") or {}
+        hero_data = mp.get("heroData") or {}
+        rating = mp.get("rating") or {}
+        players.append([
+            player.get("uuid"),
+            player.get("name"),
+            table.ref(hero.get("name")),
+            table.ref(hero_data.get("name")),
+            table.ref(hero_data.get("displayName")),
+            hero_data.get("icon"),
+            table.ref(mp.get("team")),
+            table.ref(mp.get("role")),
+            mp.get("kills"),
+            mp.get("deaths"),
+            mp.get("assists"),
+            mp.get("minionsKilled"),
+            mp.get("gold"),
+            rating.get("points"),
+            rating.get("newPoints"),
+            # Which nested objects were present (bit 0 player, 1 hero, 2 heroData, 3 rating)
+            sum(1 << bit for bit, key in enumerate(("player", "hero", "heroData", "rating"))
+                if mp.get(key) is not None),
+        ])
+    header = [
+        match_data.get("uuid"),
+        match_data.get("id"),
+        match_data.get("duration"),
+        match_data.get("endTime"),
+        table.ref(match_data.get("gameMode")),
+        table.ref(match_data.get("region")),
+        table.ref(match_data.get("winningTeam")),
+    ]
+    return [COMPACT_FORMAT_VERSION, table.strings, header, players]
+
+
+def _put(target: dict, key: str, value: Any) -> None:
+    """Set a key unless the value is None (absent keys fall back to transform defaults)."""
+    if value is not None:
+        target[key] = value
+
+
+def _from_compact(data: list) -> dict:
+    """Rebuild a GraphQL-shaped match dict from the positional layout."""
+    version, strings, header, players = data
+    if version != COMPACT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported compact match format version: {version}")
+    # Interned so every payload shares one copy of each hero name and enum value
+    strings = [sys.intern(s) for s in strings]
+
+    def lookup(index: Optional[int]) -> Optional[str]:
+        return None if index is None else strings[index]
+
+    uuid, match_id, duration, end_time, game_mode, region, winning_team = header
+    match: dict = {}
+    _put(match, "uuid", uuid)
+    _put(match, "id", match_id)
+    _put(match, "duration", duration)
+    _put(match, "endTime", end_time)
+    _put(match, "gameMode", lookup(game_mode))
+    _put(match, "region", lookup(region))
+    _put(match, "winningTeam", lookup(winning_team))
+
+    match_players = []
+    for (player_uuid, name, hero_name, data_name, display_name, icon, team, role,
+         kills, deaths, assists, minions_killed, gold, points, new_points, present) in players:
+        mp: dict = {}
+        if present & 1:
+            mp["player"] = {}
+            _put(mp["player"], "uuid", player_uuid)
+            _put(mp["player"], "name", name)
+        if present & 2:
+            mp["hero"] = {}
+            _put(mp["hero"], "name", lookup(hero_name))
+        if present & 4:
+            mp["heroData"] = {}
+            _put(mp["heroData"], "name", lookup(data_name))
+            _put(mp["heroData"], "displayName", lookup(display_name))
+            _put(mp["heroData"], "icon", icon)
+        if present & 8:
+            mp["rating"] = {}
+            _put(mp["rating"], "points", points)
+            _put(mp["rating"], "newPoints", new_points)
+        _put(mp, "team", lookup(team))
+        _put(mp, "role", lookup(role))
+        _put(mp, "kills", kills)
+        _put(mp, "deaths", deaths)
+        _put(mp, "assists", assists)
+        _put(mp, "minionsKilled", minions_killed)
+        _put(mp, "gold", gold)
+        match_players.append(mp)
+    match["matchPlayers"] = match_players
+    return match
+
+
+def encode_match(match_data: dict, content_type: str = JSON_CONTENT_TYPE) -> bytes:
+    """
+    Encode a raw match payload for POSTing to a bot.
+
+    Args:
+        match_data: Raw match data from GraphQL API
+        content_type: JSON_CONTENT_TYPE or MSGPACK_CONTENT_TYPE
+
+    Returns:
+        Encoded request body
+    """
+    if content_type == MSGPACK_CONTENT_TYPE:
+        if msgpack is None:
+            raise ValueError("msgpack is not installed")
+        return msgpack.packb(_to_compact(match_data), use_bin_type=True)
+    if content_type == JSON_CONTENT_TYPE:
+        return json.dumps(slim_match_payload(match_data), separators=(",", ":")).encode()
+    raise ValueError(f"Unsupported content type: {content_type}")
+
+
+def decode_match(body: bytes, content_type: str = JSON_CONTENT_TYPE) -> Any:
+    """
+    Decode a match payload received from a cron worker.
+
+    Args:
+        body: Request body
+        content_type: Request Content-Type (without parameters)
+
+    Returns:
+        Match dict in the GraphQL shape (JSON bodies are returned as parsed,
+        so callers should still validate the result)
+
+    Raises:
+        ValueError: If the body cannot be decoded or the content type is unsupported
+    """
+    if content_type == MSGPACK_CONTENT_TYPE:
+        if msgpack is None:
+            raise ValueError("msgpack is not installed")
+        try:
+            data = msgpack.unpackb(body, raw=False)
+            return _from_compact(data)
+        except (ValueError, TypeError, IndexError, msgpack.ExtraData, msgpack.FormatError,
+                msgpack.StackError) as e:
+            raise ValueError(f"Invalid msgpack match payload: {e}") from e
+    if content_type == JSON_CONTENT_TYPE:
+        return json.loads(body)
+    raise ValueError(f"Unsupported content type: {content_type}")
@@ -0,0 +1,13 @@
+"""Start the bot: python bots/belica-bot
+
+Prefer this over running bot.py directly. The scoreboard render workers are
+spawned processes, and each one re-imports the script it was started from;
+this entry point imports nothing at module level, so workers skip loading
+the bot (discord.py, the database layer) they never use.
+"""
+if __name__ == "__main__":
+    import asyncio
+
+    from bot import main
+
+    asyncio.run(main())
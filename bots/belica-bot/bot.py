@@ -2,15 +2,24 @@
 import asyncio
 import logging
 import os
+from pathlib import Path
 import discord
 from discord.ext import commands
 
 from config import Config
 from predecessor_api import PredecessorAPI, HeroRegistry, HeroService, MatchService
+from data import ConfigChangeListener, Database
 from services.channel_config_db import ChannelConfig
 from services.profile_subscription_db import ProfileSubscription
 from services.http_server import HTTPServer
+from services.send_scheduler import SendScheduler, parse_rate_limit
+from services.emoji_index import EmojiIndex
 from services.match_formatter import ScoreboardButton
+from services.icon_cache import configure_icon_cache
+from services.image_encoding import ImageEncoder
+from services.render_executor import RenderExecutor
+from services.scoreboard_cache import DEFAULT_CACHE_DIR, ScoreboardCache
+from services.scoreboard_prerender import ScoreboardClickStats, ScoreboardPrerenderer
 
 # Configure logging
 logging.basicConfig(
@@ -39,17 +48,83 @@ class BelicaBot(commands.Bot):
             oauth_token_url=Config.PRED_GG_OAUTH_API_URL or None,
             client_id=Config.PRED_GG_CLIENT_ID or None,
             client_secret=Config.PRED_GG_CLIENT_SECRET or None,
+            compress_requests_over=Config.PRED_GG_COMPRESS_REQUESTS_OVER,
         )
         self.hero_registry = HeroRegistry()
         self.hero_service = HeroService(self.api)
         self.match_service = MatchService(self.api, self.hero_registry)
-        self.channel_config = ChannelConfig()
-        self.profile_subscription = ProfileSubscription()
+        # Single connection pool shared by every DB-backed service in the bot
+        self.db = Database()
+        self.channel_config = ChannelConfig(db=self.db, cache_ttl=Config.CONFIG_CACHE_TTL_SECONDS)
+        self.profile_subscription = ProfileSubscription(
+            db=self.db, cache_ttl=Config.CONFIG_CACHE_TTL_SECONDS
+        )
+        # Invalidates the channel/subscription caches when the tables change
+        self.config_listener = ConfigChangeListener(self.db)
+        self.config_listener.add_callback(self.channel_config.handle_change)
+        self.config_listener.add_callback(self.profile_subscription.handle_change)
+        # Every outbound match post and scoreboard edit goes through this scheduler
+        self.send_scheduler = SendScheduler(
+            channel_limit=parse_rate_limit(Config.SEND_CHANNEL_RATE_LIMIT),
+            guild_limit=parse_rate_limit(Config.SEND_GUILD_RATE_LIMIT),
+            global_limit=parse_rate_limit(Config.SEND_GLOBAL_RATE_LIMIT),
+            max_in_flight=Config.SEND_MAX_IN_FLIGHT,
+        )
         self.application_emojis: list[discord.Emoji] = []  # Cache application emojis
+        # Name -> emoji string lookups for the hero/role emoji mappers
+        self.emoji_index = EmojiIndex()
+        self.scoreboard_scale = Config.SCOREBOARD_SCALE
+        configure_icon_cache(Config.ICON_CACHE_MAX_MB * 1024 * 1024)
+        # Scoreboard images are rendered here, never on the event loop
+        self.render_executor = RenderExecutor(
+            scale=Config.SCOREBOARD_SCALE,
+            workers=Config.RENDER_WORKERS,
+            use_processes=Config.RENDER_USE_PROCESSES,
+            max_pending=Config.RENDER_MAX_PENDING,
+            timeout=Config.RENDER_TIMEOUT_SECONDS,
+            icon_cache_max_bytes=Config.ICON_CACHE_MAX_MB * 1024 * 1024,
+            encoder=ImageEncoder(
+                Config.SCOREBOARD_ENCODING,
+                compress_level=Config.SCOREBOARD_PNG_COMPRESS_LEVEL,
+                budget_ms=Config.SCOREBOARD_ENCODE_BUDGET_MS,
+            ),
+        )
+        self._render_start_task: asyncio.Task | None = None
+        # Rendered scoreboards, reused across clicks, guilds and restarts
+        self.scoreboard_cache: ScoreboardCache | None = None
+        if Config.SCOREBOARD_CACHE_MAX_MB > 0:
+            self.scoreboard_cache = ScoreboardCache(
+                Path(Config.SCOREBOARD_CACHE_DIR) if Config.SCOREBOARD_CACHE_DIR else DEFAULT_CACHE_DIR,
+                max_bytes=Config.SCOREBOARD_CACHE_MAX_MB * 1024 * 1024,
+            )
+        # Per-guild click rates decide which guilds scoreboards are pre-rendered for
+        self.scoreboard_clicks = ScoreboardClickStats(
+            min_posts=Config.SCOREBOARD_PRERENDER_MIN_POSTS,
+            min_click_rate=Config.SCOREBOARD_PRERENDER_MIN_CLICK_RATE,
+        )
+        self.scoreboard_prerenderer: ScoreboardPrerenderer | None = None
+        if Config.SCOREBOARD_PRERENDER and self.scoreboard_cache:
+            self.scoreboard_prerenderer = ScoreboardPrerenderer(
+                self.match_service,
+                self.render_executor,
+                self.scoreboard_cache,
+                scale=Config.SCOREBOARD_SCALE,
+                concurrency=Config.SCOREBOARD_PRERENDER_CONCURRENCY,
+            )
         self.http_server: HTTPServer | None = None
     
     async def setup_hook(self) -> None:
         """Called when the bot is starting up."""
+        await self.db.connect()
+        self.send_scheduler.start()
+        # Load the player -> guild routing index used when posting matches
+        await self.profile_subscription.load_routes()
+        try:
+            await self.config_listener.start()
+        except Exception as e:
+            # Caches still expire after CONFIG_CACHE_TTL_SECONDS without notifications
+            logger.warning(f"Failed to listen for configuration changes: {e}")
+
         # Populate hero registry from API
         logger.info("Populating hero registry...")
         try:
@@ -59,6 +134,9 @@ class BelicaBot(commands.Bot):
         except Exception as e:
             logger.warning(f"Failed to populate hero registry: {e}")
         
+        # Start render workers in the background; each warms its icon cache, which takes a while
+        self._render_start_task = asyncio.create_task(self._start_render_executor())
+        
         # Load cogs
         await self.load_extension("cogs.general")
         await self.load_extension("cogs.matches")
@@ -106,6 +184,7 @@ class BelicaBot(commands.Bot):
         except Exception as e:
             logger.debug(f"Could not fetch application emojis (may not be available): {e}")
             self.application_emojis = []
+        self.rebuild_emoji_index()
         
         # Set bot presence
         activity = discord.Activity(
@@ -116,9 +195,39 @@ class BelicaBot(commands.Bot):
         
         # Start HTTP server for receiving match notifications
         http_port = int(os.getenv("HTTP_PORT", "8080"))
-        self.http_server = HTTPServer(self, port=http_port)
+        self.http_server = HTTPServer(
+            self,
+            port=http_port,
+            send_concurrency=Config.MATCH_POST_CONCURRENCY,
+            send_timeout=Config.MATCH_POST_SEND_TIMEOUT,
+            delivery_workers=Config.MATCH_DELIVERY_WORKERS,
+            max_queue_size=Config.MATCH_QUEUE_MAX_SIZE,
+            drain_timeout=Config.MATCH_DELIVERY_DRAIN_SECONDS,
+            coalesce_window=Config.MATCH_COALESCE_WINDOW_SECONDS,
+        )
         await self.http_server.start()
 
+    def rebuild_emoji_index(self) -> None:
+        """Rebuild the bot-wide emoji index from application and guild emojis."""
+        self.emoji_index.rebuild(self.application_emojis, self.emojis)
+
+    async def on_guild_emojis_update(
+        self,
+        guild: discord.Guild,
+        before: list[discord.Emoji],
+        after: list[discord.Emoji],
+    ) -> None:
+        """Keep the emoji index current when a guild's emojis change."""
+        self.rebuild_emoji_index()
+
+    async def on_guild_join(self, guild: discord.Guild) -> None:
+        """Index the emojis of a newly joined guild."""
+        self.rebuild_emoji_index()
+
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        """Drop the emojis of a guild the bot left."""
+        self.rebuild_emoji_index()
+
     async def is_target_channel(self, channel: discord.TextChannel) -> bool:
         """
         Check if a channel is configured as a target channel for posting.
@@ -133,14 +242,28 @@ class BelicaBot(commands.Bot):
             return False
         return await self.channel_config.is_target_channel(channel.guild.id, channel.id)
     
+    async def _start_render_executor(self) -> None:
+        """Start the scoreboard render pool (clicks before it is ready wait for the workers)."""
+        try:
+            await self.render_executor.start()
+        except Exception as e:
+            logger.warning(f"Failed to start render executor: {e}")
+    
     async def close(self) -> None:
         """Clean up resources when shutting down."""
         if self.http_server:
             await self.http_server.stop()
+        # After the HTTP server so queued matches can drain through it
+        await self.send_scheduler.stop()
+        if self.scoreboard_prerenderer:
+            await self.scoreboard_prerenderer.stop()
+        await self.config_listener.stop()
+        self.render_executor.shutdown()
         if self.profile_subscription:
             await self.profile_subscription.close()
         if self.channel_config:
             await self.channel_config.close()
+        await self.db.close()
         await self.api.close()
         await super().close()
 
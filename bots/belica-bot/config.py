@@ -20,6 +20,54 @@ class Config:
     PRED_GG_OAUTH_API_URL: str = os.getenv("PRED_GG_OAUTH_API_URL", "")
     PRED_GG_CLIENT_ID: str = os.getenv("PRED_GG_CLIENT_ID", "")
     PRED_GG_CLIENT_SECRET: str = os.getenv("PRED_GG_CLIENT_SECRET", "")
+    # Gzip GraphQL request bodies of at least this many bytes (0 = off)
+    PRED_GG_COMPRESS_REQUESTS_OVER: int = int(os.getenv("PRED_GG_COMPRESS_REQUESTS_OVER", "0"))
+
+    # Seconds cached channel/subscription reads stay valid without a change notification
+    CONFIG_CACHE_TTL_SECONDS: float = float(os.getenv("CONFIG_CACHE_TTL_SECONDS", "300"))
+
+    # Match posting: channel sends in flight per match, and per-send timeout (seconds)
+    MATCH_POST_CONCURRENCY: int = int(os.getenv("MATCH_POST_CONCURRENCY", "5"))
+    MATCH_POST_SEND_TIMEOUT: float = float(os.getenv("MATCH_POST_SEND_TIMEOUT", "15"))
+
+    # Delivery queue behind POST /api/matches. More than one worker can post a
+    # player's matches out of order. The queue is in memory and matches are
+    # acknowledged (and marked notified by the cron) before they are posted, so
+    # anything still queued after the drain timeout at shutdown, or at a crash,
+    # is never posted; each dropped match UUID is logged.
+    MATCH_DELIVERY_WORKERS: int = int(os.getenv("MATCH_DELIVERY_WORKERS", "1"))
+    MATCH_QUEUE_MAX_SIZE: int = int(os.getenv("MATCH_QUEUE_MAX_SIZE", "1000"))
+    MATCH_DELIVERY_DRAIN_SECONDS: float = float(os.getenv("MATCH_DELIVERY_DRAIN_SECONDS", "30"))
+    # Seconds to buffer matches per channel into one multi-embed message (0 = off)
+    MATCH_COALESCE_WINDOW_SECONDS: float = float(os.getenv("MATCH_COALESCE_WINDOW_SECONDS", "0"))
+
+    # Proactive Discord rate limits for outbound sends/edits ("requests/seconds")
+    SEND_CHANNEL_RATE_LIMIT: str = os.getenv("SEND_CHANNEL_RATE_LIMIT", "5/5")
+    SEND_GUILD_RATE_LIMIT: str = os.getenv("SEND_GUILD_RATE_LIMIT", "10/5")
+    SEND_GLOBAL_RATE_LIMIT: str = os.getenv("SEND_GLOBAL_RATE_LIMIT", "40/1")
+    SEND_MAX_IN_FLIGHT: int = int(os.getenv("SEND_MAX_IN_FLIGHT", "10"))
+
+    # Scoreboard rendering: image scale (1.5 = 1530px wide) and resized icon cache budget (MiB)
+    SCOREBOARD_SCALE: float = float(os.getenv("SCOREBOARD_SCALE", "1.5"))
+    ICON_CACHE_MAX_MB: int = int(os.getenv("ICON_CACHE_MAX_MB", "32"))
+    # Render pool: parallel renders, worker processes (false = threads), queue bound, timeout (seconds)
+    RENDER_WORKERS: int = int(os.getenv("RENDER_WORKERS", "3"))
+    RENDER_USE_PROCESSES: bool = os.getenv("RENDER_USE_PROCESSES", "true").lower() == "true"
+    RENDER_MAX_PENDING: int = int(os.getenv("RENDER_MAX_PENDING", "8"))
+    RENDER_TIMEOUT_SECONDS: float = float(os.getenv("RENDER_TIMEOUT_SECONDS", "30"))
+    # Scoreboard output: png, png-palette (256 colors), webp (lossless) or auto (smallest within the budget)
+    SCOREBOARD_ENCODING: str = os.getenv("SCOREBOARD_ENCODING", "png").lower()
+    SCOREBOARD_PNG_COMPRESS_LEVEL: int = int(os.getenv("SCOREBOARD_PNG_COMPRESS_LEVEL", "6"))
+    SCOREBOARD_ENCODE_BUDGET_MS: float = float(os.getenv("SCOREBOARD_ENCODE_BUDGET_MS", "150"))
+    # Rendered scoreboard cache on disk (empty dir = bots/belica-bot/cache/scoreboards, 0 MiB = off)
+    SCOREBOARD_CACHE_DIR: str = os.getenv("SCOREBOARD_CACHE_DIR", "")
+    SCOREBOARD_CACHE_MAX_MB: int = int(os.getenv("SCOREBOARD_CACHE_MAX_MB", "200"))
+    # Render scoreboards into the cache when a match is posted, for guilds that click them
+    SCOREBOARD_PRERENDER: bool = os.getenv("SCOREBOARD_PRERENDER", "false").lower() == "true"
+    SCOREBOARD_PRERENDER_CONCURRENCY: int = int(os.getenv("SCOREBOARD_PRERENDER_CONCURRENCY", "1"))
+    # Guilds with at least MIN_POSTS posted matches and fewer clicks per match than this are skipped
+    SCOREBOARD_PRERENDER_MIN_CLICK_RATE: float = float(os.getenv("SCOREBOARD_PRERENDER_MIN_CLICK_RATE", "0.02"))
+    SCOREBOARD_PRERENDER_MIN_POSTS: int = int(os.getenv("SCOREBOARD_PRERENDER_MIN_POSTS", "20"))
     
     @classmethod
     def validate(cls) -> None:
@@ -0,0 +1,393 @@
+"""Benchmark scoreboard rendering stage by stage.
+
+Renders the cached detailed match fixture plus synthetic variants at each
+scale and reports font load, icon load/resize, sprite and template build,
+per-section drawing and per-encoding encode times, peak memory, and
+throughput of the render pool. Results are JSON so runs can be compared:
+
+    python scripts/benchmark_leaderboard_image.py --output results.json
+    python scripts/benchmark_leaderboard_image.py --save-baseline benchmarks/baseline.json
+    python scripts/benchmark_leaderboard_image.py --baseline benchmarks/baseline.json
+
+With --baseline, exits with status 1 if any timing, size or memory figure
+is worse than the baseline by more than --tolerance. Baselines are only
+meaningful on the machine (or CI runner type) that recorded them.
+"""
+import argparse
+import asyncio
+import copy
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows: memory figures are omitted
+    resource = None
+
+import PIL
+from PIL import features
+
+# Add paths for imports
+SCRIPT_DIR = Path(__file__).parent
+BELICA_BOT_ROOT = SCRIPT_DIR.parent
+sys.path.insert(0, str(BELICA_BOT_ROOT))
+
+from services.icon_atlas import IconAtlas
+from services.icon_cache import DEFAULT_ICONS_DIR, IconCache
+from services.image_encoding import ImageEncoder
+from services.leaderboard_image import LeaderboardImageGenerator, _load_font_set, warm_icon_cache
+from services.render_executor import RenderExecutor
+
+FIXTURE_PATH = BELICA_BOT_ROOT / "fixtures" / "detailed_match.json"
+
+# Metric name suffixes, and whether a larger value is worse
+_HIGHER_IS_WORSE = {"_ms": True, "_bytes": True, "_mb": True, "_per_s": False}
+
+# Timings below this many milliseconds are too noisy to flag
+_MIN_DELTA_MS = 1.0
+
+
+def _median_ms(samples: list[float]) -> float:
+    return round(statistics.median(samples) * 1000, 2)
+
+
+def _peak_rss_mb(who: int) -> Optional[float]:
+    """Peak resident set size of this process (or its reaped children) in MiB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+# --- Synthetic variants ---------------------------------------------------
+
+def _display_name(slug: str) -> str:
+    """A display name that icon_slug() maps back to the given file slug."""
+    return slug.replace("-", " ").title()
+
+
+def _with_builds(match_data: dict, item_names: list[str], augment_names: list[str]) -> dict:
+    """Give every player a crest, six items, a potion, a ward and three augments."""
+    data = copy.deepcopy(match_data)
+    for i, player in enumerate(data["match"]["matchPlayers"]):
+        def item(k: int) -> str:
+            return item_names[(i * 9 + k) % len(item_names)]
+        player["inventoryItemData"] = [
+            {"displayName": item(0), "slotType": "CREST"},
+            *({"displayName": item(k), "slotType": "PASSIVE"} for k in range(1, 7)),
+            {"displayName": item(7), "slotType": "ACTIVE"},
+            {"displayName": item(8), "slotType": "TRINKET"},
+        ]
+        player["perkData"] = [
+            {"displayName": augment_names[(i * 3 + k) % len(augment_names)], "slot": slot}
+            for k, slot in enumerate(("HERO_SPECIFIC_1", "COMMON_1", "COMMON_2"))
+        ]
+    return data
+
+
+def build_variants(match_data: dict, icon_cache: IconCache) -> dict[str, dict]:
+    """
+    The fixture plus synthetic variants that exercise other rendering paths.
+
+    Args:
+        match_data: Detailed match fixture ({"match": {...}})
+        icon_cache: Cache whose icons directory supplies real item/augment names
+
+    Returns:
+        Variant name -> match data
+    """
+    items = [_display_name(slug) for slug in icon_cache.slugs("item")]
+    augments = [_display_name(slug) for slug in icon_cache.slugs("augment")]
+
+    # The fixture has no builds; this draws every item and augment slot
+    full_build = _with_builds(match_data, items, augments)
+
+    # Heroes, items and augments that have no icon file (e.g. just released)
+    missing_icons = _with_builds(match_data, [f"Unreleased Item {n}" for n in range(9)], ["Unreleased Augment"])
+    for player in missing_icons["match"]["matchPlayers"]:
+        player["heroData"] = {"name": "Unreleased", "displayName": "Unreleased Hero"}
+
+    # Names long enough to be truncated, with wide and non-Latin glyphs
+    long_names = copy.deepcopy(full_build)
+    for i, player in enumerate(long_names["match"]["matchPlayers"]):
+        player["player"]["name"] = f"WWWWWWWWWWWWWWWWWWWWWWWW_{i}_ÄÖÜ_名前が長いプレイヤー"
+
+    return {
+        "fixture": match_data,
+        "full_build": full_build,
+        "missing_icons": missing_icons,
+        "long_names": long_names,
+    }
+
+
+# --- Stages ---------------------------------------------------------------
+
+def bench_setup(scale: float) -> dict[str, Any]:
+    """Time the one-off work a process does before its first render at a scale."""
+    generator = LeaderboardImageGenerator(scale=scale)
+    font_sizes = (
+        int(generator.BASE_FONT_LARGE * scale),
+        int(generator.BASE_FONT_MEDIUM * scale),
+        int(generator.BASE_FONT_SMALL * scale),
+    )
+    _load_font_set.cache_clear()
+    started = time.perf_counter()
+    _load_font_set(*font_sizes)
+    font_load = time.perf_counter() - started
+
+    # Decode and resize every icon from its PNG (what happens without an atlas)
+    png_cache = IconCache(DEFAULT_ICONS_DIR, max_bytes=sys.maxsize)
+    started = time.perf_counter()
+    icon_count = png_cache.warm(generator.icon_sizes())
+    icon_load = time.perf_counter() - started
+
+    result: dict[str, Any] = {
+        "font_load_ms": round(font_load * 1000, 2),
+        "icon_load_png_ms": round(icon_load * 1000, 2),
+        "icons": icon_count,
+        "icon_cache_mb": round(png_cache.stats()["bytes"] / (1024 * 1024), 1),
+        "icon_load_atlas_ms": None,
+    }
+
+    started = time.perf_counter()
+    atlas = IconAtlas.open(scale, DEFAULT_ICONS_DIR / "atlas")
+    if atlas is not None:
+        atlas_cache = IconCache(DEFAULT_ICONS_DIR, max_bytes=sys.maxsize)
+        atlas_cache.attach_atlas(atlas)
+        atlas_cache.warm(generator.icon_sizes())
+        result["icon_load_atlas_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+    warm_icon_cache(scale)  # The shared cache renders below use (atlas if built)
+    started = time.perf_counter()
+    generator.warm_sprites()
+    result["sprite_build_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+    started = time.perf_counter()
+    generator._render_template(5, 5)
+    result["template_build_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return result
+
+
+def _instrument(generator: LeaderboardImageGenerator, timings: dict[str, float]) -> None:
+    """Wrap the generator's section methods so each call adds to timings[section]."""
+    def timed(name: Callable[..., str], method: Callable) -> Callable:
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                key = name(*args)
+                timings[key] = timings.get(key, 0.0) + time.perf_counter() - started
+        return wrapper
+
+    generator._get_template = timed(lambda *a: "template", generator._get_template)
+    generator._draw_column_headers = timed(lambda *a: "column_headers", generator._draw_column_headers)
+    # Called as (img, draw, y, "VICTORY"/"DEFEAT", ...)
+    generator._draw_team_section = timed(lambda *a: f"{a[3].lower()}_section", generator._draw_team_section)
+
+
+def bench_render(
+    generator: LeaderboardImageGenerator,
+    match_data: dict,
+    repeat: int,
+    encoders: dict[str, ImageEncoder],
+    image_dir: Optional[Path] = None,
+    image_name: str = "",
+) -> dict[str, Any]:
+    """Time drawing (by section) and each encoding for one variant at one scale."""
+    timings: dict[str, float] = {}
+    _instrument(generator, timings)
+    image = generator.render(match_data)  # Warm-up: caches misses, templates, glyphs
+
+    samples: dict[str, list[float]] = {}
+    for _ in range(repeat):
+        timings.clear()
+        started = time.perf_counter()
+        image = generator.render(match_data)
+        total = time.perf_counter() - started
+        sections = dict(timings)
+        sections["other"] = total - sum(sections.values())
+        sections["draw_total"] = total
+        for name, seconds in sections.items():
+            samples.setdefault(name, []).append(seconds)
+
+    result: dict[str, Any] = {f"{name}_ms": _median_ms(values) for name, values in samples.items()}
+    for encoding, encoder in encoders.items():
+        encode_samples = []
+        for _ in range(repeat):
+            encoded = encoder.encode(image)
+            encode_samples.append(encoded.seconds)
+        result[f"encode_{encoding}_ms"] = _median_ms(encode_samples)
+        result[f"encode_{encoding}_bytes"] = len(encoded.data)
+        if image_dir is not None:
+            (image_dir / f"{image_name}_{encoding}.{encoded.extension}").write_bytes(encoded.data)
+    return result
+
+
+async def bench_parallel(
+    match_data: dict,
+    scale: float,
+    workers: int,
+    jobs: int,
+    use_processes: bool,
+) -> dict[str, Any]:
+    """Render jobs scoreboards through the render pool at once and measure throughput."""
+    executor = RenderExecutor(
+        scale=scale, workers=workers, use_processes=use_processes, max_pending=jobs, timeout=600
+    )
+    started = time.perf_counter()
+    await executor.start()
+    startup = time.perf_counter() - started
+
+    started = time.perf_counter()
+    await asyncio.gather(*(executor.render(match_data) for _ in range(jobs)))
+    wall = time.perf_counter() - started
+    stats = executor.stats()
+    executor.shutdown(wait=True)  # Reap the workers so their peak memory is reported
+    return {
+        "mode": stats["mode"],
+        "workers": workers,
+        "jobs": jobs,
+        "startup_ms": round(startup * 1000, 1),
+        "wall_ms": round(wall * 1000, 1),
+        "renders_per_s": round(jobs / wall, 2),
+        "latency_p95_ms": stats["render"]["p95_ms"],
+        "worker_peak_rss_mb": _peak_rss_mb(resource.RUSAGE_CHILDREN) if resource and stats["mode"] == "process" else None,
+    }
+
+
+# --- Baseline comparison --------------------------------------------------
+
+def _flatten(results: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    """Numeric leaves of the results as {"dotted.path": value}."""
+    flat = {}
+    for key, value in results.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{path}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = value
+    return flat
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """
+    Find metrics that got worse than the baseline by more than the tolerance.
+
+    Args:
+        results: This run's results
+        baseline: A previous run's results
+        tolerance: Allowed relative change (0.25 = 25%)
+
+    Returns:
+        One description per regression
+    """
+    current = _flatten(results)
+    regressions = []
+    for path, old in _flatten(baseline).items():
+        if path.startswith("meta.") or path not in current:
+            continue
+        suffix = next((s for s in _HIGHER_IS_WORSE if path.endswith(s)), None)
+        if suffix is None or not old:
+            continue
+        new = current[path]
+        if _HIGHER_IS_WORSE[suffix]:
+            worse = new > old * (1 + tolerance) and not (suffix == "_ms" and new - old < _MIN_DELTA_MS)
+        else:
+            worse = new < old / (1 + tolerance)
+        if worse:
+            regressions.append(f"{path}: {old} -> {new} ({(new - old) / old:+.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", nargs="+", type=float, default=[1.0, 1.5, 2.0], help="Scales to render at")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed renders per variant and scale (median reported)")
+    parser.add_argument("--workers", type=int, default=3, help="Render pool workers for the throughput test")
+    parser.add_argument("--jobs", type=int, default=24, help="Renders submitted at once for the throughput test")
+    parser.add_argument("--threads", action="store_true", help="Use the thread pool instead of processes")
+    parser.add_argument("--skip-parallel", action="store_true", help="Skip the throughput test")
+    parser.add_argument("--images", type=Path, help="Also write every rendered variant to this directory")
+    parser.add_argument("--output", type=Path, help="Write results JSON here (default: stdout)")
+    parser.add_argument("--baseline", type=Path, help="Compare against this results file; exit 1 on regression")
+    parser.add_argument("--save-baseline", type=Path, help="Write results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression (default 0.25)")
+    args = parser.parse_args()
+
+    if not FIXTURE_PATH.exists():
+        print(f"Error: Fixture not found at {FIXTURE_PATH}")
+        print("Run fetch_detailed_match.py first to cache match data.")
+        sys.exit(1)
+    match_data = json.loads(FIXTURE_PATH.read_text())
+    if "match" not in match_data:
+        match_data = {"match": match_data}
+    if args.images:
+        args.images.mkdir(parents=True, exist_ok=True)
+
+    encodings = ["png", "png-palette"] + (["webp"] if features.check("webp") else [])
+    encoders = {encoding: ImageEncoder(encoding) for encoding in encodings}
+    variants = build_variants(match_data, IconCache(DEFAULT_ICONS_DIR))
+
+    results: dict[str, Any] = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pillow": PIL.__version__,
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "setup": {},
+        "render": {},
+    }
+
+    for scale in args.scales:
+        print(f"Scale {scale:g}: setup", file=sys.stderr)
+        results["setup"][f"{scale:g}"] = bench_setup(scale)
+        for name, variant in variants.items():
+            print(f"Scale {scale:g}: {name}", file=sys.stderr)
+            generator = LeaderboardImageGenerator(scale=scale)
+            generator.warm_sprites()
+            results["render"][f"{name}@{scale:g}"] = bench_render(
+                generator, variant, args.repeat, encoders, args.images, f"{name}_{scale:g}"
+            )
+
+    results["memory"] = {"peak_rss_mb": _peak_rss_mb(resource.RUSAGE_SELF) if resource else None}
+
+    if not args.skip_parallel:
+        scale = 1.5 if 1.5 in args.scales else args.scales[0]
+        print(f"Render pool: {args.jobs} renders on {args.workers} worker(s)", file=sys.stderr)
+        results["parallel"] = asyncio.run(
+            bench_parallel(variants["full_build"], scale, args.workers, args.jobs, not args.threads)
+        )
+
+    output = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        args.output.write_text(output + "\n")
+    else:
+        print(output)
+    if args.save_baseline:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.save_baseline.write_text(output + "\n")
+        print(f"Saved baseline to {args.save_baseline}", file=sys.stderr)
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.baseline}:", file=sys.stderr)
+            for regression in regressions:
+                print(f"  {regression}", file=sys.stderr)
+            sys.exit(1)
+        print(f"No regressions against {args.baseline}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Pack the scoreboard icons into one memory-mappable atlas per scale.
+
+Run after downloading or updating icons:
+
+    python scripts/build_icon_atlas.py            # scale from SCOREBOARD_SCALE (default 1.5)
+    python scripts/build_icon_atlas.py 1 1.5 2    # several scales
+    python scripts/build_icon_atlas.py --force    # rebuild even if the atlas is up to date
+
+Atlases whose icons have not changed since they were built are left alone.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add paths for imports
+SCRIPT_DIR = Path(__file__).parent
+BELICA_BOT_ROOT = SCRIPT_DIR.parent
+sys.path.insert(0, str(BELICA_BOT_ROOT))
+
+from config import Config
+from services.icon_atlas import IconAtlas, build_atlas
+from services.icon_cache import DEFAULT_ICONS_DIR, IconCache
+from services.leaderboard_image import LeaderboardImageGenerator
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "scales", nargs="*", type=float,
+        default=[Config.SCOREBOARD_SCALE],
+        help="Scale factors to build atlases for"
+    )
+    parser.add_argument("--icons-dir", type=Path, default=DEFAULT_ICONS_DIR, help="Icons directory")
+    parser.add_argument("--out-dir", type=Path, default=None, help="Atlas directory (default: <icons-dir>/atlas)")
+    parser.add_argument("--force", action="store_true", help="Rebuild atlases that are up to date")
+    args = parser.parse_args()
+
+    out_dir = args.out_dir or args.icons_dir / "atlas"
+
+    for scale in args.scales:
+        if not args.force and IconAtlas.open(scale, out_dir, args.icons_dir) is not None:
+            print(f"Scale {scale:g}: atlas in {out_dir} is up to date")
+            continue
+
+        # A fresh, unbounded cache so every icon is decoded from its PNG
+        icon_cache = IconCache(args.icons_dir, max_bytes=sys.maxsize)
+        sizes = LeaderboardImageGenerator(icons_dir=args.icons_dir, scale=scale).icon_sizes()
+        count = build_atlas(icon_cache, sizes, scale, out_dir)
+
+        atlas = IconAtlas.open(scale, out_dir, args.icons_dir)
+        if atlas is None or len(atlas) != count:
+            print(f"Error: atlas for scale {scale:g} could not be read back")
+            sys.exit(1)
+        print(f"Scale {scale:g}: packed {count} icons into {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
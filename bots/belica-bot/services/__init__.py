@@ -1,23 +1,33 @@
-"""Services for the Belica bot."""
-from .match_formatter import (
-    MatchMessageFormatter,
-    create_match_message,
-    MatchView,
-    ScoreboardButton,
-)
-from .channel_config_db import ChannelConfig
-from .profile_subscription_db import ProfileSubscription
-from .hero_emoji_mapper import HeroEmojiMapper
-from .role_emoji_mapper import RoleEmojiMapper
+"""Services for the Belica bot.
 
-__all__ = [
-    "MatchMessageFormatter",
-    "create_match_message",
-    "MatchView",
-    "ScoreboardButton",
-    "ChannelConfig",
-    "ProfileSubscription",
-    "HeroEmojiMapper",
-    "RoleEmojiMapper",
-]
+The re-exports below are imported on first access, so render worker
+processes that import a single service module do not load discord.py and
+the database layer through this package.
+"""
+import importlib
+from typing import Any
 
+# Re-exported name -> module it lives in
+_EXPORTS = {
+    "MatchMessageFormatter": ".match_formatter",
+    "SharedMatchRender": ".match_formatter",
+    "create_match_message": ".match_formatter",
+    "MatchView": ".match_formatter",
+    "CoalescedMatchView": ".match_formatter",
+    "ScoreboardButton": ".match_formatter",
+    "ChannelConfig": ".channel_config_db",
+    "ProfileSubscription": ".profile_subscription_db",
+    "SubscriptionRouter": ".subscription_router",
+    "HeroEmojiMapper": ".hero_emoji_mapper",
+    "RoleEmojiMapper": ".role_emoji_mapper",
+    "EmojiIndex": ".emoji_index",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
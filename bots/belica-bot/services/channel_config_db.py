@@ -2,7 +2,8 @@
 import logging
 from typing import Optional
 
-from data import Database, TargetChannelRepository
+from data import ConfigChange, Database, TargetChannelRepository
+from services.config_cache import ConfigCache
 
 logger = logging.getLogger("belica.channel_config")
 
@@ -10,16 +11,19 @@ logger = logging.getLogger("belica.channel_config")
 class ChannelConfig:
     """Manages channel configurations per guild (server) using database."""
     
-    def __init__(self, db: Optional[Database] = None) -> None:
+    def __init__(self, db: Optional[Database] = None, cache_ttl: float = 300.0) -> None:
         """
         Initialize the channel configuration manager.
         
         Args:
-            db: Optional Database instance. If None, creates a new one.
+            db: Optional shared Database instance. If None, creates (and owns) a new one.
+            cache_ttl: Seconds cached reads stay valid without a change notification
         """
         self.db = db
+        self._owns_db = db is None
         self._repo: Optional[TargetChannelRepository] = None
         self._db_initialized = False
+        self.cache = ConfigCache(ttl=cache_ttl)
     
     async def _ensure_db(self) -> None:
         """Ensure database is connected and repository is initialized."""
@@ -28,7 +32,7 @@ class ChannelConfig:
                 from data import Database
                 self.db = Database()
                 await self.db.connect()
-            elif not self.db._pool:
+            elif not self.db.is_connected:
                 await self.db.connect()
             
             self._repo = TargetChannelRepository(self.db)
@@ -46,7 +50,9 @@ class ChannelConfig:
             True if channel was added, False if it already exists
         """
         await self._ensure_db()
-        return await self._repo.add_channel(guild_id, channel_id)
+        was_added = await self._repo.add_channel(guild_id, channel_id)
+        self.cache.invalidate_guild(guild_id)
+        return was_added
     
     async def remove_channel(self, guild_id: int, channel_id: int) -> bool:
         """
@@ -60,7 +66,9 @@ class ChannelConfig:
             True if channel was removed, False if it wasn't configured
         """
         await self._ensure_db()
-        return await self._repo.remove_channel(guild_id, channel_id)
+        was_removed = await self._repo.remove_channel(guild_id, channel_id)
+        self.cache.invalidate_guild(guild_id)
+        return was_removed
     
     async def get_channels(self, guild_id: int) -> list[int]:
         """
@@ -73,7 +81,10 @@ class ChannelConfig:
             List of channel IDs, empty list if none configured
         """
         await self._ensure_db()
-        return await self._repo.get_channels(guild_id)
+        channels = await self.cache.get(
+            ("channels", guild_id), lambda: self._repo.get_channels(guild_id)
+        )
+        return list(channels)
     
     async def is_target_channel(self, guild_id: int, channel_id: int) -> bool:
         """
@@ -86,8 +97,7 @@ class ChannelConfig:
         Returns:
             True if the channel is configured, False otherwise
         """
-        await self._ensure_db()
-        return await self._repo.is_target_channel(guild_id, channel_id)
+        return channel_id in await self.get_channels(guild_id)
     
     async def clear_guild(self, guild_id: int) -> int:
         """
@@ -100,7 +110,9 @@ class ChannelConfig:
             Number of channels that were removed
         """
         await self._ensure_db()
-        return await self._repo.clear_guild(guild_id)
+        count = await self._repo.clear_guild(guild_id)
+        self.cache.invalidate_guild(guild_id)
+        return count
     
     async def get_all_target_channels(self) -> list[tuple[int, int]]:
         """
@@ -110,10 +122,23 @@ class ChannelConfig:
             List of (guild_id, channel_id) tuples
         """
         await self._ensure_db()
-        return await self._repo.get_all_target_channels()
+        channels = await self.cache.get(("all_channels",), self._repo.get_all_target_channels)
+        return list(channels)
+
+    async def handle_change(self, change: Optional[ConfigChange]) -> None:
+        """
+        Invalidate cached reads after a database change notification.
+
+        Args:
+            change: The row change, or None if notifications may have been missed
+        """
+        if change is None:
+            self.cache.clear()
+        elif change.table == "target_channels":
+            for guild_id in change.guild_ids:
+                self.cache.invalidate_guild(guild_id)
     
     async def close(self) -> None:
         """Close database connection if we own it."""
-        if self.db and self._db_initialized:
+        if self.db and self._db_initialized and self._owns_db:
             await self.db.close()
-
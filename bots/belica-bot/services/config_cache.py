@@ -0,0 +1,64 @@
+"""Read-through TTL cache for guild configuration reads."""
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class ConfigCache:
+    """Caches the results of configuration reads until invalidated or expired.
+
+    Keys are tuples whose second element (if any) is the guild ID, so a change
+    in one guild only drops that guild's entries. Invalidation is driven by the
+    database change listener; the TTL is a safety net for missed notifications.
+    """
+
+    def __init__(self, ttl: float = 300.0) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid without an invalidation (0 disables caching)
+        """
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        # Bumped on every invalidation so a load racing with a change is not stored
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: tuple, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Get a cached value, loading it on a miss.
+
+        Args:
+            key: Cache key, e.g. ("channels", guild_id)
+            loader: Coroutine function that reads the value from the database
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        generation = self._generation
+        value = await loader()
+        if self.ttl > 0 and generation == self._generation:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+        return value
+
+    def invalidate_guild(self, guild_id: int) -> None:
+        """Drop every entry for a guild, plus cross-guild entries."""
+        self._generation += 1
+        for key in [k for k in self._entries if len(k) < 2 or k[1] == guild_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._generation += 1
+        self._entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        """Get entry count and hit/miss counters."""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses, "ttl": self.ttl}
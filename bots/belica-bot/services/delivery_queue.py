@@ -0,0 +1,170 @@
+"""In-process queue that delivers accepted matches to Discord in the background."""
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional
+
+from predecessor_api import MatchData
+
+logger = logging.getLogger("belica.delivery_queue")
+
+
+@dataclass
+class _QueuedMatch:
+    """A match waiting for (or undergoing) delivery."""
+    match: MatchData
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class MatchDeliveryQueue:
+    """Bounded FIFO of matches drained by a pool of delivery workers.
+
+    A match UUID is only queued once while it is waiting or being delivered;
+    repeated notifications for it are reported as duplicates and dropped.
+
+    With one worker, matches are posted in the order they arrived, which the
+    cron workers make oldest first. More workers deliver consecutive matches
+    concurrently, so posts to a shared channel can land out of order.
+
+    The queue lives in memory only. The sender is answered before delivery,
+    so matches still queued when the drain timeout ends at shutdown (or when
+    the process crashes) are lost; stop() logs each one.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[MatchData], Awaitable[None]],
+        workers: int = 1,
+        max_size: int = 1000,
+        latency_window: int = 200,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            deliver: Coroutine that posts one match to its channels
+            workers: Number of concurrent delivery workers (more than one may reorder posts)
+            max_size: Maximum matches waiting before enqueue is refused
+            latency_window: Number of recent deliveries kept for latency stats
+        """
+        self.deliver = deliver
+        self.workers = workers
+        self.max_size = max_size
+        self._queue: asyncio.Queue[_QueuedMatch] = asyncio.Queue(maxsize=max_size)
+        # match UUID -> enqueue time for matches waiting or in flight (oldest first)
+        self._pending: dict[str, float] = {}
+        self._in_flight = 0
+        self._tasks: list[asyncio.Task] = []
+        # (queue wait, total latency) in seconds for recent deliveries
+        self._latencies: deque[tuple[float, float]] = deque(maxlen=latency_window)
+        self.enqueued = 0
+        self.duplicates = 0
+        self.rejected = 0
+        self.delivered = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        """Start the delivery workers."""
+        for i in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._worker(), name=f"match-delivery-{i}"))
+        logger.info(f"Started {self.workers} match delivery worker(s)")
+
+    async def stop(self, drain_timeout: float = 10.0) -> None:
+        """
+        Stop the workers, first giving queued matches a chance to be delivered.
+
+        Args:
+            drain_timeout: Seconds to wait for the queue to drain
+        """
+        if self._tasks and self._pending:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=drain_timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"Stopping with {len(self._pending)} undelivered match(es)")
+                for match_uuid in self._pending:
+                    logger.error(f"Match {match_uuid} was accepted but never delivered")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def enqueue(self, match: MatchData) -> bool:
+        """
+        Queue a match for delivery.
+
+        Args:
+            match: The match to deliver
+
+        Returns:
+            True if queued, False if the match is already queued or in flight
+
+        Raises:
+            asyncio.QueueFull: If max_size matches are already waiting
+        """
+        if match.match_uuid in self._pending:
+            self.duplicates += 1
+            return False
+        try:
+            self._queue.put_nowait(_QueuedMatch(match))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise
+        self._pending[match.match_uuid] = time.monotonic()
+        self.enqueued += 1
+        return True
+
+    async def _worker(self) -> None:
+        """Deliver queued matches one at a time until cancelled."""
+        while True:
+            item = await self._queue.get()
+            started = time.monotonic()
+            self._in_flight += 1
+            try:
+                await self.deliver(item.match)
+                self.delivered += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Error delivering match {item.match.match_uuid}: {e}", exc_info=True)
+            finally:
+                finished = time.monotonic()
+                self._latencies.append((started - item.enqueued_at, finished - item.enqueued_at))
+                self._in_flight -= 1
+                self._pending.pop(item.match.match_uuid, None)
+                self._queue.task_done()
+
+    def stats(self) -> dict[str, Any]:
+        """Get queue depth, counters and recent latency (milliseconds)."""
+        waits = [w for w, _ in self._latencies]
+        totals = [t for _, t in self._latencies]
+
+        def summarize(values: list[float]) -> dict[str, Optional[float]]:
+            if not values:
+                return {"avg_ms": None, "p95_ms": None, "max_ms": None}
+            ordered = sorted(values)
+            return {
+                "avg_ms": round(sum(ordered) / len(ordered) * 1000, 1),
+                "p95_ms": round(ordered[math.ceil(0.95 * len(ordered)) - 1] * 1000, 1),
+                "max_ms": round(ordered[-1] * 1000, 1),
+            }
+
+        oldest = None
+        if self._pending:
+            oldest = round((time.monotonic() - next(iter(self._pending.values()))) * 1000, 1)
+
+        return {
+            "depth": self._queue.qsize(),
+            "max_size": self.max_size,
+            "in_flight": self._in_flight,
+            "workers": len(self._tasks),
+            "oldest_pending_ms": oldest,
+            "enqueued": self.enqueued,
+            "duplicates": self.duplicates,
+            "rejected": self.rejected,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "queue_wait": summarize(waits),
+            "latency": summarize(totals),
+        }
@@ -0,0 +1,91 @@
+"""Bot-wide index of emoji names to Discord emoji strings."""
+import logging
+from typing import Callable, Hashable, Iterable, Optional
+
+import discord
+
+logger = logging.getLogger("belica.emoji_index")
+
+
+class EmojiIndex:
+    """Maps emoji names to their message strings (<:name:id>) in O(1).
+
+    Built from the bot's application emojis and every guild emoji it can see.
+    Application emojis win over guild emojis with the same name, and an exact
+    name match wins over a case-insensitive one. Also holds a memo of resolved
+    lookups (e.g. hero name -> emoji string) that is dropped on every rebuild.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._exact: dict[str, str] = {}
+        self._folded: dict[str, str] = {}
+        self._memo: dict[Hashable, Optional[str]] = {}
+        self.version = 0
+
+    @classmethod
+    def from_bot(cls, bot: discord.Client) -> "EmojiIndex":
+        """Build an index from a bot's application and guild emojis."""
+        index = cls()
+        index.rebuild(getattr(bot, "application_emojis", None) or [], bot.emojis)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def rebuild(
+        self,
+        application_emojis: Iterable[discord.Emoji],
+        guild_emojis: Iterable[discord.Emoji],
+    ) -> None:
+        """
+        Replace the index contents.
+
+        Args:
+            application_emojis: Bot-owned emojis (usable in every server)
+            guild_emojis: Emojis from every guild the bot is in
+        """
+        exact: dict[str, str] = {}
+        folded: dict[str, str] = {}
+        # Lowest precedence first; later entries overwrite earlier ones
+        for emoji in [*guild_emojis, *application_emojis]:
+            emoji_str = str(emoji)
+            exact[emoji.name] = emoji_str
+            folded[emoji.name.casefold()] = emoji_str
+        self._exact = exact
+        self._folded = folded
+        self._memo = {}
+        self.version += 1
+        logger.info(f"Emoji index rebuilt with {len(exact)} emoji name(s)")
+
+    def get(self, name: str) -> Optional[str]:
+        """
+        Look up an emoji string by name (exact match first, then case-insensitive).
+
+        Args:
+            name: Emoji name
+
+        Returns:
+            Emoji string in format <:name:id> or <a:name:id>, or None if not found
+        """
+        emoji_str = self._exact.get(name)
+        if emoji_str is None:
+            emoji_str = self._folded.get(name.casefold())
+        return emoji_str
+
+    def memoize(self, key: Hashable, resolve: Callable[[], Optional[str]]) -> Optional[str]:
+        """
+        Return a memoized lookup result, resolving it on first use since the last rebuild.
+
+        Args:
+            key: Memo key, e.g. ("hero", hero_name)
+            resolve: Computes the result on a miss
+
+        Returns:
+            The (possibly cached) result
+        """
+        try:
+            return self._memo[key]
+        except KeyError:
+            result = self._memo[key] = resolve()
+            return result
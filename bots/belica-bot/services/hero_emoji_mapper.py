@@ -2,9 +2,9 @@
 import logging
 from typing import Optional
 import discord
-from discord import utils
 
 from predecessor_api import name_to_slug
+from .emoji_index import EmojiIndex
 
 logger = logging.getLogger("belica.hero_emoji")
 
@@ -67,48 +67,25 @@ class HeroEmojiMapper:
         "Wood": "mourn",  # Wood is an alias for Mourn
     }
     
+    # Case-folded view of HERO_NAME_TO_EMOJI_NAME for case-insensitive lookups
+    _FOLDED_HERO_NAMES = {name.casefold(): emoji for name, emoji in HERO_NAME_TO_EMOJI_NAME.items()}
+    
     def __init__(self, guild: Optional[discord.Guild] = None, bot: Optional[discord.Client] = None):
         """
         Initialize the hero emoji mapper.
         
         Args:
             guild: Optional Discord guild (not used for emoji lookup, kept for compatibility).
-            bot: Discord bot client to look up application emojis from.
-                 Application emojis are bot-specific and work across all servers.
+            bot: Discord bot client whose emoji index (application and guild emojis)
+                 is used for lookups.
         """
         self.guild = guild
         self.bot = bot
-    
-    def _get_emoji_by_name(self, emoji_name: str) -> Optional[discord.Emoji]:
-        """
-        Get an emoji by name from bot.emojis or application emojis using discord.utils.get().
-        
-        This is the proper way to find emojis as shown in:
-        https://github.com/Rapptz/discord.py/issues/390
-        
-        Note: bot.emojis contains guild emojis from all servers.
-        Application emojis are fetched separately and stored in bot.application_emojis.
-        
-        Args:
-            emoji_name: The emoji name to search for
-            
-        Returns:
-            The Emoji object if found, None otherwise
-        """
-        if not self.bot:
-            return None
-        
-        # First, check application emojis (bot-specific, work across all servers)
-        # Application emojis are NOT in bot.emojis - they're stored separately
-        if hasattr(self.bot, 'application_emojis') and self.bot.application_emojis:
-            app_emoji = utils.get(self.bot.application_emojis, name=emoji_name)
-            if app_emoji:
-                return app_emoji
-        
-        # Then, check guild emojis (from all servers the bot is in)
-        # bot.emojis contains guild emojis from all servers
-        guild_emoji = utils.get(self.bot.emojis, name=emoji_name)
-        return guild_emoji
+        self._index: Optional[EmojiIndex] = None
+        if bot is not None:
+            # The bot keeps a shared index up to date (possibly still empty); build a one-off one otherwise
+            index = getattr(bot, "emoji_index", None)
+            self._index = index if index is not None else EmojiIndex.from_bot(bot)
     
     def _normalize_hero_name(self, hero_name: str) -> str:
         """
@@ -120,15 +97,12 @@ class HeroEmojiMapper:
         Returns:
             Normalized hero name for emoji lookup
         """
-        # Try direct lookup first
-        if hero_name in self.HERO_NAME_TO_EMOJI_NAME:
-            return self.HERO_NAME_TO_EMOJI_NAME[hero_name]
-
-        # Try case-insensitive lookup
-        hero_name_lower = hero_name.lower()
-        for api_name, emoji_name in self.HERO_NAME_TO_EMOJI_NAME.items():
-            if api_name.lower() == hero_name_lower:
-                return emoji_name
+        # Direct lookup first, then case-insensitive
+        emoji_name = self.HERO_NAME_TO_EMOJI_NAME.get(hero_name)
+        if emoji_name is None:
+            emoji_name = self._FOLDED_HERO_NAMES.get(hero_name.casefold())
+        if emoji_name is not None:
+            return emoji_name
 
         # Fallback: use shared slug function, then remove hyphens for Discord emoji format
         # Discord emoji names cannot contain hyphens
@@ -141,8 +115,8 @@ class HeroEmojiMapper:
         """
         Get the emoji string for a hero name.
         
-        Uses discord.utils.get() to find emojis from bot.emojis, following the pattern
-        from https://github.com/Rapptz/discord.py/issues/390
+        Looks the emoji up in the bot-wide emoji index (exact name, then
+        case-insensitive). Results are memoized until the index is rebuilt.
         
         Args:
             hero_name: Hero name from API
@@ -150,31 +124,19 @@ class HeroEmojiMapper:
         Returns:
             Emoji string in format <:name:id> or <a:name:id>, or None if not found
         """
+        if self._index is None:
+            return None
+        return self._index.memoize(("hero", hero_name), lambda: self._resolve(hero_name))
+    
+    def _resolve(self, hero_name: str) -> Optional[str]:
+        """Resolve a hero's emoji string from the index (uncached)."""
         emoji_name = self._normalize_hero_name(hero_name)
-        
-        # Use discord.utils.get() to find emoji from bot.emojis
-        emoji = self._get_emoji_by_name(emoji_name)
-        if emoji:
-            # Convert emoji to string to get the proper format: <:name:id> or <a:name:id>
-            # This is the recommended way as shown in the GitHub issue
-            emoji_str = str(emoji)
+        emoji_str = self._index.get(emoji_name)
+        if emoji_str:
             logger.debug(f"Found emoji for hero '{hero_name}' (emoji_name='{emoji_name}'): {emoji_str}")
-            return emoji_str
-        
-        # Try case-insensitive search if exact match failed
-        if self.bot:
-            for bot_emoji in self.bot.emojis:
-                if bot_emoji.name.lower() == emoji_name.lower():
-                    emoji_str = str(bot_emoji)
-                    logger.debug(f"Found emoji for hero '{hero_name}' (case-insensitive, emoji_name='{emoji_name}'): {emoji_str}")
-                    return emoji_str
-        
-        logger.warning(f"Emoji '{emoji_name}' not found in bot.emojis for hero '{hero_name}'")
-        if self.bot:
-            # Log available emoji names for debugging
-            available_names = [e.name for e in self.bot.emojis]
-            logger.debug(f"Available emoji names in bot.emojis: {sorted(available_names)[:10]}...")
-        return None
+        else:
+            logger.warning(f"Emoji '{emoji_name}' not found in emoji index for hero '{hero_name}'")
+        return emoji_str
     
     def get_emoji_or_fallback(self, hero_name: str) -> str:
         """
@@ -1,11 +1,16 @@
 """HTTP server for receiving match notifications from cron workers."""
+import asyncio
 import logging
 import aiohttp
+import discord
 from aiohttp import web
 from typing import Optional
 
-from predecessor_api import MatchService
-from services.match_formatter import MatchMessageFormatter
+from predecessor_api import decode_match, supported_content_types
+from services.delivery_queue import MatchDeliveryQueue
+from services.match_coalescer import MatchCoalescer
+from services.send_scheduler import SendPriority, SendScheduler
+from services.match_formatter import MatchMessageFormatter, SharedMatchRender
 from services.hero_emoji_mapper import HeroEmojiMapper
 from services.role_emoji_mapper import RoleEmojiMapper
 from services.profile_subscription_db import ProfileSubscription
@@ -20,7 +25,13 @@ class HTTPServer:
         self,
         bot,
         host: str = "0.0.0.0",
-        port: int = 8080
+        port: int = 8080,
+        send_concurrency: int = 5,
+        send_timeout: float = 15.0,
+        delivery_workers: int = 1,
+        max_queue_size: int = 1000,
+        drain_timeout: float = 30.0,
+        coalesce_window: float = 0.0
     ) -> None:
         """
         Initialize the HTTP server.
@@ -29,10 +40,28 @@ class HTTPServer:
             bot: The Discord bot instance
             host: Host to bind to
             port: Port to bind to
+            send_concurrency: Maximum channel sends in flight per match
+            send_timeout: Seconds before a single channel send is abandoned
+            delivery_workers: Number of workers posting queued matches
+            max_queue_size: Matches waiting for delivery before new ones get 503
+            drain_timeout: Seconds queued matches get to deliver on shutdown
+            coalesce_window: Seconds to buffer matches per channel and send them
+                             as one multi-embed message (0 disables coalescing)
         """
         self.bot = bot
         self.host = host
         self.port = port
+        self.send_concurrency = send_concurrency
+        self.send_timeout = send_timeout
+        self.drain_timeout = drain_timeout
+        self.delivery_queue = MatchDeliveryQueue(
+            self._post_match_to_channels,
+            workers=delivery_workers,
+            max_size=max_queue_size
+        )
+        self.coalescer: Optional[MatchCoalescer] = None
+        if coalesce_window > 0:
+            self.coalescer = MatchCoalescer(self._send_message, window=coalesce_window)
         self.app: Optional[web.Application] = None
         self.runner: Optional[web.AppRunner] = None
         self.site: Optional[web.TCPSite] = None
@@ -41,7 +70,12 @@ class HTTPServer:
         """
         Handle POST /api/matches - receives match data from cron workers.
         
-        Expected JSON body:
+        Validates the payload, queues the match for delivery and returns
+        202 Accepted immediately; delivery workers post it to Discord.
+        
+        The body is either JSON (Content-Type: application/json) or the compact
+        msgpack encoding (application/msgpack, when msgpack is installed), both
+        carrying the GraphQL match:
         {
             "uuid": "...",
             "id": "...",
@@ -52,43 +86,61 @@ class HTTPServer:
             "matchPlayers": [...]
         }
         """
-        try:
-            # Parse request body
-            match_data = await request.json()
-            
-            if not match_data:
-                return web.json_response(
-                    {"error": "Missing match data"},
-                    status=400
-                )
-            
-            logger.info(f"Received match notification: {match_data.get('uuid')}")
-            
-            # Transform match data using MatchService
-            match_service = MatchService(
-                self.bot.api,
-                self.bot.hero_registry
+        content_type = request.content_type
+        accepted_types = supported_content_types()
+        if content_type == "application/octet-stream":
+            # aiohttp's default when the header is missing; older cron workers always sent JSON
+            content_type = "application/json"
+        if content_type not in accepted_types:
+            return web.json_response(
+                {"error": f"Unsupported Content-Type: {content_type}"},
+                status=415,
+                headers={"Accept-Post": ", ".join(accepted_types)}
             )
-            
-            match = match_service.transform_match_data(match_data)
-            
-            # Post to all configured channels
-            await self._post_match_to_channels(match)
-            
+        try:
+            match_data = decode_match(await request.read(), content_type)
+        except ValueError as e:
+            return web.json_response({"error": f"Invalid request body: {e}"}, status=400)
+        
+        if not match_data or not isinstance(match_data, dict):
             return web.json_response(
-                {"status": "success", "match_uuid": match.match_uuid}
+                {"error": "Missing match data"},
+                status=400
             )
+        if not isinstance(match_data.get("uuid"), str) or not match_data["uuid"]:
+            return web.json_response({"error": "Missing match uuid"}, status=400)
+        if not isinstance(match_data.get("matchPlayers"), list):
+            return web.json_response({"error": "Missing matchPlayers list"}, status=400)
         
+        logger.info(f"Received match notification: {match_data['uuid']}")
+        
+        try:
+            # Transform match data using MatchService
+            match = self.bot.match_service.transform_match_data(match_data)
         except Exception as e:
-            logger.error(f"Error handling match notification: {e}", exc_info=True)
+            logger.error(f"Invalid match data for {match_data['uuid']}: {e}", exc_info=True)
+            return web.json_response({"error": f"Invalid match data: {e}"}, status=400)
+        
+        try:
+            queued = self.delivery_queue.enqueue(match)
+        except asyncio.QueueFull:
+            logger.error(f"Delivery queue full, rejecting match {match.match_uuid}")
             return web.json_response(
-                {"error": str(e)},
-                status=500
+                {"error": "Delivery queue full"},
+                status=503,
+                headers={"Retry-After": "30"}
             )
+        
+        if not queued:
+            logger.info(f"Match {match.match_uuid} already queued for delivery")
+        return web.json_response(
+            {"status": "accepted", "match_uuid": match.match_uuid, "duplicate": not queued},
+            status=202
+        )
     
     async def _post_match_to_channels(self, match) -> None:
         """
-        Post match data to all configured Discord channels.
+        Post match data to the target channels of guilds subscribed to a participant.
         
         Args:
             match: MatchData instance
@@ -99,69 +151,227 @@ class HTTPServer:
             logger.warning("Channel config not available")
             return
         
-        # Get all target channels
+        # Route the match to guilds subscribed to at least one participant
+        profile_subscription: Optional[ProfileSubscription] = getattr(
+            self.bot,
+            'profile_subscription',
+            None
+        )
+        guild_routes: Optional[dict[int, dict[str, Optional[str]]]] = None
+        if profile_subscription:
+            guild_routes = await profile_subscription.route_match(
+                p.player_uuid for p in match.players
+            )
+            if not guild_routes:
+                logger.info(f"No guild subscribes to a player in match {match.match_uuid}")
+                return
+        
+        # Get all target channels (one query), keeping only routed guilds
         target_channels = await channel_config.get_all_target_channels()
+        if guild_routes is not None:
+            target_channels = [
+                (guild_id, channel_id)
+                for guild_id, channel_id in target_channels
+                if guild_id in guild_routes
+            ]
         
         if not target_channels:
-            logger.info("No target channels configured")
+            logger.info("No target channels configured for subscribed guilds")
             return
         
-        logger.info(f"Posting match to {len(target_channels)} channel(s)")
-        
+        # Group by guild so lookups and formatting happen once per guild
+        channels_by_guild: dict[int, list[int]] = {}
         for guild_id, channel_id in target_channels:
+            channels_by_guild.setdefault(guild_id, []).append(channel_id)
+        
+        logger.info(
+            f"Posting match to {len(target_channels)} channel(s) "
+            f"in {len(channels_by_guild)} guild(s)"
+        )
+        self._schedule_prerender(match, channels_by_guild, guild_routes)
+        
+        # Guild-independent parts of the embed are rendered once for every guild.
+        # Emoji lookups use the bot-wide index, so they do not depend on the guild either.
+        shared = SharedMatchRender(
+            match,
+            HeroEmojiMapper(bot=self.bot),
+            RoleEmojiMapper(bot=self.bot)
+        )
+        
+        semaphore = asyncio.Semaphore(self.send_concurrency)
+        sends = []
+        for guild_id, channel_ids in channels_by_guild.items():
+            guild = self.bot.get_guild(guild_id)
+            if not guild:
+                logger.warning(f"Guild {guild_id} not found")
+                continue
+            
+            routed = guild_routes[guild_id] if guild_routes is not None else None
             try:
-                guild = self.bot.get_guild(guild_id)
-                if not guild:
-                    logger.warning(f"Guild {guild_id} not found")
-                    continue
-                
+                formatter = self._create_guild_formatter(match, routed, shared)
+                embed = formatter.create_embed()
+            except Exception as e:
+                logger.error(f"Error formatting match for guild {guild_id}: {e}", exc_info=True)
+                continue
+            
+            for channel_id in channel_ids:
                 channel = guild.get_channel(channel_id)
                 if not channel:
                     logger.warning(f"Channel {channel_id} not found in guild {guild_id}")
                     continue
-                
-                # Get subscribed profiles for this guild (with names for fallback display)
-                profile_subscription: Optional[ProfileSubscription] = getattr(
-                    self.bot,
-                    'profile_subscription',
-                    None
+                if self.coalescer:
+                    # Sent with other matches for this channel when the window ends
+                    self.coalescer.add(channel, match, embed)
+                    continue
+                # Views track their own message state, so each send gets a fresh one
+                sends.append(
+                    self._send_to_channel(semaphore, match, channel, embed, formatter.create_view())
                 )
-                subscribed_uuids = None
-                subscribed_names: dict[str, str] = {}
-                if profile_subscription:
-                    profiles = await profile_subscription.get_profiles_with_names(guild_id)
-                    subscribed_uuids = {p.player_uuid for p in profiles}
-                    # Build lookup dict: uuid -> player_name (only if name exists)
-                    subscribed_names = {
-                        p.player_uuid: p.player_name
-                        for p in profiles
-                        if p.player_name
-                    }
-                
-                # Create emoji mappers
-                hero_emoji_mapper = HeroEmojiMapper(guild=guild, bot=self.bot)
-                role_emoji_mapper = RoleEmojiMapper(guild=guild, bot=self.bot)
-
-                # Format and send match
-                formatter = MatchMessageFormatter(
-                    match,
-                    subscribed_uuids,
-                    hero_emoji_mapper,
-                    role_emoji_mapper,
-                    subscribed_names
+        
+        if self.coalescer:
+            logger.info(f"Buffered match {match.match_uuid} for coalesced posting")
+            return
+        
+        results = await asyncio.gather(*sends)
+        logger.info(f"Posted match {match.match_uuid} to {sum(results)}/{len(sends)} channel(s)")
+    
+    @staticmethod
+    def _subscribed_names(routed: Optional[dict[str, Optional[str]]]) -> dict[str, str]:
+        """Build the uuid -> stored player name lookup of a guild's routed participants (named ones only)."""
+        if routed is None:
+            return {}
+        return {uuid: name for uuid, name in routed.items() if name}
+    
+    def _schedule_prerender(
+        self,
+        match,
+        channels_by_guild: dict[int, list[int]],
+        guild_routes: Optional[dict[int, dict[str, Optional[str]]]],
+    ) -> None:
+        """
+        Queue a background render of the match's scoreboard for guilds likely to click it.
+        
+        Args:
+            match: MatchData instance
+            channels_by_guild: Guild ID -> target channel IDs the match is posted to
+            guild_routes: Guild ID -> subscribed participants (uuid -> stored name), or None
+        """
+        clicks = getattr(self.bot, "scoreboard_clicks", None)
+        prerenderer = getattr(self.bot, "scoreboard_prerenderer", None)
+        name_sets = []
+        for guild_id in channels_by_guild:
+            if clicks is not None:
+                clicks.record_post(guild_id)
+                if not clicks.should_prerender(guild_id):
+                    continue
+            routed = guild_routes.get(guild_id) if guild_routes is not None else None
+            name_sets.append(self._subscribed_names(routed))
+        if prerenderer is not None and name_sets:
+            prerenderer.schedule(match.match_uuid, name_sets)
+    
+    def _create_guild_formatter(
+        self,
+        match,
+        routed: Optional[dict[str, Optional[str]]],
+        shared: SharedMatchRender,
+    ) -> MatchMessageFormatter:
+        """
+        Create the formatter for a guild's copy of a match message.
+        
+        Args:
+            match: MatchData instance
+            routed: Subscribed participants in this guild (uuid -> stored name),
+                    or None if subscriptions are unavailable
+            shared: Guild-independent render of the match
+        
+        Returns:
+            MatchMessageFormatter applying the guild's subscriptions over the shared render
+        """
+        # Subscribed participants for this guild (names used for fallback display)
+        subscribed_uuids = set(routed) if routed is not None else None
+        subscribed_names = self._subscribed_names(routed)
+        
+        return MatchMessageFormatter(
+            match,
+            subscribed_uuids,
+            shared.hero_emoji_mapper,
+            shared.role_emoji_mapper,
+            subscribed_names,
+            shared=shared
+        )
+    
+    async def _send_to_channel(
+        self,
+        semaphore: asyncio.Semaphore,
+        match,
+        channel: discord.abc.Messageable,
+        embed: discord.Embed,
+        view: discord.ui.View,
+    ) -> bool:
+        """
+        Send a match message to one channel with its own timeout.
+        
+        The send goes through the bot's send scheduler (bulk priority); the
+        timeout covers the Discord request, not the wait for a rate limit slot.
+        Failures are logged here so one slow or broken channel never affects the others.
+        
+        Args:
+            semaphore: Bounds how many sends run at once
+            match: MatchData instance (for logging)
+            channel: Channel to send to
+            embed: Embed to send
+            view: View to attach
+        
+        Returns:
+            True if the message was sent, False otherwise
+        """
+        guild_id = channel.guild.id
+        async with semaphore:
+            try:
+                await self._send_message(channel, [embed], view)
+            except asyncio.TimeoutError:
+                logger.error(
+                    f"Timed out after {self.send_timeout}s posting match {match.match_uuid} "
+                    f"to channel {channel.id} in guild {guild_id}"
                 )
-                
-                embed = formatter.create_embed()
-                view = formatter.create_view()
-                
-                await channel.send(embed=embed, view=view)
-                logger.info(f"Posted match {match.match_uuid} to channel {channel_id} in guild {guild_id}")
-            
+                return False
             except Exception as e:
                 logger.error(
-                    f"Error posting match to channel {channel_id} in guild {guild_id}: {e}",
+                    f"Error posting match to channel {channel.id} in guild {guild_id}: {e}",
                     exc_info=True
                 )
+                return False
+        logger.info(f"Posted match {match.match_uuid} to channel {channel.id} in guild {guild_id}")
+        return True
+    
+    async def _send_message(
+        self,
+        channel: discord.abc.Messageable,
+        embeds: list[discord.Embed],
+        view: discord.ui.View,
+    ) -> None:
+        """
+        Send one message through the send scheduler with the per-send timeout.
+        
+        Args:
+            channel: Channel to send to
+            embeds: Embeds to send (at most 10)
+            view: View to attach
+        
+        Raises:
+            asyncio.TimeoutError: If Discord does not respond within send_timeout
+        """
+        def send():
+            return asyncio.wait_for(
+                channel.send(embeds=embeds, view=view),
+                timeout=self.send_timeout
+            )
+        
+        scheduler: Optional[SendScheduler] = getattr(self.bot, "send_scheduler", None)
+        if scheduler:
+            await scheduler.submit(channel.guild.id, channel.id, send, priority=SendPriority.BULK)
+        else:
+            await send()
     
     async def start(self) -> None:
         """Start the HTTP server."""
@@ -171,6 +381,11 @@ class HTTPServer:
         # Health check endpoint
         self.app.router.add_get("/health", self._handle_health)
         
+        # Delivery queue depth and latency
+        self.app.router.add_get("/admin/queue", self._handle_queue_stats)
+        
+        self.delivery_queue.start()
+        
         self.runner = web.AppRunner(self.app)
         await self.runner.setup()
         
@@ -180,14 +395,54 @@ class HTTPServer:
         logger.info(f"HTTP server started on {self.host}:{self.port}")
     
     async def _handle_health(self, request: web.Request) -> web.Response:
-        """Health check endpoint."""
-        return web.json_response({"status": "healthy"})
+        """Health check endpoint (includes DB pool, config cache and GraphQL compression stats)."""
+        response = {"status": "healthy"}
+        api = getattr(self.bot, "api", None)
+        if api is not None:
+            response["graphql_compression"] = api.compression_stats()
+        db = getattr(self.bot, "db", None)
+        if db is not None:
+            response["db_pool"] = db.pool_stats()
+            response["db_statements"] = db.statements.stats()
+        channel_config = getattr(self.bot, "channel_config", None)
+        profile_subscription = getattr(self.bot, "profile_subscription", None)
+        if channel_config is not None and profile_subscription is not None:
+            response["config_cache"] = {
+                "channels": channel_config.cache.stats(),
+                "profiles": profile_subscription.cache.stats(),
+            }
+        return web.json_response(response)
+    
+    async def _handle_queue_stats(self, request: web.Request) -> web.Response:
+        """Admin endpoint: delivery, send and render queue depth, counters, latency, render cache and pre-render use."""
+        response = {"delivery": self.delivery_queue.stats()}
+        scheduler = getattr(self.bot, "send_scheduler", None)
+        if scheduler is not None:
+            response["sends"] = scheduler.stats()
+        render_executor = getattr(self.bot, "render_executor", None)
+        if render_executor is not None:
+            response["renders"] = render_executor.stats()
+        scoreboard_cache = getattr(self.bot, "scoreboard_cache", None)
+        if scoreboard_cache is not None:
+            response["scoreboard_cache"] = scoreboard_cache.stats()
+        prerenderer = getattr(self.bot, "scoreboard_prerenderer", None)
+        if prerenderer is not None:
+            response["prerender"] = prerenderer.stats()
+        clicks = getattr(self.bot, "scoreboard_clicks", None)
+        if clicks is not None:
+            response["scoreboard_clicks"] = clicks.stats()
+        if self.coalescer:
+            response["coalescing"] = self.coalescer.stats()
+        return web.json_response(response)
     
     async def stop(self) -> None:
-        """Stop the HTTP server."""
+        """Stop the HTTP server, then let queued matches finish delivering."""
         if self.site:
             await self.site.stop()
         if self.runner:
             await self.runner.cleanup()
+        await self.delivery_queue.stop(drain_timeout=self.drain_timeout)
+        if self.coalescer:
+            await self.coalescer.flush_all()
         logger.info("HTTP server stopped")
 
@@ -0,0 +1,174 @@
+"""Packed, memory-mapped icon atlases (one raw RGBA buffer per scale)."""
+import hashlib
+import json
+import logging
+import mmap
+from pathlib import Path
+from typing import Iterable, Optional
+
+from PIL import Image
+
+logger = logging.getLogger("belica.icon_atlas")
+
+DEFAULT_ATLAS_DIR = Path(__file__).parent.parent / "icons" / "atlas"
+
+ATLAS_FORMAT_VERSION = 2
+
+
+def _atlas_paths(atlas_dir: Path, scale: float) -> tuple[Path, Path]:
+    """(pixel buffer, JSON index) file paths for a scale."""
+    return atlas_dir / f"atlas_{scale:g}.rgba", atlas_dir / f"atlas_{scale:g}.json"
+
+
+def source_fingerprint(icons_dir: Path) -> str:
+    """Hash the name, size and mtime of every icon PNG, so any added, removed or changed icon alters it."""
+    digest = hashlib.sha256()
+    for path in sorted(icons_dir.glob("*/*.png")):
+        stat = path.stat()
+        digest.update(f"{path.relative_to(icons_dir).as_posix()}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _entry_key(kind: str, slug: str, size: int) -> str:
+    return f"{kind}:{slug}:{size}"
+
+
+class IconAtlas:
+    """Read-only view of a packed atlas: icons are sliced out of an mmap without copying.
+
+    Built by scripts/build_icon_atlas.py. The index records a fingerprint of the
+    source PNGs, and an atlas whose icons have since been added, removed or
+    changed is not opened. Images returned by get() share memory with the
+    mapping (and, through the page cache, with every process that maps the same
+    file), so they must not be modified.
+    """
+
+    def __init__(self, buffer: mmap.mmap, index: dict[str, list[int]], scale: float) -> None:
+        """
+        Wrap an opened atlas (use IconAtlas.open).
+
+        Args:
+            buffer: Read-only mapping of the pixel buffer
+            index: "kind:slug:size" -> [offset, size]
+            scale: Scale the atlas was built for
+        """
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._index = index
+        self.scale = scale
+
+    @classmethod
+    def open(
+        cls,
+        scale: float,
+        atlas_dir: Path = DEFAULT_ATLAS_DIR,
+        icons_dir: Optional[Path] = None
+    ) -> Optional["IconAtlas"]:
+        """
+        Map the atlas for a scale.
+
+        Args:
+            scale: Scale factor the renderer uses
+            atlas_dir: Directory the atlas files were written to
+            icons_dir: Directory of the source PNGs (default: the atlas directory's parent)
+
+        Returns:
+            The atlas, or None if it has not been built, is stale (or is unreadable)
+        """
+        buffer_path, index_path = _atlas_paths(atlas_dir, scale)
+        icons_dir = atlas_dir.parent if icons_dir is None else icons_dir
+        try:
+            index = json.loads(index_path.read_text())
+            if index.get("format") != ATLAS_FORMAT_VERSION:
+                logger.warning(f"Ignoring icon atlas {index_path}: unsupported format {index.get('format')}")
+                return None
+            if index.get("source") != source_fingerprint(icons_dir):
+                logger.warning(f"Ignoring icon atlas {index_path}: icons in {icons_dir} changed since it was built")
+                return None
+            with open(buffer_path, "rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not open icon atlas for scale {scale:g}: {e}")
+            return None
+        logger.info(f"Mapped icon atlas for scale {scale:g} ({len(index['icons'])} icons)")
+        return cls(buffer, index["icons"], scale)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: tuple[str, str, int]) -> bool:
+        return _entry_key(*key) in self._index
+
+    def get(self, kind: str, slug: str, size: int) -> Optional[Image.Image]:
+        """
+        Get an icon as an RGBA image backed by the mapping.
+
+        Args:
+            kind: Icon kind ("hero", "item", "augment", "role")
+            slug: Icon slug
+            size: Edge length in pixels
+
+        Returns:
+            Read-only image, or None if the atlas does not contain it
+        """
+        entry = self._index.get(_entry_key(kind, slug, size))
+        if entry is None:
+            return None
+        offset, edge = entry
+        pixels = self._view[offset:offset + edge * edge * 4]
+        return Image.frombuffer("RGBA", (edge, edge), pixels, "raw", "RGBA", 0, 1)
+
+    def keys(self) -> Iterable[tuple[str, str, int]]:
+        """Every (kind, slug, size) the atlas contains."""
+        for key in self._index:
+            kind, slug, size = key.split(":")
+            yield kind, slug, int(size)
+
+
+def build_atlas(
+    icon_cache,
+    sizes: dict[str, Iterable[int]],
+    scale: float,
+    atlas_dir: Path = DEFAULT_ATLAS_DIR
+) -> int:
+    """
+    Pack every icon on disk, at every size a scale draws it, into one atlas.
+
+    Args:
+        icon_cache: IconCache used to decode and resize the source PNGs
+        sizes: Icon kind -> edge lengths needed (LeaderboardImageGenerator.icon_sizes())
+        scale: Scale the sizes belong to
+        atlas_dir: Directory to write the atlas files to
+
+    Returns:
+        Number of icons packed
+    """
+    atlas_dir.mkdir(parents=True, exist_ok=True)
+    buffer_path, index_path = _atlas_paths(atlas_dir, scale)
+    index: dict[str, list[int]] = {}
+    offset = 0
+    # Fingerprint before reading, so an icon changed mid-build leaves the atlas stale
+    source = source_fingerprint(icon_cache.icons_dir)
+    tmp_buffer = buffer_path.with_suffix(".rgba.tmp")
+    with open(tmp_buffer, "wb") as f:
+        for kind, kind_sizes in sizes.items():
+            for slug in icon_cache.slugs(kind):
+                for size in kind_sizes:
+                    icon = icon_cache.get(kind, slug, size)
+                    if icon is None:
+                        continue
+                    data = icon.tobytes("raw", "RGBA")
+                    f.write(data)
+                    index[_entry_key(kind, slug, size)] = [offset, size]
+                    offset += len(data)
+    tmp_buffer.replace(buffer_path)
+    index_path.write_text(json.dumps({
+        "format": ATLAS_FORMAT_VERSION,
+        "scale": scale,
+        "source": source,
+        "icons": index,
+    }))
+    logger.info(f"Wrote icon atlas {buffer_path} ({len(index)} icons, {offset / (1024 * 1024):.1f} MiB)")
+    return len(index)
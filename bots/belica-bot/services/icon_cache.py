@@ -0,0 +1,228 @@
+"""Process-wide cache of resized scoreboard icons."""
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
+
+from PIL import Image
+
+from predecessor_api import name_to_slug
+from .icon_atlas import IconAtlas
+
+logger = logging.getLogger("belica.icon_cache")
+
+DEFAULT_ICONS_DIR = Path(__file__).parent.parent / "icons"
+
+# Icon kind -> subdirectory of the icons directory
+ICON_KINDS = {
+    "hero": "heroes",
+    "item": "items",
+    "augment": "augments",
+    "role": "roles",
+}
+
+
+@lru_cache(maxsize=4096)
+def icon_slug(name: str) -> str:
+    """Memoized name_to_slug (the same hero/item names repeat in every render)."""
+    return name_to_slug(name)
+
+
+class IconCache:
+    """LRU of RGBA icons keyed by (kind, slug, size), bounded by a memory budget.
+
+    Missing icons are cached too, so a repeat render never touches the disk.
+    With an IconAtlas attached, icons are sliced out of the memory-mapped
+    atlas instead of decoding PNGs; those slices do not count against the
+    budget. Cached images are shared between renders and must not be
+    modified; copy one before drawing on it. Safe to use from several threads.
+    """
+
+    def __init__(self, icons_dir: Path = DEFAULT_ICONS_DIR, max_bytes: int = 32 * 1024 * 1024) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            icons_dir: Directory containing heroes/, items/, augments/ and roles/
+            max_bytes: Memory budget for decoded pixels (4 bytes per RGBA pixel)
+        """
+        self.icons_dir = icons_dir
+        self.max_bytes = max_bytes
+        self._icons: OrderedDict[tuple[str, str, int], Optional[Image.Image]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._atlases: dict[float, IconAtlas] = {}  # scale -> atlas
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, kind: str, slug: str, size: int) -> Optional[Image.Image]:
+        """
+        Get an icon resized to size x size, loading it from disk on a miss.
+
+        Args:
+            kind: One of ICON_KINDS ("hero", "item", "augment", "role")
+            slug: Icon file name without the .png extension
+            size: Edge length in pixels
+
+        Returns:
+            Shared RGBA image (do not modify), or None if the icon does not exist
+        """
+        key = (kind, slug, size)
+        with self._lock:
+            if key in self._icons:
+                self._icons.move_to_end(key)
+                self.hits += 1
+                return self._icons[key]
+            self.misses += 1
+
+        # Decode outside the lock; a concurrent miss on the same key just loads it twice
+        icon = self._from_atlas(kind, slug, size)
+        if icon is None:
+            icon = self._load(kind, slug, size)
+        with self._lock:
+            if key not in self._icons:
+                self._icons[key] = icon
+                self._bytes += self._cost(icon)
+                self._evict()
+        return icon
+
+    def _from_atlas(self, kind: str, slug: str, size: int) -> Optional[Image.Image]:
+        """Slice an icon out of whichever attached atlas has it."""
+        for atlas in self._atlases.values():
+            icon = atlas.get(kind, slug, size)
+            if icon is not None:
+                return icon
+        return None
+
+    def _load(self, kind: str, slug: str, size: int) -> Optional[Image.Image]:
+        """Read, convert and resize one icon (None if missing or unreadable)."""
+        path = self.icons_dir / ICON_KINDS[kind] / f"{slug}.png"
+        try:
+            with Image.open(path) as image:
+                icon = image.convert("RGBA")
+            return icon.resize((size, size), Image.Resampling.LANCZOS)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Could not load {kind} icon {path}: {e}")
+            return None
+
+    @staticmethod
+    def _cost(icon: Optional[Image.Image]) -> int:
+        """Bytes of pixel data an entry holds (atlas slices are backed by the mapping)."""
+        if icon is None or icon.readonly:
+            return 0
+        return icon.width * icon.height * 4
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until within budget (lock held)."""
+        while self._bytes > self.max_bytes and self._icons:
+            _, icon = self._icons.popitem(last=False)
+            self._bytes -= self._cost(icon)
+            self.evictions += 1
+
+    def attach_atlas(self, atlas: IconAtlas) -> None:
+        """
+        Serve icons from a packed atlas, falling back to PNGs for anything it lacks.
+
+        Args:
+            atlas: Opened atlas (replaces any attached atlas of the same scale)
+        """
+        with self._lock:
+            self._atlases[atlas.scale] = atlas
+            # Entries loaded before may have been decoded PNGs or cached misses
+            self._icons.clear()
+            self._bytes = 0
+
+    def has_atlas(self, scale: float) -> bool:
+        """Whether an atlas for a scale is attached."""
+        return scale in self._atlases
+
+    def slugs(self, kind: str) -> list[str]:
+        """List the slugs of every icon file of a kind on disk."""
+        directory = self.icons_dir / ICON_KINDS[kind]
+        return sorted(path.stem for path in directory.glob("*.png"))
+
+    def warm(self, sizes: dict[str, Iterable[int]]) -> int:
+        """
+        Load every icon on disk at the given sizes.
+
+        Args:
+            sizes: Icon kind -> edge lengths needed for it
+
+        Returns:
+            Number of icons loaded
+        """
+        loaded = 0
+        for kind, kind_sizes in sizes.items():
+            for slug in self.slugs(kind):
+                for size in kind_sizes:
+                    if self.get(kind, slug, size) is not None:
+                        loaded += 1
+        logger.info(
+            f"Icon cache warmed with {loaded} icon(s), "
+            f"{self._bytes / (1024 * 1024):.1f} MiB of {self.max_bytes / (1024 * 1024):.0f} MiB"
+        )
+        return loaded
+
+    def clear(self) -> None:
+        """Drop every cached icon."""
+        with self._lock:
+            self._icons.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """Get entry count, memory use and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._icons),
+                "atlas_icons": sum(len(atlas) for atlas in self._atlases.values()),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_shared: dict[Path, IconCache] = {}
+_shared_lock = threading.Lock()
+
+
+def get_icon_cache(icons_dir: Path = DEFAULT_ICONS_DIR) -> IconCache:
+    """
+    Get the process-wide cache for an icons directory, creating it on first use.
+
+    Args:
+        icons_dir: Directory containing the icon subfolders
+
+    Returns:
+        The shared IconCache for that directory
+    """
+    key = Path(icons_dir).resolve()
+    with _shared_lock:
+        cache = _shared.get(key)
+        if cache is None:
+            cache = _shared[key] = IconCache(key)
+        return cache
+
+
+def configure_icon_cache(max_bytes: int, icons_dir: Path = DEFAULT_ICONS_DIR) -> IconCache:
+    """
+    Set the memory budget of the shared cache for an icons directory.
+
+    Args:
+        max_bytes: Memory budget for decoded pixels
+        icons_dir: Directory containing the icon subfolders
+
+    Returns:
+        The shared IconCache for that directory
+    """
+    cache = get_icon_cache(icons_dir)
+    with cache._lock:
+        cache.max_bytes = max_bytes
+        cache._evict()
+    return cache
@@ -0,0 +1,151 @@
+"""Output encodings for rendered scoreboard images."""
+import io
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+from PIL import Image, features
+
+# "auto" encodes with each of AUTO_CANDIDATES (time permitting) and keeps the smallest
+ENCODINGS = ("png", "png-palette", "webp", "auto")
+AUTO_CANDIDATES = ("png-palette", "webp", "png")
+
+# Smoothing factor for the per-encoding time estimates "auto" budgets with
+_EWMA_ALPHA = 0.3
+
+
+def image_extension(image_bytes: bytes) -> str:
+    """File extension ("png" or "webp") of an encoded image, from its magic bytes."""
+    if image_bytes[:4] == b"RIFF" and image_bytes[8:12] == b"WEBP":
+        return "webp"
+    return "png"
+
+
+@dataclass
+class EncodedImage:
+    """An encoded scoreboard plus how it was produced."""
+    data: bytes
+    encoding: str  # One of ENCODINGS except "auto"
+    seconds: float  # Encode time, including discarded "auto" candidates
+
+    @property
+    def extension(self) -> str:
+        return "webp" if self.encoding == "webp" else "png"
+
+
+class ImageEncoder:
+    """Encodes rendered scoreboards as PNG, palette PNG or lossless WebP.
+
+    The scoreboard is mostly a few dozen flat colors, so a 256-color palette
+    PNG is several times smaller than truecolor and visually identical apart
+    from slight banding inside icons. WebP is always lossless here. In "auto"
+    mode every candidate encoding is tried, most compact first, as long as
+    its expected time (a moving average of earlier encodes) fits in what is
+    left of budget_ms; the smallest result wins. The first candidate always
+    runs.
+
+    Picklable, so one can be handed to render worker processes.
+    """
+
+    def __init__(
+        self,
+        encoding: str = "png",
+        compress_level: int = 6,
+        palette_colors: int = 256,
+        webp_method: int = 0,
+        webp_effort: int = 80,
+        budget_ms: float = 150.0,
+        auto_candidates: Iterable[str] = AUTO_CANDIDATES,
+    ) -> None:
+        """
+        Initialize the encoder.
+
+        Args:
+            encoding: One of ENCODINGS
+            compress_level: zlib level for PNG and palette PNG (0-9; 1 is fastest, 9 smallest)
+            palette_colors: Palette size for palette PNG (2-256)
+            webp_method: WebP speed/size trade-off (0 = fastest, 6 = smallest)
+            webp_effort: Lossless WebP compression effort (0-100)
+            budget_ms: Time budget for "auto" mode, in milliseconds
+            auto_candidates: Encodings "auto" chooses between, tried in this order
+
+        Raises:
+            ValueError: If an encoding name is unknown, or WebP is requested
+                        but Pillow was built without it
+        """
+        candidates = tuple(auto_candidates)
+        for name in (encoding, *candidates):
+            if name not in ENCODINGS:
+                raise ValueError(f"Unknown scoreboard encoding {name!r} (expected one of {', '.join(ENCODINGS)})")
+        if not features.check("webp"):
+            if encoding == "webp":
+                raise ValueError("WebP scoreboards need Pillow built with libwebp")
+            candidates = tuple(name for name in candidates if name != "webp")
+        if "auto" in candidates or not candidates:
+            raise ValueError("auto_candidates must list concrete encodings")
+        self.encoding = encoding
+        self.compress_level = compress_level
+        self.palette_colors = palette_colors
+        self.webp_method = webp_method
+        self.webp_effort = webp_effort
+        self.budget_ms = budget_ms
+        self.auto_candidates = candidates
+        self._estimates: dict[str, float] = {}  # encoding -> smoothed seconds
+        self._estimates_lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_estimates_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._estimates_lock = threading.Lock()
+
+    def encode(self, image: Image.Image) -> EncodedImage:
+        """
+        Encode a rendered scoreboard.
+
+        Args:
+            image: The rendered RGB image
+
+        Returns:
+            Encoded bytes with the encoding used and the time it took
+        """
+        if self.encoding != "auto":
+            started = time.perf_counter()
+            data = self._encode_as(image, self.encoding)
+            return EncodedImage(data, self.encoding, time.perf_counter() - started)
+
+        started = time.perf_counter()
+        budget = self.budget_ms / 1000
+        best: Optional[tuple[bytes, str]] = None
+        for encoding in self.auto_candidates:
+            elapsed = time.perf_counter() - started
+            if best is not None and elapsed + self._estimates.get(encoding, 0.0) > budget:
+                continue
+            data = self._encode_as(image, encoding)
+            if best is None or len(data) < len(best[0]):
+                best = (data, encoding)
+        return EncodedImage(best[0], best[1], time.perf_counter() - started)
+
+    def _encode_as(self, image: Image.Image, encoding: str) -> bytes:
+        """Encode with one concrete encoding, updating its time estimate."""
+        started = time.perf_counter()
+        buffer = io.BytesIO()
+        if encoding == "png":
+            image.save(buffer, format="PNG", compress_level=self.compress_level)
+        elif encoding == "png-palette":
+            palette = image.quantize(self.palette_colors, method=Image.Quantize.FASTOCTREE)
+            palette.save(buffer, format="PNG", compress_level=self.compress_level)
+        else:
+            image.save(buffer, format="WEBP", lossless=True, method=self.webp_method, quality=self.webp_effort)
+        seconds = time.perf_counter() - started
+
+        with self._estimates_lock:
+            previous = self._estimates.get(encoding)
+            self._estimates[encoding] = (
+                seconds if previous is None else previous + _EWMA_ALPHA * (seconds - previous)
+            )
+        return buffer.getvalue()
@@ -1,14 +1,62 @@
 """Generate detailed leaderboard images for match results."""
-import io
 import json
+import threading
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from zoneinfo import ZoneInfo
 
 from PIL import Image, ImageDraw, ImageFont
 
-from predecessor_api import format_player_display_name, calculate_per_minute, name_to_slug
+from predecessor_api import format_player_display_name, calculate_per_minute
+
+from .icon_atlas import IconAtlas
+from .icon_cache import DEFAULT_ICONS_DIR, get_icon_cache, icon_slug
+from .image_encoding import ImageEncoder
+
+
+@lru_cache(maxsize=None)
+def _load_font_set(
+    size_large: int, size_medium: int, size_small: int
+) -> tuple[ImageFont.ImageFont, ImageFont.ImageFont, ImageFont.ImageFont]:
+    """Load the (large, medium, small) fonts once per set of sizes."""
+    # Bundled Inter font (preferred)
+    fonts_dir = Path(__file__).parent.parent / "fonts"
+    inter_regular = fonts_dir / "Inter-Regular.ttf"
+    inter_medium = fonts_dir / "Inter-Medium.ttf"
+    inter_bold = fonts_dir / "Inter-Bold.ttf"
+
+    # Try bundled Inter font first
+    if inter_regular.exists():
+        try:
+            return (
+                ImageFont.truetype(str(inter_bold), size_large),
+                ImageFont.truetype(str(inter_medium), size_medium),
+                ImageFont.truetype(str(inter_regular), size_small),
+            )
+        except (OSError, IOError):
+            pass
+
+    # Fallback to system fonts
+    font_paths = [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Linux
+        "/System/Library/Fonts/Helvetica.ttc",  # macOS
+        "C:/Windows/Fonts/arial.ttf",  # Windows
+    ]
+
+    for font_path in font_paths:
+        try:
+            return (
+                ImageFont.truetype(font_path, size_large),
+                ImageFont.truetype(font_path, size_medium),
+                ImageFont.truetype(font_path, size_small),
+            )
+        except (OSError, IOError):
+            continue
+
+    # Fall back to default font if none found
+    return ImageFont.load_default(), ImageFont.load_default(), ImageFont.load_default()
 
 
 class LeaderboardImageGenerator:
@@ -48,6 +96,7 @@ class LeaderboardImageGenerator:
     BASE_CREST_ICON_SIZE = 38
     BASE_AUGMENT_ICON_SIZE = 20
     BASE_PADDING = 8
+    BASE_ROLE_ICON_SIZE = 12
 
     # Base font sizes (at scale 1.0)
     BASE_FONT_LARGE = 16
@@ -76,24 +125,24 @@ class LeaderboardImageGenerator:
     def __init__(
         self,
         icons_dir: Optional[Path] = None,
-        scale: float = 1.5,
-        subscribed_names: Optional[dict[str, str]] = None
+        scale: float = 1.5
     ):
         """Initialize the generator.
 
+        A generator holds no per-render state, so one instance (see get_generator)
+        can serve every render at its scale, including concurrent ones.
+
         Args:
             icons_dir: Path to icons directory containing heroes/ subfolder
             scale: Scale factor for image resolution (1.0 = 1000px wide, 1.5 = 1500px, 2.0 = 2000px)
-            subscribed_names: Dict mapping player UUIDs to their stored display names from
-                             subscribed_profiles table. Used as fallback when API doesn't provide a name.
         """
         self.scale = scale
-        self.icons_dir = icons_dir or Path(__file__).parent.parent / "icons"
+        self.icons_dir = icons_dir or DEFAULT_ICONS_DIR
         self.hero_icons_dir = self.icons_dir / "heroes"
         self.role_icons_dir = self.icons_dir / "roles"
         self.item_icons_dir = self.icons_dir / "items"
         self.augment_icons_dir = self.icons_dir / "augments"
-        self.subscribed_names = subscribed_names or {}
+        self.icon_cache = get_icon_cache(self.icons_dir)
 
         # Compute scaled layout constants
         self.WIDTH = int(self.BASE_WIDTH * scale)
@@ -105,6 +154,7 @@ class LeaderboardImageGenerator:
         self.CREST_ICON_SIZE = int(self.BASE_CREST_ICON_SIZE * scale)
         self.AUGMENT_ICON_SIZE = int(self.BASE_AUGMENT_ICON_SIZE * scale)
         self.PADDING = int(self.BASE_PADDING * scale)
+        self.ROLE_ICON_SIZE = int(self.BASE_ROLE_ICON_SIZE * scale)
 
         # Compute scaled column positions and widths
         self.COLUMNS = {
@@ -115,92 +165,113 @@ class LeaderboardImageGenerator:
         # Try to load fonts, fall back to default
         self._load_fonts()
 
+        # (winner rows, loser rows) -> static background, see _get_template
+        self._templates: dict[tuple[int, int], Image.Image] = {}
+        self._templates_lock = threading.Lock()
+
+        # (hero slug, role) -> hero icon with role badge, see _get_hero_sprite
+        self._sprites: dict[tuple[str, str], Optional[Image.Image]] = {}
+        self._sprites_lock = threading.Lock()
+
     def _s(self, value: int) -> int:
         """Scale a pixel value by the current scale factor."""
         return int(value * self.scale)
 
+    def icon_sizes(self) -> dict[str, tuple[int, ...]]:
+        """Icon kind -> edge lengths this generator draws it at (for warming the icon cache)."""
+        return {
+            "hero": (self.ICON_SIZE,),
+            "role": (self.ROLE_ICON_SIZE,),
+            "item": (self.ITEM_ICON_SIZE, self.CREST_ICON_SIZE),
+            "augment": (self.AUGMENT_ICON_SIZE,),
+        }
+
     def _get_role_icon(self, role: str) -> Optional[Image.Image]:
-        """Load role icon from local cache."""
+        """Load role icon from the shared icon cache."""
         # Convert role to lowercase filename
         role_slug = role.lower()
         if role_slug in ("none", "fill", ""):
             return None
+        # Role icons are smaller, overlay size (scaled)
+        return self.icon_cache.get("role", role_slug, self.ROLE_ICON_SIZE)
 
-        icon_path = self.role_icons_dir / f"{role_slug}.png"
+    def _load_fonts(self):
+        """Load fonts for rendering with scaled sizes (shared by generators of the same sizes)."""
+        self.font_large, self.font_medium, self.font_small = _load_font_set(
+            int(self.BASE_FONT_LARGE * self.scale),
+            int(self.BASE_FONT_MEDIUM * self.scale),
+            int(self.BASE_FONT_SMALL * self.scale),
+        )
 
-        if icon_path.exists():
-            try:
-                icon = Image.open(icon_path).convert("RGBA")
-                # Role icons are smaller, overlay size (scaled)
-                role_size = int(12 * self.scale)
-                icon = icon.resize((role_size, role_size), Image.Resampling.LANCZOS)
-                return icon
-            except Exception:
-                pass
-        return None
+    def _get_hero_icon(self, hero_name: str) -> Optional[Image.Image]:
+        """Load hero icon from the shared icon cache."""
+        return self.icon_cache.get("hero", icon_slug(hero_name), self.ICON_SIZE)
 
-    def _load_fonts(self):
-        """Load fonts for rendering with scaled sizes."""
-        # Compute scaled font sizes
-        font_size_large = int(self.BASE_FONT_LARGE * self.scale)
-        font_size_medium = int(self.BASE_FONT_MEDIUM * self.scale)
-        font_size_small = int(self.BASE_FONT_SMALL * self.scale)
-
-        # Bundled Inter font (preferred)
-        fonts_dir = Path(__file__).parent.parent / "fonts"
-        inter_regular = fonts_dir / "Inter-Regular.ttf"
-        inter_medium = fonts_dir / "Inter-Medium.ttf"
-        inter_bold = fonts_dir / "Inter-Bold.ttf"
-
-        # Try bundled Inter font first
-        if inter_regular.exists():
-            try:
-                self.font_large = ImageFont.truetype(str(inter_bold), font_size_large)
-                self.font_medium = ImageFont.truetype(str(inter_medium), font_size_medium)
-                self.font_small = ImageFont.truetype(str(inter_regular), font_size_small)
-                return
-            except (OSError, IOError):
-                pass
-
-        # Fallback to system fonts
-        font_paths = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",  # Linux
-            "/System/Library/Fonts/Helvetica.ttc",  # macOS
-            "C:/Windows/Fonts/arial.ttf",  # Windows
-        ]
+    def _get_hero_sprite(self, hero_name: str, role: str) -> Optional[Image.Image]:
+        """Get a hero icon with its role badge already composited (shared, do not modify).
 
-        self.font_large = None
-        self.font_medium = None
-        self.font_small = None
+        Args:
+            hero_name: The hero's display name
+            role: The player's role (no badge for NONE/FILL/unknown roles)
 
-        for font_path in font_paths:
-            try:
-                self.font_large = ImageFont.truetype(font_path, font_size_large)
-                self.font_medium = ImageFont.truetype(font_path, font_size_medium)
-                self.font_small = ImageFont.truetype(font_path, font_size_small)
-                break
-            except (OSError, IOError):
-                continue
-
-        # Fall back to default font if none found
-        if self.font_large is None:
-            self.font_large = ImageFont.load_default()
-            self.font_medium = ImageFont.load_default()
-            self.font_small = ImageFont.load_default()
+        Returns:
+            RGBA image, or None if the hero has no icon
+        """
+        key = (icon_slug(hero_name), role.lower())
+        with self._sprites_lock:
+            if key in self._sprites:
+                return self._sprites[key]
+        sprite = self._composite_hero_sprite(hero_name, role)
+        with self._sprites_lock:
+            self._sprites[key] = sprite
+        return sprite
+
+    def _composite_hero_sprite(self, hero_name: str, role: str) -> Optional[Image.Image]:
+        """Composite a role badge onto the bottom-right corner of a hero icon."""
+        icon = self._get_hero_icon(hero_name)
+        if icon is None:
+            return None
 
-    def _get_hero_icon(self, hero_name: str) -> Optional[Image.Image]:
-        """Load hero icon from local cache."""
-        slug = name_to_slug(hero_name)
-        icon_path = self.hero_icons_dir / f"{slug}.png"
+        # Get role icon and overlay it
+        role_icon = self._get_role_icon(role)
+        if role_icon is None:
+            return icon
+
+        # Create a copy to avoid modifying cached icon
+        icon_with_role = icon.copy()
+        # Position role icon at bottom-right corner
+        role_x = self.ICON_SIZE - role_icon.width
+        role_y = self.ICON_SIZE - role_icon.height
+
+        # Draw circular black background behind role icon
+        role_bg_size = role_icon.width + self._s(4)
+        role_bg = Image.new("RGBA", (role_bg_size, role_bg_size), (0, 0, 0, 0))
+        role_bg_draw = ImageDraw.Draw(role_bg)
+        role_bg_draw.ellipse(
+            [(0, 0), (role_bg_size - 1, role_bg_size - 1)],
+            fill=(0, 0, 0, 255)
+        )
+        # Paste background then role icon
+        bg_x = role_x - self._s(2)
+        bg_y = role_y - self._s(2)
+        icon_with_role.paste(role_bg, (bg_x, bg_y), role_bg)
+        icon_with_role.paste(role_icon, (role_x, role_y), role_icon)
+        return icon_with_role
 
-        if icon_path.exists():
-            try:
-                icon = Image.open(icon_path)
-                icon = icon.resize((self.ICON_SIZE, self.ICON_SIZE), Image.Resampling.LANCZOS)
-                return icon
-            except Exception:
-                pass
-        return None
+    def warm_sprites(self) -> int:
+        """Composite every hero with every role badge (plus no badge).
+
+        Returns:
+            Number of sprites built
+        """
+        roles = [*self.icon_cache.slugs("role"), "none"]
+        built = 0
+        for hero_slug in self.icon_cache.slugs("hero"):
+            for role in roles:
+                # Hero slugs are their own slug, so they work as names here
+                if self._get_hero_sprite(hero_slug, role) is not None:
+                    built += 1
+        return built
 
     def _get_item_icon(self, item_name: str, size: int = 24) -> Optional[Image.Image]:
         """Load item icon from local cache.
@@ -210,19 +281,9 @@ class LeaderboardImageGenerator:
             size: Size to resize icon to (default 24px for items column)
 
         Returns:
-            Resized RGBA image or None if not found
+            Shared resized RGBA image (do not modify) or None if not found
         """
-        slug = name_to_slug(item_name)
-        icon_path = self.item_icons_dir / f"{slug}.png"
-
-        if icon_path.exists():
-            try:
-                icon = Image.open(icon_path).convert("RGBA")
-                icon = icon.resize((size, size), Image.Resampling.LANCZOS)
-                return icon
-            except Exception:
-                pass
-        return None
+        return self.icon_cache.get("item", icon_slug(item_name), size)
 
     def _get_augment_icon(self, augment_name: str, size: int = 20) -> Optional[Image.Image]:
         """Load augment icon from local cache.
@@ -232,19 +293,9 @@ class LeaderboardImageGenerator:
             size: Size to resize icon to (default 20px for augments column)
 
         Returns:
-            Resized RGBA image or None if not found
+            Shared resized RGBA image (do not modify) or None if not found
         """
-        slug = name_to_slug(augment_name)
-        icon_path = self.augment_icons_dir / f"{slug}.png"
-
-        if icon_path.exists():
-            try:
-                icon = Image.open(icon_path).convert("RGBA")
-                icon = icon.resize((size, size), Image.Resampling.LANCZOS)
-                return icon
-            except Exception:
-                pass
-        return None
+        return self.icon_cache.get("augment", icon_slug(augment_name), size)
 
     def _get_rank_color(self, tier_name: str) -> tuple:
         """Get color for rank tier."""
@@ -263,14 +314,54 @@ class LeaderboardImageGenerator:
 
         return sorted(players, key=get_role_index)
 
-    def generate(self, match_data: dict) -> bytes:
+    @staticmethod
+    def name_fallback_uuids(match_data: dict) -> list[str]:
+        """UUIDs of players drawn with a fallback name (the API returned none).
+
+        Only these players' subscribed_names entries can change the image.
+
+        Args:
+            match_data: Match data dict (from GraphQL response or cached fixture)
+
+        Returns:
+            Player UUIDs, in match order
+        """
+        match = match_data.get("match", match_data)
+        uuids = []
+        for player in match.get("matchPlayers", []):
+            player_info = player.get("player") or {}
+            if not player_info.get("name") and player_info.get("uuid"):
+                uuids.append(player_info["uuid"])
+        return uuids
+
+    def generate(
+        self,
+        match_data: dict,
+        subscribed_names: Optional[dict[str, str]] = None,
+        encoder: Optional[ImageEncoder] = None
+    ) -> bytes:
         """Generate leaderboard image from match data.
 
         Args:
             match_data: Match data dict (from GraphQL response or cached fixture)
+            subscribed_names: Dict mapping player UUIDs to their stored display names from
+                             subscribed_profiles table. Used as fallback when API doesn't provide a name.
+            encoder: Output encoding (default: PNG at zlib level 6)
 
         Returns:
-            PNG image as bytes
+            Encoded image as bytes (PNG unless the encoder picks WebP)
+        """
+        return (encoder or _default_encoder).encode(self.render(match_data, subscribed_names)).data
+
+    def render(self, match_data: dict, subscribed_names: Optional[dict[str, str]] = None) -> Image.Image:
+        """Draw the leaderboard for a match without encoding it.
+
+        Args:
+            match_data: Match data dict (from GraphQL response or cached fixture)
+            subscribed_names: Player UUID -> stored display name fallbacks
+
+        Returns:
+            The rendered RGB image
         """
         match = match_data.get("match", match_data)
         duration_seconds = match["duration"]
@@ -286,44 +377,104 @@ class LeaderboardImageGenerator:
             [p for p in players if p["team"] == "DAWN"], "DAWN"
         )
 
-        # Calculate image height
-        num_rows = len(players)
-        height = (
-            self.HEADER_HEIGHT +  # Column headers
-            self.TEAM_HEADER_HEIGHT +  # "VICTORY - DUSK"
-            len(dusk_players) * self.ROW_HEIGHT +
-            self.TEAM_HEADER_HEIGHT +  # "DEFEAT - DAWN"
-            len(dawn_players) * self.ROW_HEIGHT +
-            self.PADDING
-        )
+        names = subscribed_names or {}
+        winners, losers = (dusk_players, dawn_players) if winning_team == "DUSK" else (dawn_players, dusk_players)
 
-        # Create image
-        img = Image.new("RGB", (self.WIDTH, height), self.BG_COLOR)
+        # Start from the pre-rendered background, labels and row bars
+        img = self._get_template(len(winners), len(losers)).copy()
         draw = ImageDraw.Draw(img)
 
         y = 0
 
-        # Draw column headers with match time info
+        # Draw match time info next to the column headers
         y = self._draw_column_headers(draw, y, duration_seconds, end_time_str)
 
         # Draw winning team
         if winning_team == "DUSK":
-            y = self._draw_team_section(img, draw, y, "VICTORY", "DUSK", dusk_players, duration_seconds, True)
-            y = self._draw_team_section(img, draw, y, "DEFEAT", "DAWN", dawn_players, duration_seconds, False)
+            y = self._draw_team_section(img, draw, y, "VICTORY", "DUSK", dusk_players, duration_seconds, True, names)
+            y = self._draw_team_section(img, draw, y, "DEFEAT", "DAWN", dawn_players, duration_seconds, False, names)
         else:
-            y = self._draw_team_section(img, draw, y, "VICTORY", "DAWN", dawn_players, duration_seconds, True)
-            y = self._draw_team_section(img, draw, y, "DEFEAT", "DUSK", dusk_players, duration_seconds, False)
+            y = self._draw_team_section(img, draw, y, "VICTORY", "DAWN", dawn_players, duration_seconds, True, names)
+            y = self._draw_team_section(img, draw, y, "DEFEAT", "DUSK", dusk_players, duration_seconds, False, names)
+
+        return img
+
+    def _get_template(self, winner_rows: int, loser_rows: int) -> Image.Image:
+        """Get the static parts of a scoreboard with the given team sizes (shared, do not modify).
+
+        The template holds the background, column labels, team header bars and
+        alternating row backgrounds; generate() draws only text and icons on a
+        copy. Which team won does not change these pixels (the team header text
+        carries live kill totals), so templates are keyed by row counts only.
+        """
+        key = (winner_rows, loser_rows)
+        with self._templates_lock:
+            template = self._templates.get(key)
+            if template is None:
+                template = self._templates[key] = self._render_template(winner_rows, loser_rows)
+            return template
+
+    def _render_template(self, winner_rows: int, loser_rows: int) -> Image.Image:
+        """Draw the static parts of a scoreboard."""
+        height = (
+            self.HEADER_HEIGHT +  # Column headers
+            self.TEAM_HEADER_HEIGHT +  # "VICTORY - DUSK"
+            winner_rows * self.ROW_HEIGHT +
+            self.TEAM_HEADER_HEIGHT +  # "DEFEAT - DAWN"
+            loser_rows * self.ROW_HEIGHT +
+            self.PADDING
+        )
+        img = Image.new("RGB", (self.WIDTH, height), self.BG_COLOR)
+        draw = ImageDraw.Draw(img)
+        self._draw_column_labels(draw, 0)
+        y = self.HEADER_HEIGHT
+        for header_color, rows in ((self.VICTORY_HEADER, winner_rows), (self.DEFEAT_HEADER, loser_rows)):
+            # Team header background
+            draw.rectangle(
+                [(0, y), (self.WIDTH, y + self.TEAM_HEADER_HEIGHT)],
+                fill=header_color
+            )
+            y += self.TEAM_HEADER_HEIGHT
+            # Alternating row backgrounds
+            for i in range(rows):
+                row_color = self.ROW_COLOR_1 if i % 2 == 0 else self.ROW_COLOR_2
+                draw.rectangle(
+                    [(0, y), (self.WIDTH, y + self.ROW_HEIGHT)],
+                    fill=row_color
+                )
+                y += self.ROW_HEIGHT
+        return img
+
+    def _draw_column_labels(self, draw: ImageDraw.Draw, y: int) -> None:
+        """Draw the column header labels."""
+        headers = [
+            ("rank", ""),
+            ("hero", ""),
+            ("name", ""),
+            ("kda", "K / D / A"),
+            ("dmg_dealt", "DMG DEALT"),
+            ("dmg_taken", "DMG TAKEN"),
+            ("wards", "WARDS"),
+            ("cs", "CS"),
+            ("gold", "GOLD"),
+            ("augments", "AUGS"),
+            ("items", "ITEMS"),
+        ]
 
-        # Convert to bytes
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        buffer.seek(0)
-        return buffer.getvalue()
+        for col_name, text in headers:
+            if text:
+                x, width = self.COLUMNS[col_name]
+                draw.text(
+                    (x + self.PADDING, y + self._s(8)),
+                    text,
+                    fill=self.TEXT_MUTED,
+                    font=self.font_small
+                )
 
     def _draw_column_headers(
         self, draw: ImageDraw.Draw, y: int, duration_seconds: int, end_time_str: Optional[str] = None
     ) -> int:
-        """Draw column header row with match time info."""
+        """Draw the match time info in the column header row (labels come from the template)."""
         # Format match duration
         duration_minutes = duration_seconds // 60
         duration_secs = duration_seconds % 60
@@ -351,30 +502,6 @@ class LeaderboardImageGenerator:
             font=self.font_small
         )
 
-        headers = [
-            ("rank", ""),
-            ("hero", ""),
-            ("name", ""),
-            ("kda", "K / D / A"),
-            ("dmg_dealt", "DMG DEALT"),
-            ("dmg_taken", "DMG TAKEN"),
-            ("wards", "WARDS"),
-            ("cs", "CS"),
-            ("gold", "GOLD"),
-            ("augments", "AUGS"),
-            ("items", "ITEMS"),
-        ]
-
-        for col_name, text in headers:
-            if text:
-                x, width = self.COLUMNS[col_name]
-                draw.text(
-                    (x + self.PADDING, y + self._s(8)),
-                    text,
-                    fill=self.TEXT_MUTED,
-                    font=self.font_small
-                )
-
         return y + self.HEADER_HEIGHT
 
     def _draw_team_section(
@@ -386,16 +513,10 @@ class LeaderboardImageGenerator:
         team: str,
         players: list,
         duration_seconds: int,
-        is_winner: bool
+        is_winner: bool,
+        subscribed_names: dict[str, str]
     ) -> int:
-        """Draw a team's section (header + player rows)."""
-        # Team header background
-        header_color = self.VICTORY_HEADER if is_winner else self.DEFEAT_HEADER
-        draw.rectangle(
-            [(0, y), (self.WIDTH, y + self.TEAM_HEADER_HEIGHT)],
-            fill=header_color
-        )
-
+        """Draw a team's section (header text + player rows; bars come from the template)."""
         # Calculate team totals
         total_kills = sum(p["kills"] for p in players)
         total_deaths = sum(p["deaths"] for p in players)
@@ -413,9 +534,8 @@ class LeaderboardImageGenerator:
         y += self.TEAM_HEADER_HEIGHT
 
         # Draw player rows
-        for i, player in enumerate(players):
-            row_color = self.ROW_COLOR_1 if i % 2 == 0 else self.ROW_COLOR_2
-            y = self._draw_player_row(img, draw, y, player, duration_seconds, row_color)
+        for player in players:
+            y = self._draw_player_row(img, draw, y, player, duration_seconds, subscribed_names)
 
         return y
 
@@ -426,15 +546,9 @@ class LeaderboardImageGenerator:
         y: int,
         player: dict,
         duration_seconds: int,
-        row_color: tuple
+        subscribed_names: dict[str, str]
     ) -> int:
-        """Draw a single player row."""
-        # Row background
-        draw.rectangle(
-            [(0, y), (self.WIDTH, y + self.ROW_HEIGHT)],
-            fill=row_color
-        )
-
+        """Draw a single player row (its background comes from the template)."""
         # Extract player data
         player_info = player.get("player", {})
         hero_data = player.get("heroData", {}) or player.get("hero", {})
@@ -445,7 +559,7 @@ class LeaderboardImageGenerator:
         player_name = format_player_display_name(
             player_info.get("name"),
             player_uuid,
-            self.subscribed_names.get(player_uuid) if player_uuid else None
+            subscribed_names.get(player_uuid) if player_uuid else None
         )
         hero_name = hero_data.get("displayName") or hero_data.get("name", "Unknown")
 
@@ -499,43 +613,11 @@ class LeaderboardImageGenerator:
 
         # 2. Hero icon with role overlay
         x, width = self.COLUMNS["hero"]
-        icon = self._get_hero_icon(hero_name)
-        if icon:
+        sprite = self._get_hero_sprite(hero_name, player.get("role", "NONE"))
+        if sprite:
             icon_x = x + self._s(4)
             icon_y = row_center_y - self.ICON_SIZE // 2
-
-            # Convert hero icon to RGBA for compositing
-            if icon.mode != "RGBA":
-                icon = icon.convert("RGBA")
-
-            # Get role icon and overlay it
-            role = player.get("role", "NONE")
-            role_icon = self._get_role_icon(role)
-
-            if role_icon:
-                # Create a copy to avoid modifying cached icon
-                icon_with_role = icon.copy()
-                # Position role icon at bottom-right corner
-                role_x = self.ICON_SIZE - role_icon.width
-                role_y = self.ICON_SIZE - role_icon.height
-
-                # Draw circular black background behind role icon
-                role_bg_size = role_icon.width + self._s(4)
-                role_bg = Image.new("RGBA", (role_bg_size, role_bg_size), (0, 0, 0, 0))
-                role_bg_draw = ImageDraw.Draw(role_bg)
-                role_bg_draw.ellipse(
-                    [(0, 0), (role_bg_size - 1, role_bg_size - 1)],
-                    fill=(0, 0, 0, 255)
-                )
-                # Paste background then role icon
-                bg_x = role_x - self._s(2)
-                bg_y = role_y - self._s(2)
-                icon_with_role.paste(role_bg, (bg_x, bg_y), role_bg)
-                icon_with_role.paste(role_icon, (role_x, role_y), role_icon)
-
-                img.paste(icon_with_role, (icon_x, icon_y), icon_with_role)
-            else:
-                img.paste(icon, (icon_x, icon_y), icon)
+            img.paste(sprite, (icon_x, icon_y), sprite)
 
         # 3. Player name
         x, width = self.COLUMNS["name"]
@@ -740,11 +822,39 @@ class LeaderboardImageGenerator:
         return y + self.ROW_HEIGHT
 
 
+_default_encoder = ImageEncoder()
+
+_generators: dict[tuple[float, Path], LeaderboardImageGenerator] = {}
+_generators_lock = threading.Lock()
+
+
+def get_generator(scale: float = 1.5, icons_dir: Optional[Path] = None) -> LeaderboardImageGenerator:
+    """Get the shared generator for a scale, creating it on first use.
+
+    Generators keep their fonts and scaled layout for the life of the process
+    and can render concurrently.
+
+    Args:
+        scale: Scale factor for image resolution
+        icons_dir: Optional path to icons directory
+
+    Returns:
+        The process-wide generator for (scale, icons_dir)
+    """
+    key = (scale, Path(icons_dir) if icons_dir else DEFAULT_ICONS_DIR)
+    with _generators_lock:
+        generator = _generators.get(key)
+        if generator is None:
+            generator = _generators[key] = LeaderboardImageGenerator(key[1], scale=scale)
+        return generator
+
+
 def generate_leaderboard_image(
     match_data: dict,
     icons_dir: Optional[Path] = None,
     scale: float = 1.5,
-    subscribed_names: Optional[dict[str, str]] = None
+    subscribed_names: Optional[dict[str, str]] = None,
+    encoder: Optional[ImageEncoder] = None
 ) -> bytes:
     """Convenience function to generate a leaderboard image.
 
@@ -754,9 +864,32 @@ def generate_leaderboard_image(
         scale: Scale factor for image resolution (1.0 = 1000px wide, 1.5 = 1500px, 2.0 = 2000px)
         subscribed_names: Dict mapping player UUIDs to their stored display names from
                          subscribed_profiles table. Used as fallback when API doesn't provide a name.
+        encoder: Output encoding (default: PNG at zlib level 6)
+
+    Returns:
+        Encoded image as bytes (PNG unless the encoder picks WebP)
+    """
+    return get_generator(scale, icons_dir).generate(match_data, subscribed_names, encoder)
+
+
+def warm_icon_cache(scale: float = 1.5, icons_dir: Optional[Path] = None) -> int:
+    """Load every icon at the sizes a scale draws it and build the hero+role sprites.
+
+    Maps the packed icon atlas for the scale first, if one has been built
+    (scripts/build_icon_atlas.py), so warming does not decode any PNGs.
+
+    Args:
+        scale: Scale factor the bot renders scoreboards at
+        icons_dir: Optional path to icons directory
 
     Returns:
-        PNG image as bytes
+        Number of icons loaded
     """
-    generator = LeaderboardImageGenerator(icons_dir, scale=scale, subscribed_names=subscribed_names)
-    return generator.generate(match_data)
+    generator = get_generator(scale, icons_dir)
+    if not generator.icon_cache.has_atlas(scale):
+        atlas = IconAtlas.open(scale, generator.icons_dir / "atlas")
+        if atlas is not None:
+            generator.icon_cache.attach_atlas(atlas)
+    loaded = generator.icon_cache.warm(generator.icon_sizes())
+    generator.warm_sprites()
+    return loaded
@@ -0,0 +1,150 @@
+"""Time-window coalescing of match posts bound for the same channel."""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+import discord
+
+from predecessor_api import MatchData
+from services.match_formatter import CoalescedMatchView, MatchView
+
+logger = logging.getLogger("belica.match_coalescer")
+
+# Discord limits per message
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+SendFunc = Callable[[discord.abc.GuildChannel, list[discord.Embed], discord.ui.View], Awaitable[None]]
+
+
+@dataclass
+class _ChannelBatch:
+    """Matches buffered for one channel."""
+    channel: discord.abc.GuildChannel
+    matches: list[MatchData] = field(default_factory=list)
+    embeds: list[discord.Embed] = field(default_factory=list)
+    timer: Optional[asyncio.Task] = None
+
+    @property
+    def embed_chars(self) -> int:
+        return sum(len(embed) for embed in self.embeds)
+
+
+class MatchCoalescer:
+    """Buffers match posts per channel and sends each window's matches as one message.
+
+    The first match for a channel starts a window; matches arriving within it
+    join the same message (one embed and one Open/Scoreboard button pair each).
+    A batch is sent early when it reaches Discord's 10-embed or 6000-character
+    message limits. A window holding a single match is sent as a normal post.
+    """
+
+    def __init__(self, send: SendFunc, window: float = 5.0) -> None:
+        """
+        Initialize the coalescer.
+
+        Args:
+            send: Coroutine that sends (channel, embeds, view) and raises on failure
+            window: Seconds to wait for more matches after the first one for a channel
+        """
+        self.send = send
+        self.window = window
+        self._batches: dict[int, _ChannelBatch] = {}
+        self._tasks: set[asyncio.Task] = set()  # window timers and early flushes
+        self.messages_sent = 0
+        self.matches_sent = 0
+
+    def add(self, channel: discord.abc.GuildChannel, match: MatchData, embed: discord.Embed) -> None:
+        """
+        Buffer a match for a channel (returns immediately; the send happens on flush).
+
+        Args:
+            channel: Channel to post to
+            match: The match being posted
+            embed: The match's embed for this channel's guild
+        """
+        batch = self._batches.get(channel.id)
+        if batch and batch.embed_chars + len(embed) > MAX_EMBED_CHARS_PER_MESSAGE:
+            self._flush_now(channel.id)
+            batch = None
+        if batch is None:
+            batch = self._batches[channel.id] = _ChannelBatch(channel)
+            batch.timer = self._track(asyncio.create_task(self._flush_after_window(channel.id)))
+
+        batch.matches.append(match)
+        batch.embeds.append(embed)
+        if len(batch.embeds) >= MAX_EMBEDS_PER_MESSAGE:
+            self._flush_now(channel.id)
+
+    def _flush_now(self, channel_id: int) -> None:
+        """Send a channel's batch without waiting for its window to end."""
+        batch = self._batches.pop(channel_id, None)
+        if batch is None:
+            return
+        if batch.timer:
+            batch.timer.cancel()
+        self._track(asyncio.create_task(self._send_batch(batch)))
+
+    def _track(self, task: asyncio.Task) -> asyncio.Task:
+        """Keep a reference to a background task until it finishes."""
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _flush_after_window(self, channel_id: int) -> None:
+        """Send a channel's batch once its window ends."""
+        await asyncio.sleep(self.window)
+        batch = self._batches.pop(channel_id, None)
+        if batch:
+            await self._send_batch(batch)
+
+    async def _send_batch(self, batch: _ChannelBatch) -> None:
+        """Send a batch as one message, logging the outcome per match."""
+        if len(batch.matches) == 1:
+            match = batch.matches[0]
+            view: discord.ui.View = MatchView(match_url=match.match_url, match_uuid=match.match_uuid)
+        else:
+            view = CoalescedMatchView([(m.match_url, m.match_uuid) for m in batch.matches])
+
+        channel = batch.channel
+        match_uuids = ", ".join(m.match_uuid for m in batch.matches)
+        try:
+            await self.send(channel, batch.embeds, view)
+        except Exception as e:
+            logger.error(
+                f"Error posting {len(batch.matches)} coalesced match(es) [{match_uuids}] "
+                f"to channel {channel.id} in guild {channel.guild.id}: {e}",
+                exc_info=True
+            )
+            return
+        self.messages_sent += 1
+        self.matches_sent += len(batch.matches)
+        logger.info(
+            f"Posted {len(batch.matches)} match(es) [{match_uuids}] in one message "
+            f"to channel {channel.id} in guild {channel.guild.id}"
+        )
+
+    async def flush_all(self) -> None:
+        """Send every buffered batch now (used on shutdown)."""
+        batches = list(self._batches.values())
+        self._batches.clear()
+        for batch in batches:
+            if batch.timer:
+                batch.timer.cancel()
+        # Cancelled timers finish immediately; timers already sending are waited for
+        await asyncio.gather(
+            *(self._send_batch(batch) for batch in batches),
+            *self._tasks,
+            return_exceptions=True,
+        )
+
+    def stats(self) -> dict[str, float]:
+        """Get buffered and sent counts."""
+        return {
+            "window_seconds": self.window,
+            "channels_buffered": len(self._batches),
+            "matches_buffered": sum(len(b.matches) for b in self._batches.values()),
+            "messages_sent": self.messages_sent,
+            "matches_sent": self.matches_sent,
+        }
@@ -1,14 +1,101 @@
 """Discord message formatter for match data."""
+import asyncio
 import io
 import discord
 import logging
-from typing import Optional
+import weakref
+from typing import Awaitable, Callable, Optional
 from predecessor_api import MatchData, MatchPlayerData, TeamSide, calculate_per_minute
 from .hero_emoji_mapper import HeroEmojiMapper
 from .role_emoji_mapper import RoleEmojiMapper
+from .image_encoding import image_extension
+from .render_executor import RenderQueueFull
+from .send_scheduler import SendPriority
 
 logger = logging.getLogger(__name__)
 
+# Seconds a scoreboard click waits for an in-flight pre-render before rendering itself
+PRERENDER_WAIT_SECONDS = 10.0
+
+
+# Message ID -> lock serializing scoreboard edits of that message (dropped once unused)
+_message_edit_locks: "weakref.WeakValueDictionary[int, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+def _message_edit_lock(message_id: int) -> asyncio.Lock:
+    """Get the lock serializing scoreboard edits of a message."""
+    lock = _message_edit_locks.get(message_id)
+    if lock is None:
+        lock = _message_edit_locks[message_id] = asyncio.Lock()
+    return lock
+
+
+def _build_scoreboard_edit(
+    message: discord.Message,
+    match_uuid: str,
+    file: discord.File,
+    filename: str
+) -> Optional[Callable[[], Awaitable[discord.Message]]]:
+    """
+    Build the edit that shows a match's scoreboard image on a posted message.
+
+    Args:
+        message: The message as it currently is (freshly fetched)
+        match_uuid: Match whose scoreboard is being shown
+        file: Scoreboard image attachment
+        filename: The attachment's file name
+
+    Returns:
+        Zero-argument callable returning the edit coroutine, or None if the
+        message no longer has this match's "View Scoreboard" button
+    """
+    button_id = f"scoreboard:{match_uuid}"
+    if not any(
+        child.custom_id == button_id
+        for component in message.components
+        for child in component.children
+    ):
+        return None
+
+    # Find this match's embed (coalesced messages carry several, told apart by URL)
+    embeds = message.embeds
+    uuid_no_dashes = match_uuid.replace("-", "")
+    target_embed = next(
+        (e for e in embeds if e.url and e.url.endswith(uuid_no_dashes)),
+        embeds[0] if embeds else None,
+    )
+    if target_embed:
+        # Set the image on the embed to reference the attachment
+        target_embed.set_image(url=f"attachment://{filename}")
+
+    # Rebuild the view without this match's "View Scoreboard" button (it's now shown)
+    view = discord.ui.View(timeout=None)
+    for row, component in enumerate(message.components):
+        for child in component.children:
+            if child.url:  # URL buttons (like "Open") have a url attribute
+                view.add_item(
+                    discord.ui.Button(
+                        style=child.style,
+                        label=child.label,
+                        emoji=child.emoji,
+                        url=child.url,
+                        row=row,
+                    )
+                )
+            elif child.custom_id and child.custom_id != button_id:
+                # Other matches' scoreboard buttons in a coalesced message
+                other_uuid = child.custom_id.split(":", 1)[1]
+                view.add_item(ScoreboardButton(other_uuid, label=child.label, row=row))
+
+    # Edit the message to include the image, keeping earlier scoreboard images
+    def edit():
+        return message.edit(
+            embeds=embeds,
+            attachments=[*message.attachments, file],
+            view=view,
+        )
+    return edit
+
 
 async def _handle_scoreboard_callback(interaction: discord.Interaction, match_uuid: str):
     """Shared callback logic for scoreboard button."""
@@ -27,15 +114,6 @@ async def _handle_scoreboard_callback(interaction: discord.Interaction, match_uu
             )
             return
 
-        # Fetch detailed match data
-        match_data = await bot.match_service.fetch_detailed_match(match_uuid)
-        if not match_data:
-            await interaction.followup.send(
-                "Could not fetch match data. The match may no longer be available.",
-                ephemeral=True,
-            )
-            return
-
         # Get subscribed names for this guild (for fallback display names)
         subscribed_names: dict[str, str] = {}
         if interaction.guild_id and hasattr(bot, "profile_subscription"):
@@ -46,40 +124,85 @@ async def _handle_scoreboard_callback(interaction: discord.Interaction, match_uu
                 if p.player_name
             }
 
-        # Import here to avoid circular imports
-        from .leaderboard_image import generate_leaderboard_image
+        scoreboard_clicks = getattr(bot, "scoreboard_clicks", None)
+        if scoreboard_clicks and interaction.guild_id:
+            scoreboard_clicks.record_click(interaction.guild_id)
+
+        # A pre-render started when the match was posted may be about to land in the cache
+        prerenderer = getattr(bot, "scoreboard_prerenderer", None)
+        if prerenderer:
+            await prerenderer.wait(match_uuid, timeout=PRERENDER_WAIT_SECONDS)
+
+        # Finished matches never change: reuse an earlier render if there is one
+        scale = getattr(bot, "scoreboard_scale", 1.5)
+        scoreboard_cache = getattr(bot, "scoreboard_cache", None)
+        image_bytes = None
+        if scoreboard_cache:
+            image_bytes = await asyncio.to_thread(
+                scoreboard_cache.get, match_uuid, scale, subscribed_names
+            )
 
-        # Generate the image
-        image_bytes = generate_leaderboard_image(match_data, subscribed_names=subscribed_names)
+        if image_bytes is None:
+            # Fetch detailed match data
+            match_data = await bot.match_service.fetch_detailed_match(match_uuid)
+            if not match_data:
+                await interaction.followup.send(
+                    "Could not fetch match data. The match may no longer be available.",
+                    ephemeral=True,
+                )
+                return
+
+            # Render in the pool so the event loop keeps heartbeating meanwhile
+            render_executor = getattr(bot, "render_executor", None)
+            if render_executor:
+                image_bytes = await render_executor.render(match_data, subscribed_names)
+            else:
+                from .leaderboard_image import generate_leaderboard_image
+                image_bytes = await asyncio.to_thread(
+                    generate_leaderboard_image,
+                    match_data,
+                    scale=scale,
+                    subscribed_names=subscribed_names,
+                )
+
+            if scoreboard_cache:
+                await asyncio.to_thread(
+                    scoreboard_cache.put, match_uuid, scale, subscribed_names, match_data, image_bytes
+                )
 
         # Create file attachment
-        filename = f"scoreboard_{match_uuid}.png"
+        filename = f"scoreboard_{match_uuid}.{image_extension(image_bytes)}"
         file = discord.File(io.BytesIO(image_bytes), filename=filename)
 
-        # Get the original message's embed and update it to include the image
-        original_embed = interaction.message.embeds[0] if interaction.message.embeds else None
-        if original_embed:
-            # Set the image on the embed to reference the attachment
-            original_embed.set_image(url=f"attachment://{filename}")
-
-        # Create a view with only the "Open" button (remove "View Scoreboard" since it's now shown)
-        view = discord.ui.View(timeout=None)
-        # Find and keep the Open button from the original message
-        for component in interaction.message.components:
-            for child in component.children:
-                if child.url:  # URL buttons (like "Open") have a url attribute
-                    view.add_item(
-                        discord.ui.Button(
-                            style=child.style,
-                            label=child.label,
-                            emoji=child.emoji,
-                            url=child.url,
-                        )
-                    )
-
-        # Edit the original message to include the image and remove the scoreboard button
-        await interaction.message.edit(embed=original_embed, attachments=[file], view=view)
-
+        # Concurrent clicks on one (coalesced) message edit it one at a time, each
+        # starting from the message as the previous edit left it
+        async with _message_edit_lock(interaction.message.id):
+            message = await interaction.message.fetch()
+            edit = _build_scoreboard_edit(message, match_uuid, file, filename)
+            if edit is None:
+                return  # Another click already showed this scoreboard
+
+            # Interactive edits jump ahead of queued match posts
+            scheduler = getattr(bot, "send_scheduler", None)
+            if scheduler:
+                await scheduler.submit(
+                    interaction.guild_id, interaction.channel_id, edit, priority=SendPriority.INTERACTIVE
+                )
+            else:
+                await edit()
+
+    except RenderQueueFull:
+        logger.warning(f"Render queue full, scoreboard for match {match_uuid} refused")
+        await interaction.followup.send(
+            "Lots of scoreboards are being generated right now. Please try again in a moment.",
+            ephemeral=True,
+        )
+    except asyncio.TimeoutError:
+        logger.error(f"Timed out rendering scoreboard for match {match_uuid}")
+        await interaction.followup.send(
+            "Generating the scoreboard took too long. Please try again.",
+            ephemeral=True,
+        )
     except Exception as e:
         logger.exception(f"Error generating scoreboard for match {match_uuid}")
         await interaction.followup.send(
@@ -99,12 +222,13 @@ class ScoreboardButton(
     matching custom_id pattern 'scoreboard:{match_uuid}'.
     """
 
-    def __init__(self, match_uuid: str):
+    def __init__(self, match_uuid: str, label: str = "View Scoreboard", row: Optional[int] = None):
         super().__init__(
             discord.ui.Button(
                 style=discord.ButtonStyle.secondary,
-                label="View Scoreboard",
+                label=label,
                 custom_id=f"scoreboard:{match_uuid}",
+                row=row,
             )
         )
         self.match_uuid = match_uuid
@@ -142,6 +266,126 @@ class MatchView(discord.ui.View):
         self.add_item(ScoreboardButton(match_uuid))
 
 
+class CoalescedMatchView(discord.ui.View):
+    """View for a message carrying several match embeds (one numbered button pair per match)."""
+
+    def __init__(self, matches: list[tuple[str, str]]):
+        """
+        Args:
+            matches: (match_url, match_uuid) for each embed, in embed order (at most 10)
+        """
+        super().__init__(timeout=None)
+
+        for number, (match_url, match_uuid) in enumerate(matches, start=1):
+            # Two matches per row keeps each Open/Scoreboard pair together (10 matches = 5 rows)
+            row = (number - 1) // 2
+            self.add_item(
+                discord.ui.Button(
+                    style=discord.ButtonStyle.secondary,
+                    label=f"Open {number}",
+                    emoji="🔗",
+                    url=match_url,
+                    row=row,
+                )
+            )
+            self.add_item(ScoreboardButton(match_uuid, label=f"Scoreboard {number}", row=row))
+
+
+class SharedMatchRender:
+    """Guild-independent parts of a match embed, computed once per match.
+
+    Holds the overview text, footer and each player's stat line around the
+    display name (MMR, hero/role emojis, KDA, per-minute stats, PS). Formatters
+    for every destination guild reuse it and only apply their own overlay:
+    which players are shown, subscribed display names and the embed color.
+    """
+
+    def __init__(
+        self,
+        match: MatchData,
+        hero_emoji_mapper: Optional[HeroEmojiMapper] = None,
+        role_emoji_mapper: Optional[RoleEmojiMapper] = None,
+    ) -> None:
+        """
+        Initialize the shared render.
+
+        Args:
+            match: The match data to format
+            hero_emoji_mapper: Optional mapper for hero emojis. If provided, hero emojis will be used.
+            role_emoji_mapper: Optional mapper for role emojis. If provided, role emojis will be used.
+        """
+        self.match = match
+        self.hero_emoji_mapper = hero_emoji_mapper
+        self.role_emoji_mapper = role_emoji_mapper
+        self.overview = self._build_match_overview()
+        self.footer = match.match_uuid.replace("-", "")
+        # player_uuid -> (text before the name, text after the name), filled lazily
+        self._player_parts: dict[str, tuple[str, str]] = {}
+
+    def _build_match_overview(self) -> str:
+        """Build the match overview description text."""
+        lines = [
+            f"**{self.match.score_string}**",
+            f"**Duration:** {self.match.duration_minutes} Minutes",
+            f"**Gamemode:** {self.match.game_mode.value}",
+        ]
+        return "\n".join(lines)
+
+    def player_parts(self, player: MatchPlayerData) -> tuple[str, str]:
+        """
+        Get a player's stat line around the display name.
+
+        Format: +29 [HeroEmoji] [RoleEmoji] <name> `7/7/3` - `12.7CS/m` - `451G/m` 159.37 PS
+
+        Args:
+            player: The player data to format.
+
+        Returns:
+            Tuple of (prefix, suffix) to place before and after the player name.
+        """
+        parts = self._player_parts.get(player.player_uuid)
+        if parts is None:
+            parts = self._player_parts[player.player_uuid] = self._build_player_parts(player)
+        return parts
+
+    def _build_player_parts(self, player: MatchPlayerData) -> tuple[str, str]:
+        """Build the prefix and suffix of a player's stat line."""
+        prefix = []
+
+        # MMR change (if available)
+        if player.mmr_change_string:
+            prefix.append(f"`{player.mmr_change_string:>4}`")
+
+        # Hero emoji or name
+        if self.hero_emoji_mapper:
+            hero_display = self.hero_emoji_mapper.get_emoji_or_fallback(player.hero_name)
+        else:
+            hero_display = f"*{player.hero_name}*"
+        prefix.append(hero_display)
+
+        # Role emoji (between hero and player name)
+        if self.role_emoji_mapper:
+            role_display = self.role_emoji_mapper.get_emoji_or_fallback(player.role.value)
+            if role_display:  # Only add if not empty (NONE/FILL roles return empty)
+                prefix.append(role_display)
+
+        suffix = []
+
+        # KDA
+        suffix.append(f"`{player.kda_string}`")
+
+        # CS/m and G/m (per minute stats)
+        cs_per_min = calculate_per_minute(player.minions_killed, self.match.duration_seconds)
+        gold_per_min = calculate_per_minute(player.gold, self.match.duration_seconds)
+        suffix.append(f"- `{cs_per_min:.1f}CS/m` - `{gold_per_min:.0f}G/m`")
+
+        # Performance score (if available)
+        if player.performance_score is not None:
+            suffix.append(f"**{player.performance_score:.2f}** PS")
+
+        return " ".join(prefix), " ".join(suffix)
+
+
 class MatchMessageFormatter:
     """Formats MatchData into Discord embeds and components."""
     
@@ -162,7 +406,8 @@ class MatchMessageFormatter:
         subscribed_player_uuids: set[str] | None = None,
         hero_emoji_mapper: Optional[HeroEmojiMapper] = None,
         role_emoji_mapper: Optional[RoleEmojiMapper] = None,
-        subscribed_names: dict[str, str] | None = None
+        subscribed_names: dict[str, str] | None = None,
+        shared: Optional[SharedMatchRender] = None
     ) -> None:
         """
         Initialize the match formatter.
@@ -175,12 +420,15 @@ class MatchMessageFormatter:
             role_emoji_mapper: Optional mapper for role emojis. If provided, role emojis will be used.
             subscribed_names: Dict mapping player UUIDs to their stored display names from
                              subscribed_profiles table. Used as fallback when API doesn't provide a name.
+            shared: Guild-independent render of this match to reuse across guilds. If None,
+                    one is created from the emoji mappers.
         """
         self.match = match
         self.subscribed_player_uuids = subscribed_player_uuids or set()
         self.hero_emoji_mapper = hero_emoji_mapper
         self.role_emoji_mapper = role_emoji_mapper
         self.subscribed_names = subscribed_names or {}
+        self.shared = shared or SharedMatchRender(match, hero_emoji_mapper, role_emoji_mapper)
     
     def _determine_embed_color(self) -> discord.Color:
         """
@@ -233,7 +481,7 @@ class MatchMessageFormatter:
         )
         
         # Match overview section
-        embed.description = self._build_match_overview()
+        embed.description = self.shared.overview
         
         # Winning team section with opted-in player details
         winning_section = self._build_team_section(
@@ -263,7 +511,7 @@ class MatchMessageFormatter:
             )
         
         # Footer with match ID and timestamp
-        embed.set_footer(text=self.match.match_uuid.replace("-", ""))
+        embed.set_footer(text=self.shared.footer)
         embed.timestamp = self.match.end_time
         
         return embed
@@ -280,15 +528,6 @@ class MatchMessageFormatter:
             match_uuid=self.match.match_uuid,
         )
     
-    def _build_match_overview(self) -> str:
-        """Build the match overview description text."""
-        lines = [
-            f"**{self.match.score_string}**",
-            f"**Duration:** {self.match.duration_minutes} Minutes",
-            f"**Gamemode:** {self.match.game_mode.value}",
-        ]
-        return "\n".join(lines)
-    
     def _build_team_section(
         self,
         team: TeamSide,
@@ -352,48 +591,20 @@ class MatchMessageFormatter:
 
         Format: +29 [HeroEmoji] [RoleEmoji] **PlayerName** `7/7/3` - `12.7CS/m` - `451G/m` 159.37 PS
 
+        Only the player name (which may use a guild's subscribed name) is
+        rendered here; the rest comes from the shared render.
+
         Args:
             player: The player data to format.
 
         Returns:
             Formatted player line with markdown.
         """
-        parts = []
-
-        # MMR change (if available)
-        if player.mmr_change_string:
-            parts.append(f"`{player.mmr_change_string:>4}`")
-
-        # Hero emoji or name
-        if self.hero_emoji_mapper:
-            hero_display = self.hero_emoji_mapper.get_emoji_or_fallback(player.hero_name)
-        else:
-            hero_display = f"*{player.hero_name}*"
-        parts.append(hero_display)
-
-        # Role emoji (between hero and player name)
-        if self.role_emoji_mapper:
-            role_display = self.role_emoji_mapper.get_emoji_or_fallback(player.role.value)
-            if role_display:  # Only add if not empty (NONE/FILL roles return empty)
-                parts.append(role_display)
+        prefix, suffix = self.shared.player_parts(player)
 
         # Player name with profile link (use subscribed name as fallback if available)
         display_name = self._get_display_name(player)
-        parts.append(f"[**{display_name}**]({player.player_profile_url})")
-
-        # KDA
-        parts.append(f"`{player.kda_string}`")
-
-        # CS/m and G/m (per minute stats)
-        cs_per_min = calculate_per_minute(player.minions_killed, self.match.duration_seconds)
-        gold_per_min = calculate_per_minute(player.gold, self.match.duration_seconds)
-        parts.append(f"- `{cs_per_min:.1f}CS/m` - `{gold_per_min:.0f}G/m`")
-
-        # Performance score (if available)
-        if player.performance_score is not None:
-            parts.append(f"**{player.performance_score:.2f}** PS")
-
-        return " ".join(parts)
+        return f"{prefix} [**{display_name}**]({player.player_profile_url}) {suffix}"
 
 
 def create_match_message(
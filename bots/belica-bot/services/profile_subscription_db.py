@@ -1,8 +1,10 @@
 """Database-backed profile subscription management for guild-specific player tracking."""
 import logging
-from typing import Optional
+from typing import Iterable, Optional
 
-from data import Database, SubscribedProfileRepository, SubscribedProfile
+from data import ConfigChange, Database, SubscribedProfileRepository, SubscribedProfile
+from services.config_cache import ConfigCache
+from services.subscription_router import SubscriptionRouter
 
 logger = logging.getLogger("belica.profile_subscription")
 
@@ -10,16 +12,20 @@ logger = logging.getLogger("belica.profile_subscription")
 class ProfileSubscription:
     """Manages player profile subscriptions per guild (server) using database."""
 
-    def __init__(self, db: Optional[Database] = None) -> None:
+    def __init__(self, db: Optional[Database] = None, cache_ttl: float = 300.0) -> None:
         """
         Initialize the profile subscription manager.
 
         Args:
-            db: Optional Database instance. If None, creates a new one.
+            db: Optional shared Database instance. If None, creates (and owns) a new one.
+            cache_ttl: Seconds cached reads stay valid without a change notification
         """
         self.db = db
+        self._owns_db = db is None
         self._repo: Optional[SubscribedProfileRepository] = None
         self._db_initialized = False
+        self.router = SubscriptionRouter()
+        self.cache = ConfigCache(ttl=cache_ttl)
 
     async def _ensure_db(self) -> None:
         """Ensure database is connected and repository is initialized."""
@@ -28,7 +34,7 @@ class ProfileSubscription:
                 from data import Database
                 self.db = Database()
                 await self.db.connect()
-            elif not self.db._pool:
+            elif not self.db.is_connected:
                 await self.db.connect()
 
             self._repo = SubscribedProfileRepository(self.db)
@@ -49,7 +55,11 @@ class ProfileSubscription:
             True if profile was added, False if it already exists
         """
         await self._ensure_db()
-        return await self._repo.add_profile(guild_id, player_uuid, player_name)
+        was_added = await self._repo.add_profile(guild_id, player_uuid, player_name)
+        if was_added:
+            self.router.add(guild_id, player_uuid, player_name)
+            self.cache.invalidate_guild(guild_id)
+        return was_added
     
     async def remove_profile(self, guild_id: int, player_uuid: str) -> bool:
         """
@@ -63,7 +73,11 @@ class ProfileSubscription:
             True if profile was removed, False if it wasn't subscribed
         """
         await self._ensure_db()
-        return await self._repo.remove_profile(guild_id, player_uuid)
+        was_removed = await self._repo.remove_profile(guild_id, player_uuid)
+        if was_removed:
+            self.router.remove(guild_id, player_uuid)
+            self.cache.invalidate_guild(guild_id)
+        return was_removed
     
     async def get_profiles(self, guild_id: int) -> list[str]:
         """
@@ -76,7 +90,10 @@ class ProfileSubscription:
             List of player UUIDs, empty list if none subscribed
         """
         await self._ensure_db()
-        return await self._repo.get_profiles(guild_id)
+        profiles = await self.cache.get(
+            ("profiles", guild_id), lambda: self._repo.get_profiles(guild_id)
+        )
+        return list(profiles)
 
     async def get_profiles_with_names(self, guild_id: int) -> list[SubscribedProfile]:
         """
@@ -89,7 +106,10 @@ class ProfileSubscription:
             List of SubscribedProfile objects, empty list if none subscribed
         """
         await self._ensure_db()
-        return await self._repo.get_profiles_with_names(guild_id)
+        profiles = await self.cache.get(
+            ("profiles_with_names", guild_id), lambda: self._repo.get_profiles_with_names(guild_id)
+        )
+        return list(profiles)
     
     async def is_subscribed(self, guild_id: int, player_uuid: str) -> bool:
         """
@@ -116,10 +136,54 @@ class ProfileSubscription:
             Number of profiles that were removed
         """
         await self._ensure_db()
-        return await self._repo.clear_guild(guild_id)
+        count = await self._repo.clear_guild(guild_id)
+        self.router.clear_guild(guild_id)
+        self.cache.invalidate_guild(guild_id)
+        return count
+
+    async def handle_change(self, change: Optional[ConfigChange]) -> None:
+        """
+        Apply a database change notification to the cache and routing index.
+
+        Args:
+            change: The row change, or None if notifications may have been missed
+        """
+        if change is None:
+            self.cache.clear()
+            await self.load_routes()
+            return
+        if change.table != "subscribed_profiles":
+            return
+        if change.old:
+            self.router.remove(int(change.old["guild_id"]), change.old["player_uuid"])
+        if change.new:
+            self.router.add(
+                int(change.new["guild_id"]), change.new["player_uuid"], change.new.get("player_name")
+            )
+        for guild_id in change.guild_ids:
+            self.cache.invalidate_guild(guild_id)
+
+    async def load_routes(self) -> None:
+        """(Re)load the player -> guild routing index from all subscriptions in one query."""
+        await self._ensure_db()
+        self.router.load(await self._repo.get_all_subscriptions())
+
+    async def route_match(self, player_uuids: Iterable[str]) -> dict[int, dict[str, Optional[str]]]:
+        """
+        Find the guilds subscribed to any player in a match.
+
+        Args:
+            player_uuids: UUIDs of the players in the match
+
+        Returns:
+            Dict mapping guild_id -> {player_uuid -> subscribed name} for the
+            subscribed participants in that guild
+        """
+        if not self.router.loaded:
+            await self.load_routes()
+        return self.router.route(player_uuids)
     
     async def close(self) -> None:
         """Close database connection if we own it."""
-        if self.db and self._db_initialized:
+        if self.db and self._db_initialized and self._owns_db:
             await self.db.close()
-
@@ -0,0 +1,286 @@
+"""Runs scoreboard rendering off the event loop in a process (or thread) pool."""
+import asyncio
+import logging
+import math
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Optional
+
+from services.icon_cache import configure_icon_cache
+from services.image_encoding import EncodedImage, ImageEncoder
+from services.leaderboard_image import get_generator, warm_icon_cache
+
+logger = logging.getLogger("belica.render_executor")
+
+
+class RenderQueueFull(Exception):
+    """Raised when too many renders are already waiting or running."""
+
+
+# Seconds start() waits for every worker process to start and warm its icon cache
+WORKER_STARTUP_TIMEOUT = 60.0
+
+# Set in each worker process by _init_worker (threads share the executor's encoder)
+_worker_encoder: Optional[ImageEncoder] = None
+_startup_barrier: Optional[threading.Barrier] = None
+
+
+def _init_worker(
+    scale: float, icon_cache_max_bytes: int, encoder: ImageEncoder, startup_barrier: threading.Barrier
+) -> None:
+    """Process pool initializer (once per worker): load every icon before the first render arrives."""
+    global _worker_encoder, _startup_barrier
+    _worker_encoder = encoder
+    _startup_barrier = startup_barrier
+    configure_icon_cache(icon_cache_max_bytes)
+    warm_icon_cache(scale)
+
+
+def _wait_for_workers(timeout: float) -> bool:
+    """
+    Start-up job: wait until every worker has been initialized and holds one of these jobs.
+
+    The pool only starts a worker when a job finds none idle, so one job per
+    worker, each held until all of them are running, starts the whole pool.
+
+    Returns:
+        False if not every worker arrived within timeout
+    """
+    try:
+        _startup_barrier.wait(timeout)
+    except threading.BrokenBarrierError:
+        return False
+    return True
+
+
+def _render(
+    match_data: dict,
+    scale: float,
+    subscribed_names: Optional[dict[str, str]],
+    encoder: Optional[ImageEncoder] = None
+) -> EncodedImage:
+    """Render and encode one scoreboard (runs in a pool worker)."""
+    image = get_generator(scale).render(match_data, subscribed_names)
+    return (encoder or _worker_encoder).encode(image)
+
+
+class RenderExecutor:
+    """Bounded pool that renders scoreboard images in parallel without blocking the bot.
+
+    Uses worker processes (so renders on different cores do not contend for
+    the GIL), pre-warmed with the icon cache for the configured scale. Falls
+    back to a thread pool if processes cannot be started, or when configured
+    to. At most max_pending renders may be queued or running; beyond that,
+    render() raises RenderQueueFull so callers can ask users to retry.
+    """
+
+    def __init__(
+        self,
+        scale: float = 1.5,
+        workers: int = 3,
+        use_processes: bool = True,
+        max_pending: int = 8,
+        timeout: float = 30.0,
+        icon_cache_max_bytes: int = 32 * 1024 * 1024,
+        latency_window: int = 200,
+        encoder: Optional[ImageEncoder] = None,
+    ) -> None:
+        """
+        Initialize the executor (call start() to create the pool).
+
+        Args:
+            scale: Scale factor scoreboards are rendered at
+            workers: Number of renders that run at once
+            use_processes: Use worker processes (False forces the thread pool)
+            max_pending: Renders queued or running before new ones are refused
+            timeout: Seconds a caller waits for a render before giving up
+            icon_cache_max_bytes: Icon cache budget in each worker process
+            latency_window: Number of recent renders kept for latency stats
+            encoder: Output encoding (default: PNG at zlib level 6)
+        """
+        self.scale = scale
+        self.workers = workers
+        self.use_processes = use_processes
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.icon_cache_max_bytes = icon_cache_max_bytes
+        self.encoder = encoder or ImageEncoder()
+        self.mode: Optional[str] = None  # "process" or "thread" once started
+        self._executor: Optional[Executor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending = 0
+        self._durations: deque[float] = deque(maxlen=latency_window)
+        self._encodes: deque[tuple[str, float, int]] = deque(maxlen=latency_window)  # (encoding, seconds, bytes)
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.rejected = 0
+
+    @property
+    def pending(self) -> int:
+        """Renders queued or running."""
+        return self._pending
+
+    def _create_executor(self) -> Executor:
+        """Create the process pool, falling back to threads if that is not possible."""
+        if self.use_processes:
+            try:
+                # Spawned workers start clean instead of forking the bot's threads and sockets
+                context = multiprocessing.get_context("spawn")
+                executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(self.scale, self.icon_cache_max_bytes, self.encoder, context.Barrier(self.workers)),
+                )
+                self.mode = "process"
+                return executor
+            except (OSError, NotImplementedError, ValueError) as e:
+                logger.warning(f"Could not start render processes, using threads: {e}")
+        self.mode = "thread"
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="render")
+
+    async def start(self) -> None:
+        """Create the pool and warm up every worker."""
+        if self._executor is not None:
+            return
+        self._executor = self._create_executor()
+        loop = self._loop = asyncio.get_running_loop()
+        try:
+            if self.mode == "process":
+                ready = await asyncio.gather(*(
+                    loop.run_in_executor(self._executor, _wait_for_workers, WORKER_STARTUP_TIMEOUT)
+                    for _ in range(self.workers)
+                ))
+                if not all(ready):
+                    logger.warning(
+                        f"Not every render worker started within {WORKER_STARTUP_TIMEOUT:g}s; "
+                        f"the rest start on demand"
+                    )
+            else:
+                # Threads share this process's icon cache
+                await loop.run_in_executor(self._executor, warm_icon_cache, self.scale)
+        except BrokenProcessPool as e:
+            logger.warning(f"Render processes failed to start, using threads: {e}")
+            self._executor.shutdown(wait=False)
+            self.use_processes = False
+            self._executor = self._create_executor()
+            await loop.run_in_executor(self._executor, warm_icon_cache, self.scale)
+        logger.info(f"Render executor started with {self.workers} {self.mode} worker(s)")
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Stop the pool (queued renders are cancelled).
+
+        Args:
+            wait: Block until running renders finish and worker processes exit
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    async def render(self, match_data: dict, subscribed_names: Optional[dict[str, str]] = None) -> bytes:
+        """
+        Render a scoreboard image in the pool.
+
+        Args:
+            match_data: Detailed match data dict
+            subscribed_names: Player UUID -> stored display name fallbacks
+
+        Returns:
+            Encoded image as bytes (see image_encoding.image_extension for its type)
+
+        Raises:
+            RenderQueueFull: If max_pending renders are already queued or running
+            asyncio.TimeoutError: If the render takes longer than the timeout
+        """
+        if self._executor is None:
+            await self.start()
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise RenderQueueFull(f"{self._pending} scoreboard render(s) already pending")
+
+        started = time.monotonic()
+        # Worker processes got the encoder at start-up; threads share this one
+        encoder = self.encoder if self.mode == "thread" else None
+        try:
+            future = self._executor.submit(_render, match_data, self.scale, subscribed_names, encoder)
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); replace the pool and retry once
+            logger.error("Render process pool broke, restarting it")
+            self._executor.shutdown(wait=False)
+            self._executor = self._create_executor()
+            encoder = self.encoder if self.mode == "thread" else None
+            future = self._executor.submit(_render, match_data, self.scale, subscribed_names, encoder)
+        self.submitted += 1
+        self._pending += 1
+        # Counted until the render really finishes, even if the caller stops waiting
+        future.add_done_callback(self._on_done)
+
+        try:
+            encoded = await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            future.cancel()  # Only takes effect if it has not started yet
+            raise
+        except Exception:
+            self.failed += 1
+            raise
+        self.completed += 1
+        self._durations.append(time.monotonic() - started)
+        self._encodes.append((encoded.encoding, encoded.seconds, len(encoded.data)))
+        return encoded.data
+
+    def _on_done(self, future: Future) -> None:
+        """Release a pending slot (called from a pool thread)."""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._release)
+
+    def _release(self) -> None:
+        """Release a pending slot (on the event loop)."""
+        self._pending -= 1
+
+    def stats(self) -> dict[str, Any]:
+        """Get pool mode, pending count, counters, recent render time and encode time/size per encoding."""
+        durations = sorted(self._durations)
+        render_ms: dict[str, Optional[float]] = {"avg_ms": None, "p95_ms": None, "max_ms": None}
+        if durations:
+            render_ms = {
+                "avg_ms": round(sum(durations) / len(durations) * 1000, 1),
+                "p95_ms": round(durations[math.ceil(0.95 * len(durations)) - 1] * 1000, 1),
+                "max_ms": round(durations[-1] * 1000, 1),
+            }
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "rejected": self.rejected,
+            "render": render_ms,
+            "encoding": self.encoder.encoding,
+            "encodes": self._encode_stats(),
+        }
+
+    def _encode_stats(self) -> dict[str, dict[str, float]]:
+        """Per output encoding: count, average encode milliseconds and average bytes of recent renders."""
+        totals: dict[str, list[float]] = {}
+        for encoding, seconds, size in self._encodes:
+            count, total_seconds, total_bytes = totals.get(encoding, (0, 0.0, 0))
+            totals[encoding] = [count + 1, total_seconds + seconds, total_bytes + size]
+        return {
+            encoding: {
+                "count": count,
+                "avg_ms": round(total_seconds / count * 1000, 1),
+                "avg_bytes": round(total_bytes / count),
+            }
+            for encoding, (count, total_seconds, total_bytes) in totals.items()
+        }
@@ -2,7 +2,8 @@
 import logging
 from typing import Optional
 import discord
-from discord import utils
+
+from .emoji_index import EmojiIndex
 
 logger = logging.getLogger("belica.role_emoji")
 
@@ -25,39 +26,23 @@ class RoleEmojiMapper:
 
         Args:
             guild: Optional Discord guild (not used for emoji lookup, kept for compatibility).
-            bot: Discord bot client to look up application emojis from.
-                 Application emojis are bot-specific and work across all servers.
+            bot: Discord bot client whose emoji index (application and guild emojis)
+                 is used for lookups.
         """
         self.guild = guild
         self.bot = bot
-
-    def _get_emoji_by_name(self, emoji_name: str) -> Optional[discord.Emoji]:
-        """
-        Get an emoji by name from bot.emojis or application emojis using discord.utils.get().
-
-        Args:
-            emoji_name: The emoji name to search for
-
-        Returns:
-            The Emoji object if found, None otherwise
-        """
-        if not self.bot:
-            return None
-
-        # First, check application emojis (bot-specific, work across all servers)
-        if hasattr(self.bot, 'application_emojis') and self.bot.application_emojis:
-            app_emoji = utils.get(self.bot.application_emojis, name=emoji_name)
-            if app_emoji:
-                return app_emoji
-
-        # Then, check guild emojis (from all servers the bot is in)
-        guild_emoji = utils.get(self.bot.emojis, name=emoji_name)
-        return guild_emoji
+        self._index: Optional[EmojiIndex] = None
+        if bot is not None:
+            # The bot keeps a shared index up to date (possibly still empty); build a one-off one otherwise
+            index = getattr(bot, "emoji_index", None)
+            self._index = index if index is not None else EmojiIndex.from_bot(bot)
 
     def get_emoji_string(self, role_value: str) -> Optional[str]:
         """
         Get the emoji string for a role value.
 
+        Results are memoized until the bot-wide emoji index is rebuilt.
+
         Args:
             role_value: Role value from Role enum (e.g., "carry", "support")
 
@@ -68,23 +53,18 @@ class RoleEmojiMapper:
         if not emoji_name:
             logger.debug(f"No emoji mapping for role '{role_value}'")
             return None
+        if self._index is None:
+            return None
+        return self._index.memoize(("role", emoji_name), lambda: self._resolve(role_value, emoji_name))
 
-        emoji = self._get_emoji_by_name(emoji_name)
-        if emoji:
-            emoji_str = str(emoji)
+    def _resolve(self, role_value: str, emoji_name: str) -> Optional[str]:
+        """Resolve a role's emoji string from the index (uncached)."""
+        emoji_str = self._index.get(emoji_name)
+        if emoji_str:
             logger.debug(f"Found emoji for role '{role_value}': {emoji_str}")
-            return emoji_str
-
-        # Try case-insensitive search if exact match failed
-        if self.bot:
-            for bot_emoji in self.bot.emojis:
-                if bot_emoji.name.lower() == emoji_name.lower():
-                    emoji_str = str(bot_emoji)
-                    logger.debug(f"Found emoji for role '{role_value}' (case-insensitive): {emoji_str}")
-                    return emoji_str
-
-        logger.warning(f"Emoji '{emoji_name}' not found for role '{role_value}'")
-        return None
+        else:
+            logger.warning(f"Emoji '{emoji_name}' not found for role '{role_value}'")
+        return emoji_str
 
     def get_emoji_or_fallback(self, role_value: str) -> str:
         """
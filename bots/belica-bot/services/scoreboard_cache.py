@@ -0,0 +1,232 @@
+"""On-disk LRU cache of rendered scoreboard images."""
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from services.image_encoding import image_extension
+from services.leaderboard_image import LeaderboardImageGenerator
+
+logger = logging.getLogger("belica.scoreboard_cache")
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "cache" / "scoreboards"
+
+# Image file extensions the cache stores (the render's encoding decides which)
+IMAGE_EXTENSIONS = ("png", "webp")
+
+
+class ScoreboardCache:
+    """Size-bounded LRU of scoreboard PNGs, persisted across restarts.
+
+    Finished matches never change, so an image is keyed by match UUID, scale
+    and a hash of the subscribed-name fallbacks that actually appear in it
+    (players the API returned without a name). Guilds whose subscriptions do
+    not affect the image share one entry.
+
+    For each match, a small JSON file records which player UUIDs fell back to
+    a stored name, so a lookup can build the key without the match data.
+    Recency is tracked with file mtimes, so LRU order survives restarts.
+    Images keep the extension of their encoding (PNG or WebP); a lookup
+    returns whichever is stored, so changing the encoding does not
+    invalidate earlier renders.
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, max_bytes: int = 200 * 1024 * 1024) -> None:
+        """
+        Initialize the cache, indexing any images already on disk.
+
+        Args:
+            cache_dir: Directory the images are stored in (created if missing)
+            max_bytes: Total size of stored images before the least recently used are deleted
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._files: OrderedDict[str, int] = OrderedDict()  # image file name -> size, oldest first
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self) -> None:
+        """Index stored images from least to most recently used."""
+        entries = []
+        for extension in IMAGE_EXTENSIONS:
+            for path in self.cache_dir.glob(f"*.{extension}"):
+                stat = path.stat()
+                entries.append((stat.st_mtime, path.name, stat.st_size))
+        for _, name, size in sorted(entries):
+            self._files[name] = size
+            self._bytes += size
+        logger.info(f"Scoreboard cache has {len(self._files)} image(s), {self._bytes / (1024 * 1024):.1f} MiB")
+
+    @staticmethod
+    def _names_hash(fallback_uuids: list[str], subscribed_names: Optional[dict[str, str]]) -> str:
+        """Hash the stored names of the players whose API name was missing."""
+        names = subscribed_names or {}
+        relevant = [[uuid, names.get(uuid)] for uuid in sorted(fallback_uuids)]
+        return hashlib.sha256(json.dumps(relevant).encode()).hexdigest()[:16]
+
+    def _deps_path(self, match_uuid: str) -> Path:
+        return self.cache_dir / f"{match_uuid}.names.json"
+
+    @staticmethod
+    def _image_stem(match_uuid: str, scale: float, names_hash: str) -> str:
+        return f"{match_uuid}_{scale:g}_{names_hash}"
+
+    def get(
+        self,
+        match_uuid: str,
+        scale: float,
+        subscribed_names: Optional[dict[str, str]] = None
+    ) -> Optional[bytes]:
+        """
+        Get a cached scoreboard image.
+
+        Args:
+            match_uuid: Match UUID
+            scale: Scale factor the image was rendered at
+            subscribed_names: The requesting guild's player UUID -> stored name fallbacks
+
+        Returns:
+            Encoded image bytes (PNG or WebP), or None on a miss
+        """
+        name = self._find(match_uuid, scale, subscribed_names)
+        if name is None:
+            self.misses += 1
+            return None
+        path = self.cache_dir / name
+        try:
+            image_bytes = path.read_bytes()
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            self.misses += 1
+            return None
+        with self._lock:
+            if name in self._files:
+                self._files.move_to_end(name)
+            self.hits += 1
+        return image_bytes
+
+    def contains(
+        self,
+        match_uuid: str,
+        scale: float,
+        subscribed_names: Optional[dict[str, str]] = None
+    ) -> bool:
+        """
+        Check for a cached scoreboard without reading it or counting a hit or miss.
+
+        Args:
+            match_uuid: Match UUID
+            scale: Scale factor the image was rendered at
+            subscribed_names: The guild's player UUID -> stored name fallbacks
+
+        Returns:
+            True if get() would currently return an image
+        """
+        return self._find(match_uuid, scale, subscribed_names) is not None
+
+    def _find(
+        self,
+        match_uuid: str,
+        scale: float,
+        subscribed_names: Optional[dict[str, str]]
+    ) -> Optional[str]:
+        """File name of the stored image for a lookup, if any."""
+        try:
+            fallback_uuids = json.loads(self._deps_path(match_uuid).read_text())
+        except (OSError, ValueError):
+            return None
+        stem = self._image_stem(match_uuid, scale, self._names_hash(fallback_uuids, subscribed_names))
+        with self._lock:
+            return next(
+                (f"{stem}.{extension}" for extension in IMAGE_EXTENSIONS if f"{stem}.{extension}" in self._files),
+                None,
+            )
+
+    def put(
+        self,
+        match_uuid: str,
+        scale: float,
+        subscribed_names: Optional[dict[str, str]],
+        match_data: dict,
+        image_bytes: bytes
+    ) -> None:
+        """
+        Store a rendered scoreboard image.
+
+        Args:
+            match_uuid: Match UUID
+            scale: Scale factor the image was rendered at
+            subscribed_names: Player UUID -> stored name fallbacks used for the render
+            match_data: The detailed match data the image was rendered from
+            image_bytes: Encoded image bytes (PNG or WebP)
+        """
+        fallback_uuids = LeaderboardImageGenerator.name_fallback_uuids(match_data)
+        stem = self._image_stem(match_uuid, scale, self._names_hash(fallback_uuids, subscribed_names))
+        name = f"{stem}.{image_extension(image_bytes)}"
+        try:
+            self._write_atomic(self._deps_path(match_uuid), json.dumps(fallback_uuids).encode())
+            self._write_atomic(self.cache_dir / name, image_bytes)
+        except OSError as e:
+            logger.warning(f"Could not cache scoreboard for match {match_uuid}: {e}")
+            return
+
+        with self._lock:
+            self._bytes -= self._files.pop(name, 0)
+            self._files[name] = len(image_bytes)
+            self._bytes += len(image_bytes)
+            evicted = self._evict()
+        for evicted_name in evicted:
+            self._delete(evicted_name)
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        """Write a file so readers never see it half-written."""
+        tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def _evict(self) -> list[str]:
+        """Pop least recently used images until within budget (lock held)."""
+        evicted = []
+        while self._bytes > self.max_bytes and len(self._files) > 1:
+            name, size = self._files.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+            evicted.append(name)
+        return evicted
+
+    def _delete(self, name: str) -> None:
+        """Delete an evicted image, and its match's names file once no image needs it."""
+        try:
+            (self.cache_dir / name).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not delete cached scoreboard {name}: {e}")
+        match_uuid = name.split("_", 1)[0]
+        with self._lock:
+            still_used = any(other.startswith(f"{match_uuid}_") for other in self._files)
+        if not still_used:
+            self._deps_path(match_uuid).unlink(missing_ok=True)
+
+    def stats(self) -> dict[str, int]:
+        """Get image count, disk use and hit/miss counters."""
+        with self._lock:
+            return {
+                "images": len(self._files),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
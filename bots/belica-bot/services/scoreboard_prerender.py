@@ -0,0 +1,223 @@
+"""Background pre-rendering of scoreboards when a match is posted."""
+import asyncio
+import logging
+from typing import Any, Optional
+
+from predecessor_api import MatchService
+from services.render_executor import RenderExecutor, RenderQueueFull
+from services.scoreboard_cache import ScoreboardCache
+
+logger = logging.getLogger("belica.scoreboard_prerender")
+
+
+class ScoreboardClickStats:
+    """Per-guild rate of "View Scoreboard" clicks per posted match.
+
+    Counts decay (both halve once a guild reaches window posts), so the rate
+    follows recent behaviour. Guilds with fewer than min_posts posts have no
+    rate yet and are treated as likely to click. Kept in memory only, so a
+    restart starts every guild over.
+    """
+
+    def __init__(self, min_posts: int = 20, min_click_rate: float = 0.02, window: int = 200) -> None:
+        """
+        Initialize empty stats.
+
+        Args:
+            min_posts: Posts seen in a guild before its click rate is trusted
+            min_click_rate: Clicks per post below which a guild is not pre-rendered for
+            window: Posts after which a guild's counts are halved
+        """
+        self.min_posts = min_posts
+        self.min_click_rate = min_click_rate
+        self.window = window
+        self._posts: dict[int, float] = {}
+        self._clicks: dict[int, float] = {}
+
+    def record_post(self, guild_id: int) -> None:
+        """Count a match posted to a guild (once per match, however many channels)."""
+        posts = self._posts.get(guild_id, 0.0) + 1
+        if posts >= self.window:
+            posts /= 2
+            self._clicks[guild_id] = self._clicks.get(guild_id, 0.0) / 2
+        self._posts[guild_id] = posts
+
+    def record_click(self, guild_id: int) -> None:
+        """Count a scoreboard button click in a guild."""
+        self._clicks[guild_id] = self._clicks.get(guild_id, 0.0) + 1
+
+    def click_rate(self, guild_id: int) -> Optional[float]:
+        """Clicks per posted match, or None until min_posts posts have been seen."""
+        posts = self._posts.get(guild_id, 0.0)
+        if posts < self.min_posts:
+            return None
+        return self._clicks.get(guild_id, 0.0) / posts
+
+    def should_prerender(self, guild_id: int) -> bool:
+        """Whether a guild's members click scoreboards often enough to render ahead."""
+        rate = self.click_rate(guild_id)
+        return rate is None or rate >= self.min_click_rate
+
+    def stats(self) -> dict[str, int]:
+        """Get how many guilds are tracked and how many are skipped for low click rates."""
+        return {
+            "guilds": len(self._posts),
+            "skipped_guilds": sum(1 for guild_id in self._posts if not self.should_prerender(guild_id)),
+        }
+
+
+class ScoreboardPrerenderer:
+    """Renders a posted match's scoreboard into the scoreboard cache before anyone clicks.
+
+    Jobs run in the background at low priority: at most concurrency at once,
+    at most max_queued waiting (further matches are dropped), and a job gives
+    way when the render pool is already busy with interactive renders. A job
+    renders one image per distinct set of subscribed-name fallbacks among the
+    guilds it was scheduled for.
+    """
+
+    def __init__(
+        self,
+        match_service: MatchService,
+        render_executor: RenderExecutor,
+        scoreboard_cache: ScoreboardCache,
+        scale: float,
+        concurrency: int = 1,
+        max_queued: int = 50,
+    ) -> None:
+        """
+        Initialize the pre-renderer.
+
+        Args:
+            match_service: Fetches detailed match data
+            render_executor: Render pool shared with button clicks
+            scoreboard_cache: Cache the images are stored in
+            scale: Scale factor scoreboards are rendered at
+            concurrency: Pre-render jobs that run at once
+            max_queued: Jobs waiting or running before new matches are dropped
+        """
+        self.match_service = match_service
+        self.render_executor = render_executor
+        self.scoreboard_cache = scoreboard_cache
+        self.scale = scale
+        self.max_queued = max_queued
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._jobs: dict[str, asyncio.Task] = {}  # match UUID -> job (queued or running)
+        self._running: set[str] = set()  # match UUIDs whose job holds the semaphore
+        self.scheduled = 0
+        self.dropped = 0
+        self.rendered = 0
+        self.already_cached = 0
+        self.skipped_busy = 0
+        self.failed = 0
+
+    def schedule(self, match_uuid: str, name_sets: list[dict[str, str]]) -> bool:
+        """
+        Queue a background pre-render of a match.
+
+        Args:
+            match_uuid: Match UUID
+            name_sets: Subscribed-name fallbacks (player UUID -> stored name) of each guild to render for
+
+        Returns:
+            True if a job was queued
+        """
+        if not name_sets or match_uuid in self._jobs:
+            return False
+        if len(self._jobs) >= self.max_queued:
+            self.dropped += 1
+            logger.debug(f"Pre-render queue full, dropping match {match_uuid}")
+            return False
+        self.scheduled += 1
+        task = asyncio.create_task(self._run(match_uuid, name_sets))
+        self._jobs[match_uuid] = task
+        task.add_done_callback(lambda _: self._jobs.pop(match_uuid, None))
+        return True
+
+    async def wait(self, match_uuid: str, timeout: float) -> None:
+        """
+        Wait for a match's pre-render, if one is running, so a click can reuse it.
+
+        A job still queued behind others is not waited for (the click would
+        wait for the whole backlog and then render anyway); it is cancelled
+        so the click renders straight away and the job does not repeat it.
+
+        Args:
+            match_uuid: Match UUID
+            timeout: Seconds to wait at most
+        """
+        task = self._jobs.get(match_uuid)
+        if task is None:
+            return
+        if match_uuid not in self._running:
+            task.cancel()
+            return
+        # Unlike wait_for, a click that stops waiting does not cancel the job
+        await asyncio.wait({task}, timeout=timeout)
+
+    async def _run(self, match_uuid: str, name_sets: list[dict[str, str]]) -> None:
+        """Fetch and render one match for each name set not cached yet."""
+        async with self._semaphore:
+            self._running.add(match_uuid)
+            try:
+                await self._render_missing(match_uuid, name_sets)
+            except asyncio.CancelledError:
+                raise
+            except (RenderQueueFull, asyncio.TimeoutError) as e:
+                self.skipped_busy += 1
+                logger.debug(f"Skipped pre-rendering match {match_uuid}: {e!r}")
+            except Exception as e:
+                self.failed += 1
+                logger.warning(f"Error pre-rendering scoreboard for match {match_uuid}: {e}")
+            finally:
+                self._running.discard(match_uuid)
+
+    async def _render_missing(self, match_uuid: str, name_sets: list[dict[str, str]]) -> None:
+        """Render and cache the name sets without a cached image (fetching the match once)."""
+        missing = [
+            names for names in name_sets
+            if not await asyncio.to_thread(self.scoreboard_cache.contains, match_uuid, self.scale, names)
+        ]
+        if not missing:
+            self.already_cached += 1
+            return
+
+        match_data = await self.match_service.fetch_detailed_match(match_uuid)
+        if not match_data:
+            return
+
+        for names in missing:
+            # Guilds sharing fallbacks share an image; an earlier render may cover this one
+            if await asyncio.to_thread(self.scoreboard_cache.contains, match_uuid, self.scale, names):
+                continue
+            # Leave the pool to renders someone is waiting for
+            if self.render_executor.pending >= self.render_executor.workers:
+                self.skipped_busy += 1
+                return
+            image_bytes = await self.render_executor.render(match_data, names)
+            await asyncio.to_thread(
+                self.scoreboard_cache.put, match_uuid, self.scale, names, match_data, image_bytes
+            )
+            self.rendered += 1
+        logger.debug(f"Pre-rendered scoreboard for match {match_uuid}")
+
+    async def stop(self) -> None:
+        """Cancel queued and running jobs."""
+        jobs = list(self._jobs.values())
+        for task in jobs:
+            task.cancel()
+        await asyncio.gather(*jobs, return_exceptions=True)
+
+    def stats(self) -> dict[str, Any]:
+        """Get queued job count and counters."""
+        return {
+            "queued": len(self._jobs),
+            "running": len(self._running),
+            "max_queued": self.max_queued,
+            "scheduled": self.scheduled,
+            "dropped": self.dropped,
+            "rendered": self.rendered,
+            "already_cached": self.already_cached,
+            "skipped_busy": self.skipped_busy,
+            "failed": self.failed,
+        }
@@ -0,0 +1,324 @@
+"""Rate-limit-aware scheduler for outbound Discord messages."""
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+logger = logging.getLogger("belica.send_scheduler")
+
+T = TypeVar("T")
+
+
+class SendPriority(IntEnum):
+    """Scheduling class of an outbound request (lower is served first)."""
+    INTERACTIVE = 0  # Responses to a user action, e.g. scoreboard edits
+    BULK = 1  # Match posts
+
+
+class TokenBucket:
+    """Allows `capacity` requests per `period` seconds, refilling continuously."""
+
+    def __init__(self, capacity: int, period: float) -> None:
+        """
+        Initialize a full bucket.
+
+        Args:
+            capacity: Maximum burst size
+            period: Seconds to refill from empty to full
+        """
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time elapsed since the last update."""
+        if now <= self.updated:
+            # A timestamp taken before the bucket was created or last refilled
+            return
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until one token is available (0 if available now)."""
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self, now: float) -> None:
+        """Take one token (call only when wait_time() is 0)."""
+        self._refill(now)
+        self.tokens -= 1
+
+    def is_full(self, now: float) -> bool:
+        """Whether the bucket has fully refilled (safe to discard)."""
+        self._refill(now)
+        return self.tokens >= self.capacity
+
+
+def parse_rate_limit(value: str) -> tuple[int, float]:
+    """
+    Parse a "count/seconds" rate limit such as "5/5".
+
+    Args:
+        value: Rate limit string
+
+    Returns:
+        Tuple of (capacity, period_seconds); a bare count means per second
+
+    Raises:
+        ValueError: If the string is malformed or either number is not positive
+    """
+    count, slash, seconds = value.partition("/")
+    capacity, period = int(count), float(seconds) if slash else 1.0
+    if capacity < 1 or not 0 < period < float("inf"):
+        raise ValueError(f"Invalid rate limit: {value!r}")
+    return capacity, period
+
+
+@dataclass
+class _SendJob:
+    """An outbound request waiting for its rate limit buckets."""
+    guild_id: int
+    channel_id: int
+    fn: Callable[[], Awaitable[Any]]
+    future: asyncio.Future
+    priority: SendPriority
+    submitted_at: float = field(default_factory=time.monotonic)
+
+
+class SendScheduler:
+    """Dispatches outbound Discord requests within proactive rate limits.
+
+    Every request passes per-channel, per-guild and global token buckets
+    before it is sent, so discord.py's reactive 429 handling is a fallback
+    rather than the normal path. Interactive requests are always considered
+    before bulk ones. Bulk requests are queued per guild and served
+    round-robin, so a guild with a large backlog cannot starve the others.
+    """
+
+    # Idle buckets kept before full ones are discarded
+    MAX_IDLE_BUCKETS = 1000
+
+    def __init__(
+        self,
+        channel_limit: tuple[int, float] = (5, 5.0),
+        guild_limit: tuple[int, float] = (10, 5.0),
+        global_limit: tuple[int, float] = (40, 1.0),
+        max_in_flight: int = 10,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            channel_limit: (requests, seconds) allowed per channel
+            guild_limit: (requests, seconds) allowed per guild
+            global_limit: (requests, seconds) allowed across the bot
+            max_in_flight: Maximum requests awaiting a Discord response at once
+        """
+        self.channel_limit = channel_limit
+        self.guild_limit = guild_limit
+        self.max_in_flight = max_in_flight
+        self._global_bucket = TokenBucket(*global_limit)
+        self._channel_buckets: dict[int, TokenBucket] = {}
+        self._guild_buckets: dict[int, TokenBucket] = {}
+        self._interactive: deque[_SendJob] = deque()
+        self._bulk: dict[int, deque[_SendJob]] = {}  # guild_id -> jobs
+        self._guild_order: deque[int] = deque()  # round-robin order of guilds with bulk jobs
+        self._in_flight = 0
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._executing: set[asyncio.Task] = set()  # dispatched requests awaiting Discord
+        self.dispatched = {priority.name.lower(): 0 for priority in SendPriority}
+        self._wait_total = {priority.name.lower(): 0.0 for priority in SendPriority}
+
+    def start(self) -> None:
+        """Start the dispatch loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="send-scheduler")
+            logger.info(
+                f"Send scheduler started (channel {self.channel_limit[0]}/{self.channel_limit[1]:g}s, "
+                f"guild {self.guild_limit[0]}/{self.guild_limit[1]:g}s)"
+            )
+
+    async def stop(self) -> None:
+        """Stop the dispatch loop, let dispatched requests finish and fail anything still waiting."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        await asyncio.gather(*self._executing, return_exceptions=True)
+        pending = list(self._interactive) + [job for jobs in self._bulk.values() for job in jobs]
+        for job in pending:
+            if not job.future.done():
+                job.future.set_exception(RuntimeError("Send scheduler stopped"))
+        self._interactive.clear()
+        self._bulk.clear()
+        self._guild_order.clear()
+
+    async def submit(
+        self,
+        guild_id: Optional[int],
+        channel_id: int,
+        fn: Callable[[], Awaitable[T]],
+        priority: SendPriority = SendPriority.BULK,
+    ) -> T:
+        """
+        Run a Discord request once its rate limits allow.
+
+        Args:
+            guild_id: Guild the channel belongs to (None for DMs)
+            channel_id: Channel the request targets
+            fn: Zero-argument coroutine function performing the request
+            priority: Scheduling class
+
+        Returns:
+            Whatever fn returns (exceptions from fn are re-raised)
+        """
+        if self._task is None:
+            # Not running (e.g. during startup or tests): send directly
+            return await fn()
+
+        job = _SendJob(
+            guild_id=guild_id or 0,
+            channel_id=channel_id,
+            fn=fn,
+            future=asyncio.get_running_loop().create_future(),
+            priority=priority,
+        )
+        if priority == SendPriority.INTERACTIVE:
+            self._interactive.append(job)
+        else:
+            if job.guild_id not in self._bulk:
+                self._bulk[job.guild_id] = deque()
+                self._guild_order.append(job.guild_id)
+            self._bulk[job.guild_id].append(job)
+        self._wakeup.set()
+        return await job.future
+
+    def _buckets(self, job: _SendJob) -> tuple[TokenBucket, TokenBucket, TokenBucket]:
+        """Get (creating if needed) the buckets a job must pass."""
+        channel_bucket = self._channel_buckets.get(job.channel_id)
+        if channel_bucket is None:
+            channel_bucket = self._channel_buckets[job.channel_id] = TokenBucket(*self.channel_limit)
+        guild_bucket = self._guild_buckets.get(job.guild_id)
+        if guild_bucket is None:
+            guild_bucket = self._guild_buckets[job.guild_id] = TokenBucket(*self.guild_limit)
+        return self._global_bucket, guild_bucket, channel_bucket
+
+    def _wait_time(self, job: _SendJob, now: float) -> float:
+        """Seconds until every bucket for a job has a token."""
+        return max(bucket.wait_time(now) for bucket in self._buckets(job))
+
+    def _take_ready(self, jobs: deque[_SendJob], now: float) -> tuple[Optional[_SendJob], float]:
+        """
+        Remove and return the first job in a queue whose buckets are ready.
+
+        Returns:
+            Tuple of (job or None, shortest wait among jobs that are not ready)
+        """
+        shortest = float("inf")
+        for job in list(jobs):
+            if job.future.done():
+                # Caller gave up (e.g. timed out) before the job was dispatched
+                jobs.remove(job)
+                continue
+            wait = self._wait_time(job, now)
+            if wait == 0:
+                jobs.remove(job)
+                return job, 0.0
+            shortest = min(shortest, wait)
+        return None, shortest
+
+    def _next_job(self, now: float) -> tuple[Optional[_SendJob], float]:
+        """Pick the next job to dispatch: interactive first, then bulk round-robin by guild."""
+        job, shortest = self._take_ready(self._interactive, now)
+        if job:
+            return job, 0.0
+
+        for _ in range(len(self._guild_order)):
+            guild_id = self._guild_order[0]
+            self._guild_order.rotate(-1)
+            jobs = self._bulk[guild_id]
+            job, wait = self._take_ready(jobs, now)
+            if not jobs:
+                del self._bulk[guild_id]
+                self._guild_order.remove(guild_id)
+            if job:
+                return job, 0.0
+            shortest = min(shortest, wait)
+        return None, shortest
+
+    def _dispatch_ready(self) -> Optional[float]:
+        """
+        Dispatch every job that can run now.
+
+        Returns:
+            Seconds until the next job could run, or None to wait for a wakeup
+        """
+        while self._in_flight < self.max_in_flight:
+            now = time.monotonic()
+            job, wait = self._next_job(now)
+            if job is None:
+                return None if wait == float("inf") else wait
+            for bucket in self._buckets(job):
+                bucket.consume(now)
+            self._in_flight += 1
+            name = job.priority.name.lower()
+            self.dispatched[name] += 1
+            self._wait_total[name] += now - job.submitted_at
+            task = asyncio.create_task(self._execute(job))
+            self._executing.add(task)
+            task.add_done_callback(self._executing.discard)
+        return None
+
+    async def _execute(self, job: _SendJob) -> None:
+        """Run a dispatched job and hand its outcome to the submitter."""
+        try:
+            result = await job.fn()
+        except Exception as e:
+            if not job.future.done():
+                job.future.set_exception(e)
+        else:
+            if not job.future.done():
+                job.future.set_result(result)
+        finally:
+            self._in_flight -= 1
+            self._wakeup.set()
+
+    def _prune_buckets(self, now: float) -> None:
+        """Discard fully refilled buckets once too many accumulate."""
+        for buckets in (self._channel_buckets, self._guild_buckets):
+            if len(buckets) > self.MAX_IDLE_BUCKETS:
+                for key in [k for k, bucket in buckets.items() if bucket.is_full(now)]:
+                    del buckets[key]
+
+    async def _run(self) -> None:
+        """Dispatch loop: send what is ready, then sleep until a bucket refills or a job arrives."""
+        while True:
+            self._wakeup.clear()
+            delay = self._dispatch_ready()
+            self._prune_buckets(time.monotonic())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def stats(self) -> dict[str, Any]:
+        """Get queue sizes, in-flight count and per-priority dispatch stats."""
+        return {
+            "pending_interactive": len(self._interactive),
+            "pending_bulk": sum(len(jobs) for jobs in self._bulk.values()),
+            "guilds_waiting": len(self._guild_order),
+            "in_flight": self._in_flight,
+            "dispatched": dict(self.dispatched),
+            "avg_wait_ms": {
+                name: round(self._wait_total[name] / count * 1000, 1) if count else None
+                for name, count in self.dispatched.items()
+            },
+        }
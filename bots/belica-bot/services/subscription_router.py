@@ -0,0 +1,76 @@
+"""In-memory routing index from subscribed players to the guilds that follow them."""
+import logging
+from typing import Iterable, Optional
+
+from data import SubscribedProfile
+
+logger = logging.getLogger("belica.subscription_router")
+
+
+class SubscriptionRouter:
+    """Maps player_uuid -> {guild_id -> subscribed player name}.
+
+    Lets match posting find the guilds with a subscribed participant without
+    touching the database. Loaded once from all subscriptions and then kept in
+    sync by ProfileSubscription as subscriptions are added or removed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty routing index."""
+        self._routes: dict[str, dict[int, Optional[str]]] = {}
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    def load(self, profiles: Iterable[SubscribedProfile]) -> None:
+        """
+        Replace the index with the given subscriptions.
+
+        Args:
+            profiles: Every subscribed profile across all guilds
+        """
+        routes: dict[str, dict[int, Optional[str]]] = {}
+        count = 0
+        for profile in profiles:
+            routes.setdefault(profile.player_uuid, {})[profile.guild_id] = profile.player_name
+            count += 1
+        self._routes = routes
+        self.loaded = True
+        logger.info(f"Loaded routing index with {count} subscription(s) for {len(routes)} player(s)")
+
+    def add(self, guild_id: int, player_uuid: str, player_name: Optional[str] = None) -> None:
+        """Record a new subscription."""
+        self._routes.setdefault(player_uuid, {})[guild_id] = player_name
+
+    def remove(self, guild_id: int, player_uuid: str) -> None:
+        """Forget a subscription."""
+        guilds = self._routes.get(player_uuid)
+        if guilds is None:
+            return
+        guilds.pop(guild_id, None)
+        if not guilds:
+            del self._routes[player_uuid]
+
+    def clear_guild(self, guild_id: int) -> None:
+        """Forget every subscription for a guild."""
+        for player_uuid in [uuid for uuid, guilds in self._routes.items() if guild_id in guilds]:
+            self.remove(guild_id, player_uuid)
+
+    def route(self, player_uuids: Iterable[str]) -> dict[int, dict[str, Optional[str]]]:
+        """
+        Find the guilds subscribed to any of the given players.
+
+        Args:
+            player_uuids: UUIDs of the players in a match
+
+        Returns:
+            Dict mapping guild_id -> {player_uuid -> subscribed name} for the
+            subscribed participants in that guild. Guilds without a subscribed
+            participant are omitted.
+        """
+        guild_routes: dict[int, dict[str, Optional[str]]] = {}
+        for player_uuid in player_uuids:
+            for guild_id, player_name in self._routes.get(player_uuid, {}).items():
+                guild_routes.setdefault(guild_id, {})[player_uuid] = player_name
+        return guild_routes
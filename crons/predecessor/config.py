@@ -16,13 +16,26 @@ class Config:
     PRED_GG_OAUTH_API_URL: str = os.getenv("PRED_GG_OAUTH_API_URL", "")
     PRED_GG_CLIENT_ID: str = os.getenv("PRED_GG_CLIENT_ID", "")
     PRED_GG_CLIENT_SECRET: str = os.getenv("PRED_GG_CLIENT_SECRET", "")
+    # Gzip GraphQL request bodies of at least this many bytes (0 = off)
+    PRED_GG_COMPRESS_REQUESTS_OVER: int = int(os.getenv("PRED_GG_COMPRESS_REQUESTS_OVER", "0"))
 
     # Belica Bot HTTP endpoint
     BELICA_BOT_URL: str = os.getenv("BELICA_BOT_URL", "http://localhost:8080")
+    # Match payload encoding: auto (msgpack if installed, else JSON), msgpack or json
+    BOT_WIRE_FORMAT: str = os.getenv("BOT_WIRE_FORMAT", "auto").lower()
     
     # Cron job settings
     RECENT_MATCHES_CRON: str = os.getenv("RECENT_MATCHES_CRON", "* * * * *")  # Every 1 minute by default
     RECENT_MATCHES_INTERVAL_MINUTES: int = int(os.getenv("RECENT_MATCHES_INTERVAL_MINUTES", "10"))  # Look back 10 minutes
+
+    # In-memory processed match filter window (hours of match end times to remember)
+    PROCESSED_FILTER_WINDOW_HOURS: int = int(os.getenv("PROCESSED_FILTER_WINDOW_HOURS", "48"))
+
+    # processed_matches partition maintenance
+    PARTITION_MAINTENANCE_CRON: str = os.getenv("PARTITION_MAINTENANCE_CRON", "17 3 * * *")  # Daily at 03:17
+    PROCESSED_MATCHES_RETENTION_DAYS: int = int(os.getenv("PROCESSED_MATCHES_RETENTION_DAYS", "180"))
+    PROCESSED_MATCHES_PARTITIONS_AHEAD: int = int(os.getenv("PROCESSED_MATCHES_PARTITIONS_AHEAD", "3"))
+    PROCESSED_MATCHES_DETACH_EXPIRED: bool = os.getenv("PROCESSED_MATCHES_DETACH_EXPIRED", "false").lower() == "true"
     
     # Tracked player UUIDs (comma-separated)
     TRACKED_PLAYER_UUIDS: str = os.getenv("TRACKED_PLAYER_UUIDS", "")
@@ -0,0 +1,56 @@
+"""Cron job for maintaining monthly partitions of processed_matches."""
+import logging
+from datetime import timedelta
+
+from data import Database, ProcessedMatchPartitionRepository
+from config import Config
+
+logger = logging.getLogger("crons.partition_maintenance")
+
+
+async def partition_maintenance_job(db: Database | None = None) -> None:
+    """
+    Cron job that keeps processed_matches partitions in shape.
+
+    1. Creates monthly partitions ahead of time so inserts never miss a partition
+    2. Drops (or detaches) partitions entirely older than the retention period
+
+    Deduplication only needs rows newer than the oldest match a tick can fetch.
+    The recent matches job skips anything at or before a player's cursor, and
+    first-time players look back 24 hours, so any retention of at least a few
+    days (default 180) keeps dedup correct.
+
+    Args:
+        db: Optional long-lived Database shared across ticks. If None, a pool is
+            created for this run and closed afterwards.
+    """
+    logger.info("Starting partition maintenance job")
+
+    owns_db = db is None
+    if db is None:
+        db = Database()
+    partition_repo = ProcessedMatchPartitionRepository(db)
+
+    try:
+        await db.connect()
+
+        created = await partition_repo.ensure_future_partitions(
+            months_ahead=Config.PROCESSED_MATCHES_PARTITIONS_AHEAD
+        )
+        removed = await partition_repo.remove_expired_partitions(
+            retention=timedelta(days=Config.PROCESSED_MATCHES_RETENTION_DAYS),
+            detach_only=Config.PROCESSED_MATCHES_DETACH_EXPIRED,
+        )
+
+        logger.info(
+            f"Partition maintenance completed: "
+            f"{len(created)} created, {len(removed)} "
+            f"{'detached' if Config.PROCESSED_MATCHES_DETACH_EXPIRED else 'dropped'}"
+        )
+
+    except Exception as e:
+        logger.error(f"Error in partition maintenance job: {e}", exc_info=True)
+
+    finally:
+        if owns_db:
+            await db.close()
@@ -11,6 +11,7 @@ from data import (
 )
 from services.match_fetcher import MatchFetcher
 from services.bot_notifier import BotNotifier
+from services.processed_match_filter import ProcessedMatchFilter
 from config import Config
 
 logger = logging.getLogger("crons.recent_matches")
@@ -32,7 +33,11 @@ def parse_end_time(end_time_str: str) -> datetime | None:
         return None
 
 
-async def recent_matches_job() -> None:
+async def recent_matches_job(
+    db: Database | None = None,
+    match_filter: ProcessedMatchFilter | None = None,
+    bot_notifier: BotNotifier | None = None,
+) -> None:
     """
     Cron job that fetches recent matches and processes them.
 
@@ -41,6 +46,15 @@ async def recent_matches_job() -> None:
     2. If no cursor exists, looks back 24 hours
     3. Fetches matches from cursor time to now
     4. Updates cursor to latest match end time after processing
+
+    Args:
+        db: Optional long-lived Database shared across ticks. If None, a pool is
+            created for this run and closed afterwards.
+        match_filter: Optional long-lived filter of recently processed matches,
+            consulted before touching the database.
+        bot_notifier: Optional long-lived notifier shared across ticks, so the
+            negotiated payload format and HTTP session persist. If None, one is
+            created for this run and closed afterwards.
     """
     logger.info("Starting recent matches job")
 
@@ -50,18 +64,26 @@ async def recent_matches_job() -> None:
         oauth_token_url=Config.PRED_GG_OAUTH_API_URL or None,
         client_id=Config.PRED_GG_CLIENT_ID or None,
         client_secret=Config.PRED_GG_CLIENT_SECRET or None,
+        compress_requests_over=Config.PRED_GG_COMPRESS_REQUESTS_OVER,
     )
-    db = Database()
+    owns_db = db is None
+    if db is None:
+        db = Database()
     match_repo = ProcessedMatchRepository(db)
     profile_repo = SubscribedProfileRepository(db)
     cursor_repo = PlayerMatchCursorRepository(db)
     match_fetcher = MatchFetcher(api)
-    bot_notifier = BotNotifier()
+    owns_notifier = bot_notifier is None
+    if bot_notifier is None:
+        bot_notifier = BotNotifier()
 
     try:
         # Connect to database
         await db.connect()
 
+        if match_filter:
+            match_filter.prune()
+
         # Get player UUIDs from subscribed profiles in database
         subscribed_profiles = await profile_repo.get_all_subscriptions()
         player_uuids_from_db = list(set(profile.player_uuid for profile in subscribed_profiles))
@@ -118,8 +140,9 @@ async def recent_matches_job() -> None:
 
             logger.info(f"Player {player_uuid}: found {len(matches)} matches")
 
-            # Track the latest match end time for cursor update
+            # Track the latest match end time for cursor update, and what the cursor holds
             latest_end_time: datetime | None = None
+            cursor_time = last_match_time
 
             # Process each match (oldest to newest)
             for match_data in matches:
@@ -135,38 +158,70 @@ async def recent_matches_job() -> None:
                     if latest_end_time is None or match_end_time > latest_end_time:
                         latest_end_time = match_end_time
 
-                # Check if already processed
-                if await match_repo.is_match_processed(match_uuid):
-                    logger.debug(f"Match {match_uuid} already processed, skipping")
+                # Matches at or before the cursor were processed when the cursor was
+                # set (the cursor-boundary match), so skip them without a DB lookup.
+                # This also keeps dedup correct after old partitions are dropped.
+                if last_match_time and match_end_time and match_end_time <= last_match_time:
+                    logger.debug(f"Match {match_uuid} is at or before cursor, skipping")
+                    continue
+
+                # Matches shared with another subscribed player are usually
+                # already known in memory
+                if match_filter and match_filter.contains(match_uuid):
+                    logger.debug(f"Match {match_uuid} already processed (filter), skipping")
                     continue
 
-                # Mark as processed
+                # Claim the match: only the first insert wins
                 match_id = match_data.get("id", match_uuid)
-                await match_repo.mark_match_processed(match_uuid, match_id, end_time_str)
+                claimed = await match_repo.mark_match_processed(match_uuid, match_id, end_time_str)
+                if match_filter:
+                    match_filter.add(match_uuid, match_end_time)
+                if not claimed:
+                    logger.debug(f"Match {match_uuid} already processed, skipping")
+                    continue
                 total_processed += 1
 
-                # Notify bot
+                # Notify bot (outside any transaction: no pooled connection is held
+                # while the request is in flight)
                 success = await bot_notifier.notify_match(match_data)
+
+                # Record the notification and move the cursor past this match atomically
+                async with db.unit_of_work(transaction=True):
+                    if success:
+                        await match_repo.mark_match_notified(match_uuid, match_end_time)
+                    if latest_end_time and (cursor_time is None or latest_end_time > cursor_time):
+                        await cursor_repo.update_cursor(player_uuid, latest_end_time)
+                        cursor_time = latest_end_time
                 if success:
-                    await match_repo.mark_match_notified(match_uuid)
                     total_notified += 1
 
-            # Update cursor to latest match end time
-            if latest_end_time:
+            # Move the cursor past trailing matches that were skipped
+            if latest_end_time and (cursor_time is None or latest_end_time > cursor_time):
                 await cursor_repo.update_cursor(player_uuid, latest_end_time)
-                logger.debug(f"Player {player_uuid}: cursor updated to {latest_end_time}")
+                cursor_time = latest_end_time
+            if cursor_time != last_match_time:
+                logger.debug(f"Player {player_uuid}: cursor updated to {cursor_time}")
 
         logger.info(
             f"Recent matches job completed: "
             f"{total_processed} processed, {total_notified} notified"
         )
+        logger.debug(f"Statement stats: {db.statements.stats()}")
+        logger.debug(f"GraphQL compression: {api.compression_stats()}")
+        if match_filter:
+            logger.debug(
+                f"Processed match filter: {len(match_filter)} tracked, "
+                f"{match_filter.hits} hits, {match_filter.misses} misses"
+            )
 
     except Exception as e:
         logger.error(f"Error in recent matches job: {e}", exc_info=True)
 
     finally:
         # Cleanup
-        await bot_notifier.close()
-        await db.close()
+        if owns_notifier:
+            await bot_notifier.close()
+        if owns_db:
+            await db.close()
         await api.close()
 
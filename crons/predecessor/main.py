@@ -3,12 +3,16 @@ import asyncio
 import logging
 import signal
 import sys
+from datetime import datetime, timedelta
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from config import Config
-from data import DatabaseConfig
+from data import Database, DatabaseConfig, ProcessedMatchRepository
 from crons.recent_matches_job import recent_matches_job
+from crons.partition_maintenance_job import partition_maintenance_job
+from services.bot_notifier import BotNotifier
+from services.processed_match_filter import ProcessedMatchFilter
 
 # Configure logging
 logging.basicConfig(
@@ -26,34 +30,64 @@ class CronWorker:
         """Initialize the cron worker."""
         self.scheduler = AsyncIOScheduler()
         self.running = False
+        # Long-lived pool shared by every job tick, so prepared statements and
+        # connections survive between runs instead of being rebuilt each minute
+        self.db = Database()
+        self.match_filter = ProcessedMatchFilter(
+            window=timedelta(hours=Config.PROCESSED_FILTER_WINDOW_HOURS)
+        )
+        # Shared too, so a fallback to JSON is remembered after the first rejection
+        self.bot_notifier = BotNotifier()
     
-    def setup_jobs(self) -> None:
-        """Set up all cron jobs."""
-        # Parse cron expression (e.g., "*/5 * * * *" for every 5 minutes)
-        cron_parts = Config.RECENT_MATCHES_CRON.split()
+    @staticmethod
+    def _cron_trigger(expression: str, default: str) -> CronTrigger:
+        """Build a CronTrigger from a 5-field cron expression, falling back to default."""
+        cron_parts = expression.split()
         if len(cron_parts) != 5:
             logger.warning(
-                f"Invalid cron expression: {Config.RECENT_MATCHES_CRON}. "
-                f"Using default: */5 * * * *"
+                f"Invalid cron expression: {expression}. "
+                f"Using default: {default}"
             )
-            cron_parts = ["*/5", "*", "*", "*", "*"]
-        
-        # Add recent matches job
+            cron_parts = default.split()
+
+        return CronTrigger(
+            minute=cron_parts[0],
+            hour=cron_parts[1],
+            day=cron_parts[2],
+            month=cron_parts[3],
+            day_of_week=cron_parts[4]
+        )
+
+    def setup_jobs(self) -> None:
+        """Set up all cron jobs."""
+        # Add recent matches job (e.g., "*/5 * * * *" for every 5 minutes)
         self.scheduler.add_job(
             recent_matches_job,
-            trigger=CronTrigger(
-                minute=cron_parts[0],
-                hour=cron_parts[1],
-                day=cron_parts[2],
-                month=cron_parts[3],
-                day_of_week=cron_parts[4]
-            ),
+            trigger=self._cron_trigger(Config.RECENT_MATCHES_CRON, "*/5 * * * *"),
+            kwargs={"db": self.db, "match_filter": self.match_filter, "bot_notifier": self.bot_notifier},
             id="recent_matches",
             name="Fetch Recent Matches",
             replace_existing=True
         )
         
         logger.info(f"Added job 'Fetch Recent Matches' with schedule: {Config.RECENT_MATCHES_CRON}")
+
+        # Add partition maintenance job, also run once at startup so the
+        # current and upcoming months always have a partition
+        self.scheduler.add_job(
+            partition_maintenance_job,
+            trigger=self._cron_trigger(Config.PARTITION_MAINTENANCE_CRON, "17 3 * * *"),
+            kwargs={"db": self.db},
+            id="partition_maintenance",
+            name="Processed Matches Partition Maintenance",
+            next_run_time=datetime.now(),
+            replace_existing=True
+        )
+
+        logger.info(
+            f"Added job 'Processed Matches Partition Maintenance' with schedule: "
+            f"{Config.PARTITION_MAINTENANCE_CRON}"
+        )
     
     def start(self) -> None:
         """Start the cron worker."""
@@ -77,6 +111,8 @@ class CronWorker:
     
     async def run_forever(self) -> None:
         """Run the cron worker until interrupted."""
+        await self.db.connect()
+        await self.match_filter.seed(ProcessedMatchRepository(self.db))
         self.start()
         
         # Set up signal handlers for graceful shutdown
@@ -95,6 +131,9 @@ class CronWorker:
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
             self.stop()
+        finally:
+            await self.bot_notifier.close()
+            await self.db.close()
 
 
 async def main() -> None:
@@ -4,6 +4,12 @@ import aiohttp
 from typing import Optional
 
 from config import Config
+from predecessor_api import (
+    JSON_CONTENT_TYPE,
+    MSGPACK_CONTENT_TYPE,
+    encode_match,
+    msgpack_available,
+)
 
 logger = logging.getLogger("crons.bot_notifier")
 
@@ -14,8 +20,20 @@ class BotNotifier:
     def __init__(self) -> None:
         """Initialize the bot notifier."""
         self.bot_url = Config.BELICA_BOT_URL
+        self.content_type = self._choose_content_type(Config.BOT_WIRE_FORMAT)
         self._session: Optional[aiohttp.ClientSession] = None
     
+    @staticmethod
+    def _choose_content_type(wire_format: str) -> str:
+        """Pick the request encoding for a BOT_WIRE_FORMAT setting."""
+        if wire_format == "json":
+            return JSON_CONTENT_TYPE
+        if msgpack_available():
+            return MSGPACK_CONTENT_TYPE
+        if wire_format == "msgpack":
+            logger.warning("BOT_WIRE_FORMAT=msgpack but msgpack is not installed, using JSON")
+        return JSON_CONTENT_TYPE
+    
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create the aiohttp session."""
         if self._session is None or self._session.closed:
@@ -35,26 +53,52 @@ class BotNotifier:
             match_data: Match data dictionary from the API
             
         Returns:
-            True if notification was successful, False otherwise
+            True if the bot accepted the notification, False otherwise
         """
         try:
             session = await self._get_session()
-            async with session.post(
-                f"{self.bot_url}/api/matches",
-                json=match_data,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
-                if response.status == 200:
-                    logger.info(f"Successfully notified bot about match {match_data.get('uuid')}")
-                    return True
-                else:
-                    error_text = await response.text()
-                    logger.error(
-                        f"Bot notification failed for match {match_data.get('uuid')}: "
-                        f"HTTP {response.status} - {error_text}"
-                    )
-                    return False
+            status, error_text = await self._post(session, match_data, self.content_type)
+            if status == 415 and self.content_type != JSON_CONTENT_TYPE:
+                # Bot cannot decode the compact format (older bot or msgpack missing)
+                logger.warning(
+                    f"Bot rejected {self.content_type} payloads, falling back to JSON"
+                )
+                self.content_type = JSON_CONTENT_TYPE
+                status, error_text = await self._post(session, match_data, self.content_type)
+            
+            # 202: queued for delivery by the bot; 200: posted synchronously (older bots)
+            if status in (200, 202):
+                logger.info(f"Successfully notified bot about match {match_data.get('uuid')}")
+                return True
+            else:
+                logger.error(
+                    f"Bot notification failed for match {match_data.get('uuid')}: "
+                    f"HTTP {status} - {error_text}"
+                )
+                return False
         except Exception as e:
             logger.error(f"Error notifying bot about match {match_data.get('uuid')}: {e}")
             return False
 
+    
+    async def _post(
+        self,
+        session: aiohttp.ClientSession,
+        match_data: dict,
+        content_type: str
+    ) -> tuple[int, str]:
+        """
+        POST a match to the bot in the given encoding.
+        
+        Returns:
+            Tuple of (HTTP status, response text for non-2xx responses)
+        """
+        async with session.post(
+            f"{self.bot_url}/api/matches",
+            data=encode_match(match_data, content_type),
+            headers={"Content-Type": content_type},
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as response:
+            if response.status in (200, 202):
+                return response.status, ""
+            return response.status, await response.text()
@@ -0,0 +1,78 @@
+"""In-memory filter of recently processed matches in front of the database."""
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from data import ProcessedMatchRepository
+
+logger = logging.getLogger("crons.processed_match_filter")
+
+
+class ProcessedMatchFilter:
+    """Tracks match UUIDs processed within a sliding end_time window.
+
+    Answers "definitely processed" without a database round trip. Anything the
+    filter does not know about falls through to the database claim
+    (ProcessedMatchRepository.mark_match_processed), so a miss is always safe.
+
+    This is an exact set rather than a Bloom/cuckoo filter: a false positive
+    would silently drop a match that was never posted, and the window only ever
+    holds a few hundred UUIDs.
+    """
+
+    def __init__(self, window: timedelta) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            window: How far back (by match end time) to remember processed matches
+        """
+        self.window = window
+        self._seen: dict[str, datetime] = {}  # match_uuid -> end_time
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    async def seed(self, match_repo: ProcessedMatchRepository, now: Optional[datetime] = None) -> int:
+        """
+        Load matches processed within the window from the database.
+
+        Args:
+            match_repo: Repository to read processed matches from
+            now: Reference time (defaults to current UTC time)
+
+        Returns:
+            Number of matches loaded
+        """
+        since = (now or datetime.now(timezone.utc)) - self.window
+        for match_uuid, end_time in await match_repo.get_recent_matches(since):
+            self._seen[match_uuid] = end_time
+        logger.info(f"Seeded processed match filter with {len(self._seen)} match(es)")
+        return len(self._seen)
+
+    def add(self, match_uuid: str, end_time: Optional[datetime] = None) -> None:
+        """Record a match as processed (call after every claim)."""
+        self._seen[match_uuid] = end_time or datetime.now(timezone.utc)
+
+    def contains(self, match_uuid: str) -> bool:
+        """Check whether a match is definitely processed."""
+        if match_uuid in self._seen:
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def prune(self, now: Optional[datetime] = None) -> int:
+        """
+        Forget matches that ended before the window.
+
+        Returns:
+            Number of entries removed
+        """
+        cutoff = (now or datetime.now(timezone.utc)) - self.window
+        expired = [uuid for uuid, end_time in self._seen.items() if end_time < cutoff]
+        for uuid in expired:
+            del self._seen[uuid]
+        return len(expired)
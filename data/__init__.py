@@ -1,10 +1,13 @@
 """Shared data layer package for database and data entity management."""
 from .config import DatabaseConfig
 from .connection import Database
+from .statements import StatementRegistry, HOT_STATEMENTS
+from .notifications import ConfigChange, ConfigChangeListener, CONFIG_CHANGES_CHANNEL
 from .predecessor import ProcessedMatch, PlayerMatchCursor
 from .belica_bot import SubscribedProfile, TargetChannel
 from .repositories import (
     ProcessedMatchRepository,
+    ProcessedMatchPartitionRepository,
     SubscribedProfileRepository,
     TargetChannelRepository,
     PlayerMatchCursorRepository,
@@ -14,6 +17,11 @@ __all__ = [
     # Config & Connection
     "DatabaseConfig",
     "Database",
+    "StatementRegistry",
+    "HOT_STATEMENTS",
+    "ConfigChange",
+    "ConfigChangeListener",
+    "CONFIG_CHANGES_CHANNEL",
     # Entities
     "ProcessedMatch",
     "PlayerMatchCursor",
@@ -21,6 +29,7 @@ __all__ = [
     "TargetChannel",
     # Repositories
     "ProcessedMatchRepository",
+    "ProcessedMatchPartitionRepository",
     "PlayerMatchCursorRepository",
     "SubscribedProfileRepository",
     "TargetChannelRepository",
@@ -16,16 +16,32 @@ class DatabaseConfig:
     """
 
     def __init__(
-        self, database_url: str | None = None, schema: str | None = None
+        self,
+        database_url: str | None = None,
+        schema: str | None = None,
+        pool_min_size: int | None = None,
+        pool_max_size: int | None = None,
+        max_inactive_connection_lifetime: float | None = None,
+        statement_cache_size: int | None = None,
     ) -> None:
-        """Initialize config with optional explicit database URL and schema.
+        """Initialize config with optional explicit database URL, schema and pool settings.
 
         Args:
             database_url: If provided, use this URL instead of environment variables.
             schema: If provided, use this schema instead of environment variable.
+            pool_min_size: Minimum pool connections (env: DB_POOL_MIN_SIZE).
+            pool_max_size: Maximum pool connections (env: DB_POOL_MAX_SIZE).
+            max_inactive_connection_lifetime: Seconds before an idle pooled connection
+                is closed (env: DB_POOL_MAX_INACTIVE_LIFETIME).
+            statement_cache_size: asyncpg prepared statement cache size per connection
+                (env: DB_STATEMENT_CACHE_SIZE).
         """
         self._database_url = database_url
         self._schema = schema
+        self._pool_min_size = pool_min_size
+        self._pool_max_size = pool_max_size
+        self._max_inactive_connection_lifetime = max_inactive_connection_lifetime
+        self._statement_cache_size = statement_cache_size
 
     def get_database_url(self) -> str:
         """Get the database connection URL."""
@@ -52,9 +68,35 @@ class DatabaseConfig:
             return self._schema
         return os.getenv("DB_SCHEMA", "predecessor")
 
+    def get_pool_min_size(self) -> int:
+        """Get the minimum number of pooled connections."""
+        if self._pool_min_size is not None:
+            return self._pool_min_size
+        return int(os.getenv("DB_POOL_MIN_SIZE", "1"))
+
+    def get_pool_max_size(self) -> int:
+        """Get the maximum number of pooled connections."""
+        if self._pool_max_size is not None:
+            return self._pool_max_size
+        return int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+
+    def get_max_inactive_connection_lifetime(self) -> float:
+        """Get the idle lifetime (seconds) after which pooled connections are closed."""
+        if self._max_inactive_connection_lifetime is not None:
+            return self._max_inactive_connection_lifetime
+        return float(os.getenv("DB_POOL_MAX_INACTIVE_LIFETIME", "300"))
+
+    def get_statement_cache_size(self) -> int:
+        """Get the asyncpg prepared statement cache size per connection."""
+        if self._statement_cache_size is not None:
+            return self._statement_cache_size
+        return int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
+
     def validate(self) -> None:
         """Validate that required configuration is present."""
         db_url = self.get_database_url()
         if not db_url or db_url == "postgresql://postgres:@localhost:5432/hobbydata":
             raise ValueError("DATABASE_URL or DB_* environment variables must be set")
+        if self.get_pool_min_size() > self.get_pool_max_size():
+            raise ValueError("DB_POOL_MIN_SIZE must not exceed DB_POOL_MAX_SIZE")
 
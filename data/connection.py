@@ -1,9 +1,13 @@
 """Database connection management."""
+import asyncio
 import asyncpg
 import logging
-from typing import Optional
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Optional
 
 from .config import DatabaseConfig
+from .statements import StatementRegistry
 
 logger = logging.getLogger("data.connection")
 
@@ -20,6 +24,14 @@ class Database:
         """
         self.config = config or DatabaseConfig()
         self._pool: Optional[asyncpg.Pool] = None
+        # Hot statements prepared on every new pooled connection
+        self.statements = StatementRegistry()
+        # Serializes connect() so concurrent callers sharing this instance get one pool
+        self._connect_lock = asyncio.Lock()
+        # Connection bound by an active unit_of_work() in the current task, if any
+        self._uow_connection: ContextVar[Optional[asyncpg.Connection]] = ContextVar(
+            f"data_uow_connection_{id(self)}", default=None
+        )
     
     async def connect(self, run_migrations: bool = False) -> None:
         """Create the database connection pool.
@@ -28,27 +40,55 @@ class Database:
             run_migrations: If True, run schema initialization (for testing only).
                            Production should use: alembic upgrade head
         """
+        async with self._connect_lock:
+            await self._connect(run_migrations)
+
+    def _get_dsn(self) -> str:
+        """Get the asyncpg connection URL from config."""
+        # Parse DATABASE_URL or use individual parameters
+        db_url = self.config.get_database_url()
+
+        # asyncpg uses postgres:// but we might have postgresql:// from Config
+        # Convert postgresql:// to postgres:// if needed
+        if db_url.startswith("postgresql://"):
+            db_url = db_url.replace("postgresql://", "postgres://", 1)
+        return db_url
+
+    async def connect_dedicated(self) -> asyncpg.Connection:
+        """Open a standalone connection outside the pool.
+
+        For long-lived sessions such as LISTEN, which would otherwise pin a
+        pooled connection forever. The caller must close it.
+        """
+        return await asyncpg.connect(
+            self._get_dsn(),
+            server_settings={"search_path": f"{self.config.get_schema()}, public"},
+        )
+
+    async def _connect(self, run_migrations: bool) -> None:
+        """Create the pool if it does not exist yet (caller holds _connect_lock)."""
         if self._pool is None:
-            # Parse DATABASE_URL or use individual parameters
-            db_url = self.config.get_database_url()
+            db_url = self._get_dsn()
             schema = self.config.get_schema()
 
-            # asyncpg uses postgres:// but we might have postgresql:// from Config
-            # Convert postgresql:// to postgres:// if needed
-            if db_url.startswith("postgresql://"):
-                db_url = db_url.replace("postgresql://", "postgres://", 1)
-
             # Set search_path via server_settings so it persists across connection reuse
-            # Note: Using init= callback doesn't work because asyncpg resets connection
-            # state when returning connections to the pool
+            # Note: Using init= callback doesn't work for that because asyncpg resets
+            # connection state when returning connections to the pool. Prepared
+            # statements survive the reset, so init= is used to warm the hot ones.
             self._pool = await asyncpg.create_pool(
                 db_url,
-                min_size=1,
-                max_size=10,
+                min_size=self.config.get_pool_min_size(),
+                max_size=self.config.get_pool_max_size(),
+                max_inactive_connection_lifetime=self.config.get_max_inactive_connection_lifetime(),
+                statement_cache_size=self.config.get_statement_cache_size(),
                 command_timeout=60,
-                server_settings={"search_path": f"{schema}, public"}
+                server_settings={"search_path": f"{schema}, public"},
+                init=self.statements.prepare_connection,
+            )
+            logger.info(
+                f"Database connection pool created (schema: {schema}, "
+                f"size: {self.config.get_pool_min_size()}-{self.config.get_pool_max_size()})"
             )
-            logger.info(f"Database connection pool created (schema: {schema})")
 
             # Schema initialization - only for testing
             # Production uses: cd data && alembic upgrade head
@@ -62,16 +102,15 @@ class Database:
             # Create schema if it doesn't exist
             await conn.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
             await conn.execute("""
+                -- Partitioned by month on end_time (migration 005)
                 CREATE TABLE IF NOT EXISTS processed_matches (
-                    match_uuid TEXT PRIMARY KEY,
+                    match_uuid TEXT NOT NULL,
                     match_id TEXT NOT NULL,
                     end_time TIMESTAMP WITH TIME ZONE NOT NULL,
                     processed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
-                    notified_bot BOOLEAN NOT NULL DEFAULT FALSE
-                );
-                
-                CREATE INDEX IF NOT EXISTS idx_processed_matches_end_time 
-                    ON processed_matches(end_time);
+                    notified_bot BOOLEAN NOT NULL DEFAULT FALSE,
+                    PRIMARY KEY (match_uuid, end_time)
+                ) PARTITION BY RANGE (end_time);
                 
                 CREATE INDEX IF NOT EXISTS idx_processed_matches_processed_at 
                     ON processed_matches(processed_at);
@@ -118,8 +157,36 @@ class Database:
 
                 CREATE INDEX IF NOT EXISTS idx_processed_matches_notified_bot_processed_at
                     ON processed_matches(notified_bot, processed_at);
+
+                -- Change notifications for configuration caches (migration 006)
+                CREATE OR REPLACE FUNCTION notify_config_change() RETURNS trigger AS $$
+                BEGIN
+                    PERFORM pg_notify('belica_config_changes', json_build_object(
+                        'schema', TG_TABLE_SCHEMA,
+                        'table', TG_TABLE_NAME,
+                        'op', TG_OP,
+                        'old', CASE WHEN TG_OP IN ('UPDATE', 'DELETE') THEN row_to_json(OLD) END,
+                        'new', CASE WHEN TG_OP IN ('INSERT', 'UPDATE') THEN row_to_json(NEW) END
+                    )::text);
+                    RETURN NULL;
+                END;
+                $$ LANGUAGE plpgsql;
+
+                DROP TRIGGER IF EXISTS trg_target_channels_notify ON target_channels;
+                CREATE TRIGGER trg_target_channels_notify
+                    AFTER INSERT OR UPDATE OR DELETE ON target_channels
+                    FOR EACH ROW EXECUTE FUNCTION notify_config_change();
+
+                DROP TRIGGER IF EXISTS trg_subscribed_profiles_notify ON subscribed_profiles;
+                CREATE TRIGGER trg_subscribed_profiles_notify
+                    AFTER INSERT OR UPDATE OR DELETE ON subscribed_profiles
+                    FOR EACH ROW EXECUTE FUNCTION notify_config_change();
             """)
-            logger.info("Database schema initialized")
+
+        # Import here to avoid circular imports (repositories depend on Database)
+        from .repositories.processed_match_partition import ProcessedMatchPartitionRepository
+        await ProcessedMatchPartitionRepository(self).ensure_future_partitions()
+        logger.info("Database schema initialized")
     
     async def close(self) -> None:
         """Close the database connection pool."""
@@ -128,6 +195,88 @@ class Database:
             self._pool = None
             logger.info("Database connection pool closed")
     
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[asyncpg.Connection]:
+        """Acquire a connection for a single repository operation.
+
+        Inside a unit_of_work() this yields the connection bound to the unit of
+        work, so consecutive repository calls share it. Otherwise a connection is
+        checked out of the pool for the duration of the block.
+        """
+        conn = self._uow_connection.get()
+        if conn is not None:
+            yield conn
+            return
+
+        async with self.pool.acquire() as conn:
+            yield conn
+
+    @asynccontextmanager
+    async def unit_of_work(self, transaction: bool = False) -> AsyncIterator[asyncpg.Connection]:
+        """Run repository calls on one shared connection.
+
+        Every repository using this Database inside the block runs on the same
+        pooled connection instead of acquiring its own per call.
+
+        Args:
+            transaction: If True, wrap the block in a transaction that commits on
+                         success and rolls back on exception. Nested units of work
+                         reuse the outer connection and use a savepoint.
+
+        Tasks spawned inside the block inherit the bound connection, and an
+        asyncpg connection runs one query at a time, so do not fan out
+        concurrent repository calls from inside a unit of work.
+
+        Example:
+            async with db.unit_of_work(transaction=True):
+                await match_repo.mark_match_processed(uuid, match_id, end_time)
+                await cursor_repo.update_cursor(player_uuid, end_time)
+        """
+        conn = self._uow_connection.get()
+        if conn is not None:
+            # Nested unit of work: share the outer connection
+            if transaction:
+                async with conn.transaction():
+                    yield conn
+            else:
+                yield conn
+            return
+
+        async with self.pool.acquire() as conn:
+            token = self._uow_connection.set(conn)
+            try:
+                if transaction:
+                    async with conn.transaction():
+                        yield conn
+                else:
+                    yield conn
+            finally:
+                self._uow_connection.reset(token)
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the connection pool has been created."""
+        return self._pool is not None
+
+    def pool_stats(self) -> dict[str, int]:
+        """Get connection pool utilization.
+
+        Returns:
+            Dict with pool size, idle and in-use connection counts, and the
+            configured min/max sizes. All zero if not connected.
+        """
+        if self._pool is None:
+            return {"size": 0, "idle": 0, "in_use": 0, "min_size": 0, "max_size": 0}
+        size = self._pool.get_size()
+        idle = self._pool.get_idle_size()
+        return {
+            "size": size,
+            "idle": idle,
+            "in_use": size - idle,
+            "min_size": self._pool.get_min_size(),
+            "max_size": self._pool.get_max_size(),
+        }
+
     @property
     def pool(self) -> asyncpg.Pool:
         """Get the connection pool."""
@@ -0,0 +1,135 @@
+"""Range-partition processed_matches by end_time (monthly)
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+
+Converts processed_matches into a table partitioned by RANGE (end_time) with
+one partition per calendar month (UTC), named processed_matches_YYYY_MM.
+
+- Partitioned tables require the partition key in the primary key, so the
+  primary key becomes (match_uuid, end_time). A match's end_time never changes,
+  so this is still unique per match.
+- Partitions are created from the oldest existing row through three months
+  ahead. The cron maintenance job keeps creating future partitions and drops
+  (or detaches) partitions older than the retention period.
+- There is no DEFAULT partition: attaching a new range would have to scan it.
+  ProcessedMatchRepository creates a missing partition on demand instead.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Move the existing table (and its PK/index names) out of the way
+    op.execute("ALTER TABLE processed_matches RENAME TO processed_matches_legacy")
+    op.execute("""
+        ALTER TABLE processed_matches_legacy
+            RENAME CONSTRAINT processed_matches_pkey TO processed_matches_legacy_pkey
+    """)
+    op.execute("DROP INDEX IF EXISTS idx_processed_matches_end_time")
+    op.execute("DROP INDEX IF EXISTS idx_processed_matches_processed_at")
+    op.execute("DROP INDEX IF EXISTS idx_processed_matches_notified_bot_processed_at")
+
+    op.execute("""
+        CREATE TABLE processed_matches (
+            match_uuid TEXT NOT NULL,
+            match_id TEXT NOT NULL,
+            end_time TIMESTAMP WITH TIME ZONE NOT NULL,
+            processed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+            notified_bot BOOLEAN NOT NULL DEFAULT FALSE,
+            PRIMARY KEY (match_uuid, end_time)
+        ) PARTITION BY RANGE (end_time)
+    """)
+
+    # Monthly partitions (UTC boundaries) covering existing rows through 3 months ahead
+    op.execute("""
+        DO $$
+        DECLARE
+            month_start TIMESTAMP;
+            last_month TIMESTAMP;
+        BEGIN
+            month_start := date_trunc(
+                'month',
+                COALESCE((SELECT MIN(end_time) FROM processed_matches_legacy), NOW())
+                    AT TIME ZONE 'UTC'
+            );
+            last_month := date_trunc('month', NOW() AT TIME ZONE 'UTC') + INTERVAL '3 months';
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF processed_matches FOR VALUES FROM (%L) TO (%L)',
+                    'processed_matches_' || to_char(month_start, 'YYYY_MM'),
+                    to_char(month_start, 'YYYY-MM-DD HH24:MI:SS') || '+00',
+                    to_char(month_start + INTERVAL '1 month', 'YYYY-MM-DD HH24:MI:SS') || '+00'
+                );
+                month_start := month_start + INTERVAL '1 month';
+            END LOOP;
+        END $$
+    """)
+
+    op.execute("""
+        INSERT INTO processed_matches (match_uuid, match_id, end_time, processed_at, notified_bot)
+        SELECT match_uuid, match_id, end_time, processed_at, notified_bot
+        FROM processed_matches_legacy
+    """)
+    op.execute("DROP TABLE processed_matches_legacy")
+
+    # Indexes on the parent cascade to every partition.
+    # (match_uuid, end_time) is covered by the primary key; match_uuid-only
+    # lookups use its leading column.
+    op.execute("""
+        CREATE INDEX idx_processed_matches_processed_at
+            ON processed_matches(processed_at)
+    """)
+    op.execute("""
+        CREATE INDEX idx_processed_matches_notified_bot_processed_at
+            ON processed_matches(notified_bot, processed_at)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE processed_matches RENAME TO processed_matches_partitioned")
+    op.execute("""
+        ALTER TABLE processed_matches_partitioned
+            RENAME CONSTRAINT processed_matches_pkey TO processed_matches_partitioned_pkey
+    """)
+    op.execute("DROP INDEX IF EXISTS idx_processed_matches_processed_at")
+    op.execute("DROP INDEX IF EXISTS idx_processed_matches_notified_bot_processed_at")
+
+    op.execute("""
+        CREATE TABLE processed_matches (
+            match_uuid TEXT PRIMARY KEY,
+            match_id TEXT NOT NULL,
+            end_time TIMESTAMP WITH TIME ZONE NOT NULL,
+            processed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+            notified_bot BOOLEAN NOT NULL DEFAULT FALSE
+        )
+    """)
+    op.execute("""
+        INSERT INTO processed_matches (match_uuid, match_id, end_time, processed_at, notified_bot)
+        SELECT match_uuid, match_id, end_time, processed_at, notified_bot
+        FROM processed_matches_partitioned
+        ON CONFLICT (match_uuid) DO NOTHING
+    """)
+    # Dropping the parent drops every attached partition
+    op.execute("DROP TABLE processed_matches_partitioned")
+
+    op.execute("""
+        CREATE INDEX idx_processed_matches_end_time
+            ON processed_matches(end_time)
+    """)
+    op.execute("""
+        CREATE INDEX idx_processed_matches_processed_at
+            ON processed_matches(processed_at)
+    """)
+    op.execute("""
+        CREATE INDEX idx_processed_matches_notified_bot_processed_at
+            ON processed_matches(notified_bot, processed_at)
+    """)
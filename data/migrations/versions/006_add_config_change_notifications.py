@@ -0,0 +1,53 @@
+"""Notify listeners when target channels or subscriptions change
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+
+Adds row-level triggers on target_channels and subscribed_profiles that send
+a pg_notify on the 'belica_config_changes' channel. The bot listens on it to
+invalidate its in-memory configuration cache. Payload (JSON):
+{"schema": ..., "table": ..., "op": "INSERT|UPDATE|DELETE", "old": {...}, "new": {...}}
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_config_change() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('belica_config_changes', json_build_object(
+                'schema', TG_TABLE_SCHEMA,
+                'table', TG_TABLE_NAME,
+                'op', TG_OP,
+                'old', CASE WHEN TG_OP IN ('UPDATE', 'DELETE') THEN row_to_json(OLD) END,
+                'new', CASE WHEN TG_OP IN ('INSERT', 'UPDATE') THEN row_to_json(NEW) END
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_target_channels_notify
+            AFTER INSERT OR UPDATE OR DELETE ON target_channels
+            FOR EACH ROW EXECUTE FUNCTION notify_config_change()
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_subscribed_profiles_notify
+            AFTER INSERT OR UPDATE OR DELETE ON subscribed_profiles
+            FOR EACH ROW EXECUTE FUNCTION notify_config_change()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_subscribed_profiles_notify ON subscribed_profiles")
+    op.execute("DROP TRIGGER IF EXISTS trg_target_channels_notify ON target_channels")
+    op.execute("DROP FUNCTION IF EXISTS notify_config_change()")
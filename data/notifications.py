@@ -0,0 +1,131 @@
+"""LISTEN/NOTIFY subscriber for configuration table changes."""
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+import asyncpg
+
+from .connection import Database
+
+logger = logging.getLogger("data.notifications")
+
+# Channel the notify_config_change() trigger publishes on (migration 006)
+CONFIG_CHANGES_CHANNEL = "belica_config_changes"
+
+
+@dataclass(frozen=True)
+class ConfigChange:
+    """A row change on target_channels or subscribed_profiles."""
+    table: str
+    op: str  # INSERT, UPDATE or DELETE
+    old: Optional[dict[str, Any]]
+    new: Optional[dict[str, Any]]
+
+    @property
+    def guild_ids(self) -> set[int]:
+        """Guild IDs touched by the change (old and new rows)."""
+        return {int(row["guild_id"]) for row in (self.old, self.new) if row}
+
+
+ChangeCallback = Callable[[Optional[ConfigChange]], Awaitable[None]]
+
+
+class ConfigChangeListener:
+    """Listens for configuration changes on a dedicated connection.
+
+    Callbacks receive a ConfigChange for every row change in this database's
+    schema. After the connection drops and is re-established they receive None,
+    meaning notifications may have been missed and everything should be reloaded.
+    """
+
+    def __init__(self, db: Database, reconnect_delay: float = 5.0) -> None:
+        """
+        Initialize the listener.
+
+        Args:
+            db: Database to listen on (a dedicated connection is opened)
+            reconnect_delay: Seconds to wait between reconnect attempts
+        """
+        self.db = db
+        self.reconnect_delay = reconnect_delay
+        self._callbacks: list[ChangeCallback] = []
+        self._conn: Optional[asyncpg.Connection] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._stopped = False
+
+    def add_callback(self, callback: ChangeCallback) -> None:
+        """Register a coroutine called for every change (or None after reconnect)."""
+        self._callbacks.append(callback)
+
+    @property
+    def is_listening(self) -> bool:
+        """Whether the listening connection is currently open."""
+        return self._conn is not None and not self._conn.is_closed()
+
+    async def start(self) -> None:
+        """Open the dedicated connection and start listening."""
+        self._stopped = False
+        self._conn = await self.db.connect_dedicated()
+        self._conn.add_termination_listener(self._on_terminated)
+        await self._conn.add_listener(CONFIG_CHANGES_CHANNEL, self._on_notification)
+        logger.info(f"Listening for configuration changes on '{CONFIG_CHANGES_CHANNEL}'")
+
+    async def stop(self) -> None:
+        """Stop listening and close the dedicated connection."""
+        self._stopped = True
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self._conn and not self._conn.is_closed():
+            await self._conn.close()
+        self._conn = None
+
+    def _on_notification(
+        self, conn: asyncpg.Connection, pid: int, channel: str, payload: str
+    ) -> None:
+        """Parse a notification and dispatch it to callbacks."""
+        try:
+            data = json.loads(payload)
+        except json.JSONDecodeError:
+            logger.warning(f"Ignoring malformed config change payload: {payload[:200]}")
+            return
+        # NOTIFY is database-wide; ignore changes from other schemas
+        if data.get("schema") != self.db.config.get_schema():
+            return
+        change = ConfigChange(
+            table=data.get("table", ""),
+            op=data.get("op", ""),
+            old=data.get("old"),
+            new=data.get("new"),
+        )
+        asyncio.create_task(self._dispatch(change))
+
+    def _on_terminated(self, conn: asyncpg.Connection) -> None:
+        """Schedule a reconnect when the listening connection drops."""
+        if self._stopped:
+            return
+        logger.warning("Config change listener connection lost; reconnecting")
+        self._conn = None
+        self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        """Reconnect until successful, then tell callbacks to reload everything."""
+        while not self._stopped:
+            try:
+                await self.start()
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning(f"Config change listener reconnect failed: {e}")
+                await asyncio.sleep(self.reconnect_delay)
+                continue
+            await self._dispatch(None)
+            return
+
+    async def _dispatch(self, change: Optional[ConfigChange]) -> None:
+        """Run every callback, logging (not raising) failures."""
+        for callback in self._callbacks:
+            try:
+                await callback(change)
+            except Exception as e:
+                logger.error(f"Config change callback failed: {e}", exc_info=True)
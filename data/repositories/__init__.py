@@ -1,11 +1,13 @@
 """Repository classes for data access."""
 from .processed_match import ProcessedMatchRepository
+from .processed_match_partition import ProcessedMatchPartitionRepository
 from .subscribed_profile import SubscribedProfileRepository
 from .target_channel import TargetChannelRepository
 from .player_match_cursor import PlayerMatchCursorRepository
 
 __all__ = [
     "ProcessedMatchRepository",
+    "ProcessedMatchPartitionRepository",
     "SubscribedProfileRepository",
     "TargetChannelRepository",
     "PlayerMatchCursorRepository",
@@ -31,11 +31,8 @@ class PlayerMatchCursorRepository:
         Returns:
             PlayerMatchCursor if exists, None otherwise
         """
-        async with self.db.pool.acquire() as conn:
-            row = await conn.fetchrow(
-                "SELECT * FROM player_match_cursors WHERE player_uuid = $1",
-                player_uuid
-            )
+        async with self.db.acquire() as conn:
+            row = await self.db.statements.fetchrow(conn, "cursor_by_player", player_uuid)
             if row:
                 return PlayerMatchCursor.from_row(dict(row))
             return None
@@ -50,10 +47,9 @@ class PlayerMatchCursorRepository:
         Returns:
             The last match end time if exists, None otherwise
         """
-        async with self.db.pool.acquire() as conn:
-            result = await conn.fetchval(
-                "SELECT last_match_end_time FROM player_match_cursors WHERE player_uuid = $1",
-                player_uuid
+        async with self.db.acquire() as conn:
+            result = await self.db.statements.fetchval(
+                conn, "cursor_last_match_time", player_uuid
             )
             return result
 
@@ -65,7 +61,7 @@ class PlayerMatchCursorRepository:
             player_uuid: The player's UUID
             last_match_end_time: The end time of the latest match
         """
-        async with self.db.pool.acquire() as conn:
+        async with self.db.acquire() as conn:
             await conn.execute("""
                 INSERT INTO player_match_cursors (player_uuid, last_match_end_time, updated_at)
                 VALUES ($1, $2, NOW())
@@ -76,7 +72,7 @@ class PlayerMatchCursorRepository:
 
     async def get_all_cursors(self) -> list[PlayerMatchCursor]:
         """Get all player match cursors."""
-        async with self.db.pool.acquire() as conn:
+        async with self.db.acquire() as conn:
             rows = await conn.fetch(
                 "SELECT * FROM player_match_cursors ORDER BY updated_at DESC"
             )
@@ -92,7 +88,7 @@ class PlayerMatchCursorRepository:
         Returns:
             True if cursor was deleted, False if it didn't exist
         """
-        async with self.db.pool.acquire() as conn:
+        async with self.db.acquire() as conn:
             result = await conn.execute(
                 "DELETE FROM player_match_cursors WHERE player_uuid = $1",
                 player_uuid
@@ -3,8 +3,11 @@ import logging
 from typing import Optional
 from datetime import datetime
 
+import asyncpg
+
 from ..connection import Database
 from ..predecessor import ProcessedMatch
+from .processed_match_partition import ProcessedMatchPartitionRepository
 
 logger = logging.getLogger("data.repositories.processed_match")
 
@@ -20,14 +23,38 @@ class ProcessedMatchRepository:
             db: Database connection instance
         """
         self.db = db
+        self._partitions = ProcessedMatchPartitionRepository(db)
 
-    async def is_match_processed(self, match_uuid: str) -> bool:
-        """Check if a match has already been processed."""
-        async with self.db.pool.acquire() as conn:
-            result = await conn.fetchval(
-                "SELECT EXISTS(SELECT 1 FROM processed_matches WHERE match_uuid = $1)",
-                match_uuid
-            )
+    @staticmethod
+    def _parse_end_time(end_time: str | datetime) -> datetime:
+        """Convert an ISO string (asyncpg requires datetime objects) to datetime."""
+        if isinstance(end_time, str):
+            # Handle ISO format with Z suffix
+            if end_time.endswith("Z"):
+                end_time = end_time[:-1] + "+00:00"
+            end_time = datetime.fromisoformat(end_time)
+        return end_time
+
+    async def is_match_processed(
+        self, match_uuid: str, end_time: str | datetime | None = None
+    ) -> bool:
+        """
+        Check if a match has already been processed.
+
+        Args:
+            match_uuid: The match UUID
+            end_time: The match end time, if known. Lets Postgres prune the lookup
+                      to a single monthly partition.
+        """
+        async with self.db.acquire() as conn:
+            if end_time:
+                result = await self.db.statements.fetchval(
+                    conn, "processed_match_exists_at", match_uuid, self._parse_end_time(end_time)
+                )
+            else:
+                result = await self.db.statements.fetchval(
+                    conn, "processed_match_exists", match_uuid
+                )
             return bool(result)
 
     async def mark_match_processed(
@@ -35,41 +62,68 @@ class ProcessedMatchRepository:
         match_uuid: str,
         match_id: str,
         end_time: str | datetime
-    ) -> None:
+    ) -> bool:
         """
         Mark a match as processed.
 
+        Doubles as an atomic claim: only one caller gets True for a given match.
+
         Args:
             match_uuid: The match UUID
             match_id: The match ID
             end_time: The match end time (ISO string or datetime)
+
+        Returns:
+            True if the match was newly marked, False if it was already processed
         """
-        # Convert string to datetime if needed (asyncpg requires datetime objects)
-        if isinstance(end_time, str):
-            # Handle ISO format with Z suffix
-            if end_time.endswith("Z"):
-                end_time = end_time[:-1] + "+00:00"
-            end_time = datetime.fromisoformat(end_time)
+        end_time = self._parse_end_time(end_time)
+
+        try:
+            return await self._insert_processed(match_uuid, match_id, end_time)
+        except asyncpg.CheckViolationError:
+            # No partition covers this end_time yet (maintenance job hasn't run)
+            await self._partitions.ensure_partition(end_time)
+            return await self._insert_processed(match_uuid, match_id, end_time)
+
+    async def _insert_processed(self, match_uuid: str, match_id: str, end_time: datetime) -> bool:
+        """Insert a processed match row inside its own (sub)transaction."""
+        async with self.db.acquire() as conn:
+            # Savepoint so a missing-partition error doesn't abort an enclosing unit of work
+            async with conn.transaction():
+                result = await conn.execute("""
+                    INSERT INTO processed_matches (match_uuid, match_id, end_time)
+                    VALUES ($1, $2, $3)
+                    ON CONFLICT (match_uuid, end_time) DO NOTHING
+                """, match_uuid, match_id, end_time)
+            return result == "INSERT 0 1"
+
+    async def mark_match_notified(
+        self, match_uuid: str, end_time: str | datetime | None = None
+    ) -> None:
+        """
+        Mark a match as having been notified to the bot.
 
-        async with self.db.pool.acquire() as conn:
-            await conn.execute("""
-                INSERT INTO processed_matches (match_uuid, match_id, end_time)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (match_uuid) DO NOTHING
-            """, match_uuid, match_id, end_time)
-
-    async def mark_match_notified(self, match_uuid: str) -> None:
-        """Mark a match as having been notified to the bot."""
-        async with self.db.pool.acquire() as conn:
-            await conn.execute("""
-                UPDATE processed_matches
-                SET notified_bot = TRUE
-                WHERE match_uuid = $1
-            """, match_uuid)
+        Args:
+            match_uuid: The match UUID
+            end_time: The match end time, if known (prunes to one partition)
+        """
+        async with self.db.acquire() as conn:
+            if end_time:
+                await conn.execute("""
+                    UPDATE processed_matches
+                    SET notified_bot = TRUE
+                    WHERE match_uuid = $1 AND end_time = $2
+                """, match_uuid, self._parse_end_time(end_time))
+            else:
+                await conn.execute("""
+                    UPDATE processed_matches
+                    SET notified_bot = TRUE
+                    WHERE match_uuid = $1
+                """, match_uuid)
 
     async def get_match(self, match_uuid: str) -> Optional[ProcessedMatch]:
         """Get a processed match by UUID."""
-        async with self.db.pool.acquire() as conn:
+        async with self.db.acquire() as conn:
             row = await conn.fetchrow(
                 "SELECT * FROM processed_matches WHERE match_uuid = $1",
                 match_uuid
@@ -78,12 +132,29 @@ class ProcessedMatchRepository:
                 return ProcessedMatch.from_row(dict(row))
             return None
 
+    async def get_recent_matches(self, since: datetime) -> list[tuple[str, datetime]]:
+        """
+        Get UUIDs and end times of matches that ended at or after a point in time.
+
+        Args:
+            since: Earliest end time to include (prunes to recent partitions)
+
+        Returns:
+            List of (match_uuid, end_time) tuples
+        """
+        async with self.db.acquire() as conn:
+            rows = await conn.fetch("""
+                SELECT match_uuid, end_time FROM processed_matches
+                WHERE end_time >= $1
+            """, since)
+            return [(row["match_uuid"], row["end_time"]) for row in rows]
+
     async def get_unnotified_matches(self, limit: Optional[int] = None) -> list[ProcessedMatch]:
         """Get matches that haven't been notified to the bot yet."""
         query = "SELECT * FROM processed_matches WHERE notified_bot = FALSE ORDER BY processed_at ASC"
         if limit:
             query += f" LIMIT {limit}"
 
-        async with self.db.pool.acquire() as conn:
+        async with self.db.acquire() as conn:
             rows = await conn.fetch(query)
             return [ProcessedMatch.from_row(dict(row)) for row in rows]
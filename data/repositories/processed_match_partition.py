@@ -0,0 +1,170 @@
+"""Repository for managing monthly partitions of processed_matches."""
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import asyncpg
+
+from ..connection import Database
+
+logger = logging.getLogger("data.repositories.processed_match_partition")
+
+
+class ProcessedMatchPartitionRepository:
+    """Creates and retires monthly end_time partitions of processed_matches.
+
+    Partitions are named processed_matches_YYYY_MM and cover one calendar month
+    in UTC, matching migration 005.
+    """
+
+    TABLE = "processed_matches"
+
+    def __init__(self, db: Database) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            db: Database connection instance
+        """
+        self.db = db
+
+    @staticmethod
+    def month_start(value: datetime) -> datetime:
+        """Get the UTC start of the month containing a timestamp."""
+        value = value.astimezone(timezone.utc) if value.tzinfo else value.replace(tzinfo=timezone.utc)
+        return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+    @staticmethod
+    def next_month(month_start: datetime) -> datetime:
+        """Get the start of the month after month_start."""
+        if month_start.month == 12:
+            return month_start.replace(year=month_start.year + 1, month=1)
+        return month_start.replace(month=month_start.month + 1)
+
+    @classmethod
+    def partition_name(cls, month_start: datetime) -> str:
+        """Get the partition table name for a month."""
+        return f"{cls.TABLE}_{month_start:%Y_%m}"
+
+    @classmethod
+    def parse_partition_month(cls, name: str) -> Optional[datetime]:
+        """Get the month a partition covers from its name, or None if not ours."""
+        prefix = f"{cls.TABLE}_"
+        if not name.startswith(prefix):
+            return None
+        try:
+            return datetime.strptime(name[len(prefix):], "%Y_%m").replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
+
+    async def list_partitions(self) -> list[tuple[str, datetime]]:
+        """
+        Get all monthly partitions currently attached to processed_matches.
+
+        Returns:
+            List of (partition_name, month_start) tuples, oldest first
+        """
+        async with self.db.acquire() as conn:
+            rows = await conn.fetch("""
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'processed_matches'::regclass
+            """)
+        partitions = []
+        for row in rows:
+            month = self.parse_partition_month(row["relname"])
+            if month is not None:
+                partitions.append((row["relname"], month))
+        return sorted(partitions, key=lambda p: p[1])
+
+    async def ensure_partition(self, value: datetime) -> bool:
+        """
+        Ensure the partition covering a timestamp exists.
+
+        Args:
+            value: Any timestamp inside the month to cover
+
+        Returns:
+            True if the partition was created, False if it already existed
+        """
+        start = self.month_start(value)
+        end = self.next_month(start)
+        name = self.partition_name(start)
+
+        async with self.db.acquire() as conn:
+            exists = await conn.fetchval("SELECT to_regclass($1) IS NOT NULL", name)
+            if exists:
+                return False
+            try:
+                # DDL cannot take bind parameters; bounds are formatted from datetimes we computed
+                await conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {name}
+                        PARTITION OF {self.TABLE}
+                        FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')
+                """)
+            except asyncpg.DuplicateTableError:
+                # Created concurrently by another worker
+                return False
+
+        logger.info(f"Created partition {name} [{start:%Y-%m-%d}, {end:%Y-%m-%d})")
+        return True
+
+    async def ensure_future_partitions(
+        self, months_ahead: int = 3, now: Optional[datetime] = None
+    ) -> list[str]:
+        """
+        Ensure partitions exist for the current month and the next N months.
+
+        Args:
+            months_ahead: Number of months after the current one to pre-create
+            now: Reference time (defaults to current UTC time)
+
+        Returns:
+            Names of partitions that were created
+        """
+        month = self.month_start(now or datetime.now(timezone.utc))
+        created = []
+        for _ in range(months_ahead + 1):
+            if await self.ensure_partition(month):
+                created.append(self.partition_name(month))
+            month = self.next_month(month)
+        return created
+
+    async def remove_expired_partitions(
+        self,
+        retention: timedelta,
+        detach_only: bool = False,
+        now: Optional[datetime] = None,
+    ) -> list[str]:
+        """
+        Drop (or detach) partitions whose entire range is older than the retention period.
+
+        A partition is only removed once its upper bound is before now - retention,
+        so every match newer than the cutoff stays visible to deduplication.
+
+        Args:
+            retention: How long processed matches must be kept (at least one day)
+            detach_only: If True, detach partitions and keep them as standalone
+                         tables instead of dropping them
+            now: Reference time (defaults to current UTC time)
+
+        Returns:
+            Names of partitions that were removed
+        """
+        if retention < timedelta(days=1):
+            raise ValueError("Processed match retention must be at least one day")
+
+        cutoff = (now or datetime.now(timezone.utc)) - retention
+        removed = []
+        for name, month in await self.list_partitions():
+            if self.next_month(month) > cutoff:
+                continue
+            async with self.db.acquire() as conn:
+                if detach_only:
+                    await conn.execute(f"ALTER TABLE {self.TABLE} DETACH PARTITION {name}")
+                else:
+                    await conn.execute(f"DROP TABLE {name}")
+            logger.info(f"{'Detached' if detach_only else 'Dropped'} expired partition {name}")
+            removed.append(name)
+        return removed
@@ -34,14 +34,11 @@ class SubscribedProfileRepository:
         Returns:
             True if profile was added, False if it already exists
         """
-        async with self.db.pool.acquire() as conn:
+        async with self.db.acquire() as conn:
             # Check if already exists
-            exists = await conn.fetchval("""
-                SELECT EXISTS(
-                    SELECT 1 FROM subscribed_profiles
-                    WHERE guild_id = $1 AND player_uuid = $2
-                )
-            """, guild_id, player_uuid)
+            exists = await self.db.statements.fetchval(
+                conn, "subscribed_profile_exists", guild_id, player_uuid
+            )
 
             if exists:
                 return False
@@ -68,14 +65,11 @@ class SubscribedProfileRepository:
         Returns:
             True if profile was removed, False if it wasn't subscribed
         """
-        async with self.db.pool.acquire() as conn:
+        async with self.db.acquire() as conn:
             # Check if exists first, then delete
-            exists = await conn.fetchval("""
-                SELECT EXISTS(
-                    SELECT 1 FROM subscribed_profiles
-                    WHERE guild_id = $1 AND player_uuid = $2
-                )
-            """, guild_id, player_uuid)
+            exists = await self.db.statements.fetchval(
+                conn, "subscribed_profile_exists", guild_id, player_uuid
+            )
 
             if not exists:
                 return False
@@ -96,12 +90,8 @@ class SubscribedProfileRepository:
         Returns:
             List of player UUIDs, empty list if none subscribed
         """
-        async with self.db.pool.acquire() as conn:
-            rows = await conn.fetch("""
-                SELECT player_uuid FROM subscribed_profiles
-                WHERE guild_id = $1
-                ORDER BY subscribed_at ASC
-            """, guild_id)
+        async with self.db.acquire() as conn:
+            rows = await self.db.statements.fetch(conn, "guild_profiles", guild_id)
             return [row["player_uuid"] for row in rows]
 
     async def get_profiles_with_names(self, guild_id: int) -> list[SubscribedProfile]:
@@ -114,13 +104,8 @@ class SubscribedProfileRepository:
         Returns:
             List of SubscribedProfile objects, empty list if none subscribed
         """
-        async with self.db.pool.acquire() as conn:
-            rows = await conn.fetch("""
-                SELECT guild_id, player_uuid, player_name, subscribed_at
-                FROM subscribed_profiles
-                WHERE guild_id = $1
-                ORDER BY subscribed_at ASC
-            """, guild_id)
+        async with self.db.acquire() as conn:
+            rows = await self.db.statements.fetch(conn, "guild_profiles_with_names", guild_id)
             return [SubscribedProfile.from_row(dict(row)) for row in rows]
 
     async def is_subscribed(self, guild_id: int, player_uuid: str) -> bool:
@@ -134,13 +119,10 @@ class SubscribedProfileRepository:
         Returns:
             True if the profile is subscribed, False otherwise
         """
-        async with self.db.pool.acquire() as conn:
-            result = await conn.fetchval("""
-                SELECT EXISTS(
-                    SELECT 1 FROM subscribed_profiles
-                    WHERE guild_id = $1 AND player_uuid = $2
-                )
-            """, guild_id, player_uuid)
+        async with self.db.acquire() as conn:
+            result = await self.db.statements.fetchval(
+                conn, "subscribed_profile_exists", guild_id, player_uuid
+            )
             return bool(result)
 
     async def clear_guild(self, guild_id: int) -> int:
@@ -153,7 +135,7 @@ class SubscribedProfileRepository:
         Returns:
             Number of profiles that were removed
         """
-        async with self.db.pool.acquire() as conn:
+        async with self.db.acquire() as conn:
             # Get count before deletion
             count = await conn.fetchval("""
                 SELECT COUNT(*) FROM subscribed_profiles WHERE guild_id = $1
@@ -166,7 +148,7 @@ class SubscribedProfileRepository:
 
     async def get_all_subscriptions(self) -> list[SubscribedProfile]:
         """Get all subscribed profiles across all guilds."""
-        async with self.db.pool.acquire() as conn:
+        async with self.db.acquire() as conn:
             rows = await conn.fetch("""
                 SELECT * FROM subscribed_profiles
                 ORDER BY guild_id, subscribed_at ASC
@@ -175,7 +157,7 @@ class SubscribedProfileRepository:
 
     async def get_subscription(self, guild_id: int, player_uuid: str) -> Optional[SubscribedProfile]:
         """Get a specific subscription."""
-        async with self.db.pool.acquire() as conn:
+        async with self.db.acquire() as conn:
             row = await conn.fetchrow("""
                 SELECT * FROM subscribed_profiles
                 WHERE guild_id = $1 AND player_uuid = $2
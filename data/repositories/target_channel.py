@@ -29,14 +29,11 @@ class TargetChannelRepository:
         Returns:
             True if channel was added, False if it already exists
         """
-        async with self.db.pool.acquire() as conn:
+        async with self.db.acquire() as conn:
             # Check if already exists
-            exists = await conn.fetchval("""
-                SELECT EXISTS(
-                    SELECT 1 FROM target_channels
-                    WHERE guild_id = $1 AND channel_id = $2
-                )
-            """, guild_id, channel_id)
+            exists = await self.db.statements.fetchval(
+                conn, "target_channel_exists", guild_id, channel_id
+            )
 
             if exists:
                 return False
@@ -63,14 +60,11 @@ class TargetChannelRepository:
         Returns:
             True if channel was removed, False if it wasn't configured
         """
-        async with self.db.pool.acquire() as conn:
+        async with self.db.acquire() as conn:
             # Check if exists first
-            exists = await conn.fetchval("""
-                SELECT EXISTS(
-                    SELECT 1 FROM target_channels
-                    WHERE guild_id = $1 AND channel_id = $2
-                )
-            """, guild_id, channel_id)
+            exists = await self.db.statements.fetchval(
+                conn, "target_channel_exists", guild_id, channel_id
+            )
 
             if not exists:
                 return False
@@ -91,12 +85,8 @@ class TargetChannelRepository:
         Returns:
             List of channel IDs, empty list if none configured
         """
-        async with self.db.pool.acquire() as conn:
-            rows = await conn.fetch("""
-                SELECT channel_id FROM target_channels
-                WHERE guild_id = $1
-                ORDER BY configured_at ASC
-            """, guild_id)
+        async with self.db.acquire() as conn:
+            rows = await self.db.statements.fetch(conn, "guild_channels", guild_id)
             return [row["channel_id"] for row in rows]
 
     async def is_target_channel(self, guild_id: int, channel_id: int) -> bool:
@@ -110,13 +100,10 @@ class TargetChannelRepository:
         Returns:
             True if the channel is configured, False otherwise
         """
-        async with self.db.pool.acquire() as conn:
-            result = await conn.fetchval("""
-                SELECT EXISTS(
-                    SELECT 1 FROM target_channels
-                    WHERE guild_id = $1 AND channel_id = $2
-                )
-            """, guild_id, channel_id)
+        async with self.db.acquire() as conn:
+            result = await self.db.statements.fetchval(
+                conn, "target_channel_exists", guild_id, channel_id
+            )
             return bool(result)
 
     async def clear_guild(self, guild_id: int) -> int:
@@ -129,7 +116,7 @@ class TargetChannelRepository:
         Returns:
             Number of channels that were removed
         """
-        async with self.db.pool.acquire() as conn:
+        async with self.db.acquire() as conn:
             # Get count before deletion
             count = await conn.fetchval("""
                 SELECT COUNT(*) FROM target_channels WHERE guild_id = $1
@@ -147,7 +134,7 @@ class TargetChannelRepository:
         Returns:
             List of (guild_id, channel_id) tuples
         """
-        async with self.db.pool.acquire() as conn:
+        async with self.db.acquire() as conn:
             rows = await conn.fetch("""
                 SELECT guild_id, channel_id FROM target_channels
                 ORDER BY guild_id, configured_at ASC
@@ -0,0 +1,161 @@
+"""Registry of hot SQL statements prepared on every pooled connection."""
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import asyncpg
+
+logger = logging.getLogger("data.statements")
+
+
+# Hot statements run on (almost) every cron tick or bot interaction.
+# Keyed by a stable name that repositories use to execute them.
+HOT_STATEMENTS: dict[str, str] = {
+    # Existence checks
+    "processed_match_exists": (
+        "SELECT EXISTS(SELECT 1 FROM processed_matches WHERE match_uuid = $1)"
+    ),
+    "processed_match_exists_at": (
+        "SELECT EXISTS(SELECT 1 FROM processed_matches WHERE match_uuid = $1 AND end_time = $2)"
+    ),
+    "subscribed_profile_exists": """
+        SELECT EXISTS(
+            SELECT 1 FROM subscribed_profiles
+            WHERE guild_id = $1 AND player_uuid = $2
+        )
+    """,
+    "target_channel_exists": """
+        SELECT EXISTS(
+            SELECT 1 FROM target_channels
+            WHERE guild_id = $1 AND channel_id = $2
+        )
+    """,
+    # Cursor reads
+    "cursor_by_player": "SELECT * FROM player_match_cursors WHERE player_uuid = $1",
+    "cursor_last_match_time": (
+        "SELECT last_match_end_time FROM player_match_cursors WHERE player_uuid = $1"
+    ),
+    # Per-guild lookups
+    "guild_channels": """
+        SELECT channel_id FROM target_channels
+        WHERE guild_id = $1
+        ORDER BY configured_at ASC
+    """,
+    "guild_profiles": """
+        SELECT player_uuid FROM subscribed_profiles
+        WHERE guild_id = $1
+        ORDER BY subscribed_at ASC
+    """,
+    "guild_profiles_with_names": """
+        SELECT guild_id, player_uuid, player_name, subscribed_at
+        FROM subscribed_profiles
+        WHERE guild_id = $1
+        ORDER BY subscribed_at ASC
+    """,
+}
+
+
+@dataclass
+class StatementStats:
+    """Call count and latency for a registered statement."""
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, elapsed: float) -> None:
+        """Record one execution."""
+        self.calls += 1
+        self.total_seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+
+    def as_dict(self) -> dict[str, float]:
+        """Summarize as milliseconds for reporting."""
+        avg = self.total_seconds / self.calls if self.calls else 0.0
+        return {
+            "calls": self.calls,
+            "avg_ms": round(avg * 1000, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "total_ms": round(self.total_seconds * 1000, 3),
+        }
+
+
+class StatementRegistry:
+    """Prepares hot statements per connection and executes them through the handles.
+
+    Handles are tracked per backend connection (server PID) and dropped when the
+    connection closes. Statements that fail to prepare at connection time (e.g.
+    tables not created yet) are prepared lazily on first use.
+    """
+
+    def __init__(self, statements: dict[str, str] | None = None) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            statements: Mapping of statement name to SQL. Defaults to HOT_STATEMENTS.
+        """
+        self.statements = dict(statements if statements is not None else HOT_STATEMENTS)
+        self._prepared: dict[int, dict[str, asyncpg.prepared_stmt.PreparedStatement]] = {}
+        self._stats: dict[str, StatementStats] = {name: StatementStats() for name in self.statements}
+
+    async def prepare_connection(self, conn: asyncpg.Connection) -> None:
+        """Prepare every registered statement on a new connection (pool init hook)."""
+        pid = conn.get_server_pid()
+        handles = self._prepared.setdefault(pid, {})
+        conn.add_termination_listener(self._forget_connection)
+        for name, sql in self.statements.items():
+            try:
+                handles[name] = await conn.prepare(sql)
+            except asyncpg.PostgresError as e:
+                logger.debug(f"Deferring prepare of '{name}' on connection {pid}: {e}")
+        logger.debug(f"Prepared {len(handles)}/{len(self.statements)} statements on connection {pid}")
+
+    def _forget_connection(self, conn: asyncpg.Connection) -> None:
+        """Drop handles for a closed connection."""
+        self._prepared.pop(conn.get_server_pid(), None)
+
+    async def _get_handle(
+        self, conn: asyncpg.Connection, name: str
+    ) -> asyncpg.prepared_stmt.PreparedStatement:
+        """Get the prepared handle for a statement on this connection, preparing if needed."""
+        handles = self._prepared.setdefault(conn.get_server_pid(), {})
+        handle = handles.get(name)
+        if handle is None:
+            handle = await conn.prepare(self.statements[name])
+            handles[name] = handle
+        return handle
+
+    async def _run(self, conn: asyncpg.Connection, name: str, method: str, args: tuple) -> Any:
+        """Execute a registered statement and record its latency."""
+        start = time.perf_counter()
+        handle = await self._get_handle(conn, name)
+        try:
+            result = await getattr(handle, method)(*args)
+        except asyncpg.InvalidCachedStatementError:
+            # Schema changed under the prepared plan (e.g. after a migration); re-prepare
+            # on next use. Inside a transaction the failure has already aborted it, so
+            # leave the retry to whoever owns the transaction.
+            self._prepared.get(conn.get_server_pid(), {}).pop(name, None)
+            if conn.is_in_transaction():
+                raise
+            handle = await self._get_handle(conn, name)
+            result = await getattr(handle, method)(*args)
+        self._stats[name].record(time.perf_counter() - start)
+        return result
+
+    async def fetch(self, conn: asyncpg.Connection, name: str, *args: Any) -> list[asyncpg.Record]:
+        """Run a registered statement and return all rows."""
+        return await self._run(conn, name, "fetch", args)
+
+    async def fetchrow(self, conn: asyncpg.Connection, name: str, *args: Any) -> asyncpg.Record | None:
+        """Run a registered statement and return the first row."""
+        return await self._run(conn, name, "fetchrow", args)
+
+    async def fetchval(self, conn: asyncpg.Connection, name: str, *args: Any) -> Any:
+        """Run a registered statement and return the first column of the first row."""
+        return await self._run(conn, name, "fetchval", args)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Get per-statement call counts and latency (milliseconds)."""
+        return {name: s.as_dict() for name, s in self._stats.items()}
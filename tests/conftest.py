@@ -17,10 +17,33 @@ Usage:
         ...
 """
 
+import json
 import os
+import sys
+from pathlib import Path
+
 import pytest
 from testcontainers.postgres import PostgresContainer
 
+# Bot modules import each other as top-level packages (services, config, ...)
+BELICA_BOT_ROOT = Path(__file__).parent.parent / "bots" / "belica-bot"
+sys.path.insert(0, str(BELICA_BOT_ROOT))
+
+
+@pytest.fixture(scope="session")
+def raw_match() -> dict:
+    """The detailed GraphQL match saved in the bot's fixtures."""
+    with open(BELICA_BOT_ROOT / "fixtures" / "detailed_match.json") as f:
+        return json.load(f)["match"]
+
+
+@pytest.fixture
+def match_data(raw_match):
+    """The fixture match as a MatchData."""
+    from predecessor_api import MatchService
+
+    return MatchService(api=None).transform_match_data(raw_match)
+
 
 @pytest.fixture(scope="session")
 def postgres_container():
@@ -58,3 +58,124 @@ async def test_clean_tables_fixture(db_with_clean_tables):
     async with db_with_clean_tables.pool.acquire() as conn:
         count = await conn.fetchval("SELECT COUNT(*) FROM subscribed_profiles")
         assert count == 0
+
+
+async def test_unit_of_work_shares_connection(db_with_clean_tables):
+    """Test that repository calls inside a unit of work run on one connection."""
+    db = db_with_clean_tables
+
+    async with db.unit_of_work() as conn:
+        async with db.acquire() as first:
+            pass
+        async with db.acquire() as second:
+            pass
+        assert first is conn
+        assert second is conn
+
+
+async def test_unit_of_work_transaction_rolls_back(db_with_clean_tables):
+    """Test that a transactional unit of work rolls back every repository write."""
+    from data import SubscribedProfileRepository, TargetChannelRepository
+
+    db = db_with_clean_tables
+    profile_repo = SubscribedProfileRepository(db)
+    channel_repo = TargetChannelRepository(db)
+
+    with pytest.raises(RuntimeError):
+        async with db.unit_of_work(transaction=True):
+            await profile_repo.add_profile(123, "rolled-back-uuid")
+            await channel_repo.add_channel(123, 456)
+            raise RuntimeError("abort")
+
+    assert await profile_repo.get_profiles(123) == []
+    assert await channel_repo.get_channels(123) == []
+
+
+async def test_pool_stats_reports_in_use_connections(db):
+    """Test that pool_stats reflects connections checked out of the pool."""
+    async with db.acquire():
+        stats = db.pool_stats()
+        assert stats["in_use"] >= 1
+        assert stats["size"] == stats["idle"] + stats["in_use"]
+        assert stats["max_size"] == db.config.get_pool_max_size()
+
+
+async def test_hot_statements_record_stats(db_with_clean_tables):
+    """Test that repository hot paths run through the prepared statement registry."""
+    from data import ProcessedMatchRepository
+
+    db = db_with_clean_tables
+    repo = ProcessedMatchRepository(db)
+
+    assert await repo.is_match_processed("missing-uuid") is False
+    await repo.mark_match_processed("known-uuid", "1", "2024-01-01T00:00:00Z")
+    assert await repo.is_match_processed("known-uuid") is True
+
+    stats = db.statements.stats()["processed_match_exists"]
+    assert stats["calls"] == 2
+    assert stats["max_ms"] >= stats["avg_ms"] > 0
+
+
+async def test_processed_matches_partition_lifecycle(db_with_clean_tables):
+    """Test that partitions are created on demand and expired ones are dropped."""
+    from datetime import datetime, timedelta, timezone
+    from data import ProcessedMatchRepository, ProcessedMatchPartitionRepository
+
+    db = db_with_clean_tables
+    match_repo = ProcessedMatchRepository(db)
+    partition_repo = ProcessedMatchPartitionRepository(db)
+
+    # Inserting into a month without a partition creates it
+    await match_repo.mark_match_processed("old-match", "1", "2020-03-15T12:00:00Z")
+    assert await match_repo.is_match_processed("old-match", "2020-03-15T12:00:00Z") is True
+    names = [name for name, _ in await partition_repo.list_partitions()]
+    assert "processed_matches_2020_03" in names
+
+    # Partitions entirely older than the retention period are removed
+    removed = await partition_repo.remove_expired_partitions(retention=timedelta(days=30))
+    assert "processed_matches_2020_03" in removed
+    assert await match_repo.is_match_processed("old-match") is False
+
+    # The current month is never removed
+    current = ProcessedMatchPartitionRepository.month_start(datetime.now(timezone.utc))
+    names = [name for name, _ in await partition_repo.list_partitions()]
+    assert ProcessedMatchPartitionRepository.partition_name(current) in names
+
+
+async def test_mark_match_processed_claims_once(db_with_clean_tables):
+    """Test that only the first mark_match_processed call claims a match."""
+    from datetime import datetime, timedelta, timezone
+    from data import ProcessedMatchRepository
+
+    repo = ProcessedMatchRepository(db_with_clean_tables)
+    end_time = datetime.now(timezone.utc)
+
+    assert await repo.mark_match_processed("claimed-uuid", "1", end_time) is True
+    assert await repo.mark_match_processed("claimed-uuid", "1", end_time) is False
+
+    recent = await repo.get_recent_matches(end_time - timedelta(hours=1))
+    assert ("claimed-uuid", end_time) in recent
+
+
+async def test_config_change_listener_receives_notifications(db_with_clean_tables):
+    """Test that target channel changes are delivered to listener callbacks."""
+    import asyncio
+    from data import ConfigChangeListener, TargetChannelRepository
+
+    db = db_with_clean_tables
+    received = asyncio.Queue()
+
+    async def on_change(change):
+        await received.put(change)
+
+    listener = ConfigChangeListener(db)
+    listener.add_callback(on_change)
+    await listener.start()
+    try:
+        await TargetChannelRepository(db).add_channel(111, 222)
+        change = await asyncio.wait_for(received.get(), timeout=5)
+        assert change.table == "target_channels"
+        assert change.op == "INSERT"
+        assert change.guild_ids == {111}
+    finally:
+        await listener.stop()
@@ -0,0 +1,55 @@
+"""Tests for the in-memory match delivery queue."""
+import asyncio
+import dataclasses
+
+from services.delivery_queue import MatchDeliveryQueue
+
+
+async def test_matches_for_one_channel_post_in_order(match_data):
+    """Test that two matches for the same channel are sent in enqueue order."""
+    sent: list[tuple[int, str]] = []
+
+    async def deliver(match):
+        # The older match is slower to post; a second worker would overtake it
+        await asyncio.sleep(0.05 if match.match_uuid == "older" else 0.0)
+        sent.append((1234, match.match_uuid))
+
+    queue = MatchDeliveryQueue(deliver)
+    queue.start()
+    queue.enqueue(dataclasses.replace(match_data, match_uuid="older"))
+    queue.enqueue(dataclasses.replace(match_data, match_uuid="newer"))
+    await queue.stop()
+
+    assert sent == [(1234, "older"), (1234, "newer")]
+
+
+async def test_duplicate_while_pending_is_dropped(match_data):
+    """Test that a match already waiting is not queued a second time."""
+    delivered = []
+
+    async def deliver(match):
+        delivered.append(match.match_uuid)
+
+    queue = MatchDeliveryQueue(deliver)
+    assert queue.enqueue(match_data) is True
+    assert queue.enqueue(match_data) is False
+    queue.start()
+    await queue.stop()
+
+    assert delivered == [match_data.match_uuid]
+    assert queue.stats()["duplicates"] == 1
+
+
+async def test_stop_logs_each_undelivered_match(match_data, caplog):
+    """Test that matches left after the drain timeout are logged by UUID."""
+    async def deliver(match):
+        await asyncio.sleep(10)
+
+    queue = MatchDeliveryQueue(deliver)
+    queue.start()
+    queue.enqueue(dataclasses.replace(match_data, match_uuid="stuck-1"))
+    queue.enqueue(dataclasses.replace(match_data, match_uuid="stuck-2"))
+    await queue.stop(drain_timeout=0.05)
+
+    assert "Match stuck-1 was accepted but never delivered" in caplog.text
+    assert "Match stuck-2 was accepted but never delivered" in caplog.text
@@ -0,0 +1,60 @@
+"""Tests for GraphQL request compression in the Predecessor API client."""
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from predecessor_api import PredecessorAPI
+
+
+async def _serve(handler):
+    app = web.Application()
+    app.router.add_post("/graphql", handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+async def test_rejected_gzip_body_is_resent_uncompressed():
+    """Test that a 415 for a gzip body disables compression and retries once."""
+    encodings = []
+
+    async def handler(request):
+        encodings.append(request.headers.get("Content-Encoding"))
+        if request.headers.get("Content-Encoding"):
+            return web.Response(status=415)
+        return web.json_response({"data": {"ok": True}})
+
+    server = await _serve(handler)
+    api = PredecessorAPI(api_url=str(server.make_url("/graphql")), compress_requests_over=1)
+    try:
+        assert await api.query("query Ping { ok }") == {"ok": True}
+        assert await api.query("query Ping { ok }") == {"ok": True}
+    finally:
+        await api.close()
+        await server.close()
+
+    assert encodings == ["gzip", None, None]
+    assert api.compress_requests_over == 0
+
+
+async def test_second_415_is_raised():
+    """Test that an uncompressed request refused with 415 raises instead of looping."""
+    calls = 0
+
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        return web.Response(status=415)
+
+    server = await _serve(handler)
+    api = PredecessorAPI(api_url=str(server.make_url("/graphql")), compress_requests_over=1)
+    try:
+        with pytest.raises(aiohttp.ClientResponseError) as excinfo:
+            await api.query("query Ping { ok }")
+        assert excinfo.value.status == 415
+    finally:
+        await api.close()
+        await server.close()
+
+    assert calls == 2
@@ -0,0 +1,59 @@
+"""Tests for the packed icon atlas."""
+import os
+
+from PIL import Image
+
+from services.icon_atlas import IconAtlas, build_atlas
+from services.icon_cache import IconCache
+
+SIZES = {"hero": [16]}
+
+
+def _write_icon(icons_dir, slug, color):
+    path = icons_dir / "heroes" / f"{slug}.png"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGBA", (32, 32), color).save(path)
+    return path
+
+
+def _build(icons_dir):
+    build_atlas(IconCache(icons_dir), SIZES, 1.0, icons_dir / "atlas")
+
+
+def test_atlas_round_trip(tmp_path):
+    """Test that a freshly built atlas opens and returns the resized icons."""
+    _write_icon(tmp_path, "belica", (255, 0, 0, 255))
+    _build(tmp_path)
+
+    atlas = IconAtlas.open(1.0, tmp_path / "atlas")
+
+    assert atlas is not None
+    assert list(atlas.keys()) == [("hero", "belica", 16)]
+    assert atlas.get("hero", "belica", 16).getpixel((8, 8)) == (255, 0, 0, 255)
+
+
+def test_changed_icon_makes_atlas_stale(tmp_path):
+    """Test that an icon updated after the build stops the atlas from being used."""
+    path = _write_icon(tmp_path, "belica", (255, 0, 0, 255))
+    _build(tmp_path)
+
+    _write_icon(tmp_path, "belica", (0, 0, 255, 255))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert IconAtlas.open(1.0, tmp_path / "atlas") is None
+
+
+def test_added_or_removed_icon_makes_atlas_stale(tmp_path):
+    """Test that adding or deleting an icon file stops the atlas from being used."""
+    _write_icon(tmp_path, "belica", (255, 0, 0, 255))
+    _build(tmp_path)
+
+    added = _write_icon(tmp_path, "grux", (0, 255, 0, 255))
+    assert IconAtlas.open(1.0, tmp_path / "atlas") is None
+
+    added.unlink()
+    assert IconAtlas.open(1.0, tmp_path / "atlas") is not None
+
+    (tmp_path / "heroes" / "belica.png").unlink()
+    assert IconAtlas.open(1.0, tmp_path / "atlas") is None
@@ -0,0 +1,116 @@
+"""Tests for scoreboard output encodings."""
+import io
+import pickle
+
+import pytest
+from PIL import Image, ImageDraw, features
+
+from services.image_encoding import AUTO_CANDIDATES, ImageEncoder, image_extension
+
+needs_webp = pytest.mark.skipif(not features.check("webp"), reason="Pillow built without WebP")
+
+
+@pytest.fixture(scope="module")
+def scoreboard() -> Image.Image:
+    """A small stand-in for a rendered scoreboard: flat panels, text and a gradient icon."""
+    image = Image.new("RGB", (320, 180), (18, 22, 30))
+    draw = ImageDraw.Draw(image)
+    for row in range(5):
+        draw.rectangle((8, 8 + row * 34, 312, 36 + row * 34), fill=(30 + row * 8, 40, 60))
+        draw.text((16, 14 + row * 34), f"Player {row}  12/3/7  42.1k", fill=(230, 230, 230))
+    for x in range(32):
+        for y in range(32):
+            image.putpixel((270 + x, 10 + y), (x * 8, y * 8, 128))
+    return image
+
+
+@pytest.mark.parametrize("encoding, extension, pil_format", [
+    ("png", "png", "PNG"),
+    ("png-palette", "png", "PNG"),
+    pytest.param("webp", "webp", "WEBP", marks=needs_webp),
+])
+def test_encoding_output_and_extension(scoreboard, encoding, extension, pil_format):
+    """Test that each encoding produces a decodable image of its format and matching extension."""
+    encoded = ImageEncoder(encoding).encode(scoreboard)
+
+    assert encoded.encoding == encoding
+    assert encoded.extension == extension
+    assert image_extension(encoded.data) == extension
+    decoded = Image.open(io.BytesIO(encoded.data))
+    assert decoded.format == pil_format
+    assert decoded.size == scoreboard.size
+    if encoding == "png-palette":
+        assert decoded.mode == "P"
+    else:
+        # Truecolor PNG and WebP are lossless
+        assert decoded.convert("RGB").tobytes() == scoreboard.tobytes()
+
+
+def test_palette_png_is_smaller(scoreboard):
+    """Test that the palette PNG is smaller than truecolor for a flat-color image."""
+    truecolor = ImageEncoder("png").encode(scoreboard)
+    palette = ImageEncoder("png-palette").encode(scoreboard)
+
+    assert len(palette.data) < len(truecolor.data)
+
+
+def test_auto_keeps_smallest_candidate(scoreboard):
+    """Test that auto with time to spare tries every candidate and keeps the smallest."""
+    encoder = ImageEncoder("auto", budget_ms=60_000)
+    sizes = {name: len(ImageEncoder(name).encode(scoreboard).data) for name in encoder.auto_candidates}
+
+    encoded = encoder.encode(scoreboard)
+
+    assert len(encoded.data) == min(sizes.values())
+    assert encoded.encoding in encoder.auto_candidates
+
+
+def test_auto_skips_candidates_over_budget(scoreboard, monkeypatch):
+    """Test that auto only runs further candidates whose expected time fits the budget."""
+    encoder = ImageEncoder("auto", budget_ms=50)
+    tried: list[str] = []
+    real_encode_as = encoder._encode_as
+
+    def encode_as(image, encoding):
+        tried.append(encoding)
+        return real_encode_as(image, encoding)
+
+    monkeypatch.setattr(encoder, "_encode_as", encode_as)
+    # Every candidate but the first is expected to take far longer than the budget
+    encoder._estimates = {name: 10.0 for name in encoder.auto_candidates}
+
+    encoded = encoder.encode(scoreboard)
+
+    assert tried == [encoder.auto_candidates[0]]
+    assert encoded.encoding == encoder.auto_candidates[0]
+
+
+def test_auto_runs_first_candidate_with_no_budget(scoreboard):
+    """Test that auto always produces an image, even with a zero budget."""
+    encoded = ImageEncoder("auto", budget_ms=0).encode(scoreboard)
+
+    assert encoded.encoding == AUTO_CANDIDATES[0]
+    assert encoded.data
+
+
+def test_encoder_survives_pickling(scoreboard):
+    """Test that an encoder (with its time estimates) can be sent to a worker process."""
+    encoder = ImageEncoder("auto")
+    encoder.encode(scoreboard)
+
+    copy = pickle.loads(pickle.dumps(encoder))
+
+    assert copy._estimates == encoder._estimates
+    assert copy.encode(scoreboard).data
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"encoding": "jpeg"},
+    {"encoding": "auto", "auto_candidates": ["png", "gif"]},
+    {"encoding": "auto", "auto_candidates": ["auto"]},
+    {"encoding": "auto", "auto_candidates": []},
+])
+def test_rejects_unknown_encodings(kwargs):
+    """Test that unknown or non-concrete encodings raise ValueError."""
+    with pytest.raises(ValueError):
+        ImageEncoder(**kwargs)
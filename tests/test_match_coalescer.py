@@ -0,0 +1,142 @@
+"""Tests for per-channel coalescing of match posts."""
+import asyncio
+import dataclasses
+from types import SimpleNamespace
+
+import discord
+
+from services.match_coalescer import MAX_EMBEDS_PER_MESSAGE, MatchCoalescer
+from services.match_formatter import CoalescedMatchView, MatchView
+
+
+class FakeSend:
+    """Records every message the coalescer sends."""
+
+    def __init__(self):
+        self.messages: list[tuple[int, list[discord.Embed], discord.ui.View]] = []
+
+    async def __call__(self, channel, embeds, view):
+        self.messages.append((channel.id, list(embeds), view))
+
+
+def _channel(channel_id: int = 10):
+    return SimpleNamespace(id=channel_id, guild=SimpleNamespace(id=1))
+
+
+def _matches(match_data, count: int):
+    return [
+        dataclasses.replace(match_data, match_uuid=f"00000000-0000-0000-0000-{i:012x}")
+        for i in range(count)
+    ]
+
+
+async def test_window_flushes_matches_as_one_message(match_data):
+    """Test that matches added within the window are sent together once it ends."""
+    send = FakeSend()
+    coalescer = MatchCoalescer(send, window=0.05)
+    channel = _channel()
+
+    for i, match in enumerate(_matches(match_data, 3)):
+        coalescer.add(channel, match, discord.Embed(title=f"Match {i}"))
+    await asyncio.sleep(0)
+    assert send.messages == []
+
+    await asyncio.sleep(0.1)
+    assert len(send.messages) == 1
+    channel_id, embeds, view = send.messages[0]
+    assert channel_id == channel.id
+    assert [embed.title for embed in embeds] == ["Match 0", "Match 1", "Match 2"]
+    assert isinstance(view, CoalescedMatchView)
+    assert coalescer.stats()["matches_sent"] == 3
+
+
+async def test_channels_are_batched_separately(match_data):
+    """Test that each channel gets its own message."""
+    send = FakeSend()
+    coalescer = MatchCoalescer(send, window=0.05)
+    first, second = _matches(match_data, 2)
+
+    coalescer.add(_channel(10), first, discord.Embed(title="A"))
+    coalescer.add(_channel(20), second, discord.Embed(title="B"))
+    await asyncio.sleep(0.1)
+
+    assert sorted((channel_id, len(embeds)) for channel_id, embeds, _ in send.messages) == [(10, 1), (20, 1)]
+
+
+async def test_single_match_window_uses_match_view(match_data):
+    """Test that a window holding one match is sent with the normal match view."""
+    send = FakeSend()
+    coalescer = MatchCoalescer(send, window=0.01)
+
+    coalescer.add(_channel(), match_data, discord.Embed(title="Only"))
+    await asyncio.sleep(0.05)
+
+    [(_, embeds, view)] = send.messages
+    assert len(embeds) == 1
+    assert isinstance(view, MatchView)
+    custom_ids = [item.custom_id for item in view.children if getattr(item, "custom_id", None)]
+    assert custom_ids == [f"scoreboard:{match_data.match_uuid}"]
+
+
+async def test_flushes_early_at_embed_limit(match_data):
+    """Test that the tenth embed sends the batch without waiting for the window."""
+    send = FakeSend()
+    coalescer = MatchCoalescer(send, window=60)
+    channel = _channel()
+    matches = _matches(match_data, MAX_EMBEDS_PER_MESSAGE + 1)
+
+    for match in matches[:MAX_EMBEDS_PER_MESSAGE]:
+        coalescer.add(channel, match, discord.Embed(title=match.match_uuid))
+    await asyncio.sleep(0)
+    assert len(send.messages) == 1
+    assert len(send.messages[0][1]) == MAX_EMBEDS_PER_MESSAGE
+
+    # The next match starts a new batch
+    coalescer.add(channel, matches[-1], discord.Embed(title=matches[-1].match_uuid))
+    assert coalescer.stats()["matches_buffered"] == 1
+    await coalescer.flush_all()
+
+
+async def test_flushes_early_before_exceeding_character_limit(match_data):
+    """Test that an embed that would push the message over 6000 characters starts a new batch."""
+    send = FakeSend()
+    coalescer = MatchCoalescer(send, window=60)
+    channel = _channel()
+    first, second, third = _matches(match_data, 3)
+
+    coalescer.add(channel, first, discord.Embed(description="a" * 2500))
+    coalescer.add(channel, second, discord.Embed(description="b" * 2500))
+    coalescer.add(channel, third, discord.Embed(description="c" * 2500))
+    await asyncio.sleep(0)
+
+    assert len(send.messages) == 1
+    assert [embed.description[0] for embed in send.messages[0][1]] == ["a", "b"]
+    assert coalescer.stats()["matches_buffered"] == 1
+    await coalescer.flush_all()
+
+
+async def test_flush_all_sends_buffered_batches(match_data):
+    """Test that flush_all (shutdown) sends everything still waiting for its window."""
+    send = FakeSend()
+    coalescer = MatchCoalescer(send, window=60)
+    first, second, third = _matches(match_data, 3)
+
+    coalescer.add(_channel(10), first, discord.Embed(title="A"))
+    coalescer.add(_channel(10), second, discord.Embed(title="B"))
+    coalescer.add(_channel(20), third, discord.Embed(title="C"))
+    await coalescer.flush_all()
+
+    assert sorted((channel_id, len(embeds)) for channel_id, embeds, _ in send.messages) == [(10, 2), (20, 1)]
+    assert coalescer.stats()["channels_buffered"] == 0
+
+
+async def test_failed_send_is_not_counted(match_data):
+    """Test that a send error is logged and the batch is not counted as sent."""
+    async def send(channel, embeds, view):
+        raise discord.HTTPException(SimpleNamespace(status=500, reason="Server Error"), "boom")
+
+    coalescer = MatchCoalescer(send, window=60)
+    coalescer.add(_channel(), match_data, discord.Embed(title="A"))
+    await coalescer.flush_all()
+
+    assert coalescer.stats()["messages_sent"] == 0
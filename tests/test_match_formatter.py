@@ -0,0 +1,122 @@
+"""Tests for scoreboard button handling on posted match messages."""
+import asyncio
+from itertools import groupby
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import discord
+
+from services.match_formatter import CoalescedMatchView, _handle_scoreboard_callback
+
+MATCH_A = "00000000-0000-0000-0000-00000000000a"
+MATCH_B = "00000000-0000-0000-0000-00000000000b"
+PNG_BYTES = b"\x89PNG\r\n\x1a\n fake scoreboard"
+
+
+def _components(view: discord.ui.View) -> list[SimpleNamespace]:
+    """Turn a view into the action rows Discord would send back with the message."""
+    rows = []
+    items = sorted(view.children, key=lambda item: item.row or 0)
+    for _, row_items in groupby(items, key=lambda item: item.row or 0):
+        children = []
+        for item in row_items:
+            button = getattr(item, "item", item)  # Unwrap DynamicItem
+            children.append(SimpleNamespace(
+                custom_id=button.custom_id,
+                url=button.url,
+                style=button.style,
+                label=button.label,
+                emoji=button.emoji,
+            ))
+        rows.append(SimpleNamespace(children=children))
+    return rows
+
+
+class FakeDiscordMessage:
+    """Server-side state of one posted message; edits are slow enough to race."""
+
+    def __init__(self, message_id: int, embeds: list[discord.Embed], view: discord.ui.View):
+        self.id = message_id
+        self.embeds = embeds
+        self.components = _components(view)
+        self.attachments: list[discord.File] = []
+        self.edits = 0
+
+    def snapshot(self) -> "FakeMessage":
+        return FakeMessage(self)
+
+
+class FakeMessage:
+    """A copy of a message as a client saw it when fetched."""
+
+    def __init__(self, server: FakeDiscordMessage):
+        self.server = server
+        self.id = server.id
+        self.embeds = [discord.Embed.from_dict(embed.to_dict()) for embed in server.embeds]
+        self.components = list(server.components)
+        self.attachments = list(server.attachments)
+
+    async def fetch(self) -> "FakeMessage":
+        return self.server.snapshot()
+
+    async def edit(self, embeds, attachments, view) -> "FakeMessage":
+        await asyncio.sleep(0.01)
+        self.server.embeds = list(embeds)
+        self.server.attachments = list(attachments)
+        self.server.components = _components(view)
+        self.server.edits += 1
+        return self.server.snapshot()
+
+
+def _interaction(message: FakeMessage) -> SimpleNamespace:
+    cache = SimpleNamespace(get=lambda match_uuid, scale, names: PNG_BYTES)
+    return SimpleNamespace(
+        response=SimpleNamespace(defer=AsyncMock()),
+        followup=SimpleNamespace(send=AsyncMock()),
+        client=SimpleNamespace(match_service=object(), scoreboard_cache=cache),
+        guild_id=None,
+        channel_id=10,
+        message=message,
+    )
+
+
+def _coalesced_message() -> FakeDiscordMessage:
+    matches = [(f"https://pred.gg/matches/{uuid.replace('-', '')}", uuid) for uuid in (MATCH_A, MATCH_B)]
+    embeds = [discord.Embed(title=f"Match {number}", url=url) for number, (url, _) in enumerate(matches, 1)]
+    return FakeDiscordMessage(1234, embeds, CoalescedMatchView(matches))
+
+
+async def test_concurrent_clicks_keep_both_scoreboards():
+    """Test that clicks on two matches of one coalesced message both end up on it."""
+    server = _coalesced_message()
+    # Both clicks carry the message as it was before either edit
+    clicks = [
+        _handle_scoreboard_callback(_interaction(server.snapshot()), MATCH_A),
+        _handle_scoreboard_callback(_interaction(server.snapshot()), MATCH_B),
+    ]
+    await asyncio.gather(*clicks)
+
+    assert sorted(file.filename for file in server.attachments) == [
+        f"scoreboard_{MATCH_A}.png",
+        f"scoreboard_{MATCH_B}.png",
+    ]
+    assert [embed.image.url for embed in server.embeds] == [
+        f"attachment://scoreboard_{MATCH_A}.png",
+        f"attachment://scoreboard_{MATCH_B}.png",
+    ]
+    remaining = [child.custom_id for row in server.components for child in row.children if child.custom_id]
+    assert remaining == []
+    # The "Open" links survive both edits
+    assert len([child for row in server.components for child in row.children if child.url]) == 2
+
+
+async def test_repeated_click_edits_once():
+    """Test that a second click on a scoreboard already being shown does not edit again."""
+    server = _coalesced_message()
+    interactions = [_interaction(server.snapshot()) for _ in range(2)]
+    await asyncio.gather(*(_handle_scoreboard_callback(i, MATCH_A) for i in interactions))
+
+    assert server.edits == 1
+    assert [file.filename for file in server.attachments] == [f"scoreboard_{MATCH_A}.png"]
+    for interaction in interactions:
+        interaction.followup.send.assert_not_called()
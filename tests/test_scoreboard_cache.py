@@ -0,0 +1,110 @@
+"""Tests for the on-disk scoreboard image cache."""
+import os
+
+import pytest
+
+from services import scoreboard_cache as scoreboard_cache_module
+from services.scoreboard_cache import ScoreboardCache
+
+PNG = b"\x89PNG\r\n\x1a\n"
+WEBP = b"RIFF\x00\x00\x00\x00WEBPVP8L"
+SCALE = 1.5
+
+
+def _image(size: int, header: bytes = PNG, fill: bytes = b"x") -> bytes:
+    return header + fill * (size - len(header))
+
+
+@pytest.fixture
+def fallback_uuid(raw_match) -> str:
+    """A player the fixture match has no name for (drawn with a subscribed name)."""
+    return next(mp["player"]["uuid"] for mp in raw_match["matchPlayers"] if not mp["player"].get("name"))
+
+
+@pytest.fixture
+def named_uuid(raw_match) -> str:
+    """A player the fixture match has a name for."""
+    return next(mp["player"]["uuid"] for mp in raw_match["matchPlayers"] if mp["player"].get("name"))
+
+
+def test_key_changes_with_fallback_names(tmp_path, raw_match, fallback_uuid, named_uuid):
+    """Test that only stored names of players drawn with a fallback pick a different image."""
+    cache = ScoreboardCache(tmp_path)
+    image = _image(100)
+    cache.put(raw_match["uuid"], SCALE, {fallback_uuid: "Alice"}, raw_match, image)
+
+    assert cache.get(raw_match["uuid"], SCALE, {fallback_uuid: "Alice"}) == image
+    # A name for a player the API already named is never drawn
+    assert cache.get(raw_match["uuid"], SCALE, {fallback_uuid: "Alice", named_uuid: "Bob"}) == image
+    assert cache.get(raw_match["uuid"], SCALE, {fallback_uuid: "Renamed"}) is None
+    assert cache.get(raw_match["uuid"], SCALE, {}) is None
+    assert cache.get(raw_match["uuid"], 2.0, {fallback_uuid: "Alice"}) is None
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 3
+
+
+def test_encodings_share_a_key(tmp_path, raw_match):
+    """Test that a WebP render is found, and stored with its own extension."""
+    cache = ScoreboardCache(tmp_path)
+    image = _image(100, header=WEBP)
+    cache.put(raw_match["uuid"], SCALE, None, raw_match, image)
+
+    assert cache.get(raw_match["uuid"], SCALE) == image
+    assert [path.suffix for path in tmp_path.glob(f"{raw_match['uuid']}_*")] == [".webp"]
+
+
+def test_evicts_least_recently_used_by_size(tmp_path, raw_match):
+    """Test that the oldest unused images are deleted once the byte budget is exceeded."""
+    cache = ScoreboardCache(tmp_path, max_bytes=250)
+    uuids = [f"00000000-0000-0000-0000-00000000000{i}" for i in range(3)]
+    cache.put(uuids[0], SCALE, None, raw_match, _image(100))
+    cache.put(uuids[1], SCALE, None, raw_match, _image(100))
+    assert cache.get(uuids[0], SCALE) is not None  # Now the most recently used
+
+    cache.put(uuids[2], SCALE, None, raw_match, _image(100))
+
+    assert cache.get(uuids[1], SCALE) is None
+    assert cache.get(uuids[0], SCALE) is not None
+    assert cache.get(uuids[2], SCALE) is not None
+    assert cache.stats()["bytes"] == 200
+    assert cache.stats()["evictions"] == 1
+    # The evicted image and its match's names file are gone from disk
+    assert not list(tmp_path.glob(f"{uuids[1]}*"))
+
+
+def test_lru_order_survives_restart(tmp_path, raw_match):
+    """Test that a new cache over the same directory evicts by file recency."""
+    uuids = ["00000000-0000-0000-0000-00000000000a", "00000000-0000-0000-0000-00000000000b"]
+    cache = ScoreboardCache(tmp_path, max_bytes=250)
+    for uuid in uuids:
+        cache.put(uuid, SCALE, None, raw_match, _image(100))
+    for age, uuid in enumerate(reversed(uuids), start=1):
+        for path in tmp_path.glob(f"{uuid}_*"):
+            os.utime(path, (1000 - age, 1000 - age))
+
+    reopened = ScoreboardCache(tmp_path, max_bytes=250)
+    assert reopened.stats()["images"] == 2
+    reopened.put("00000000-0000-0000-0000-00000000000c", SCALE, None, raw_match, _image(100))
+
+    assert reopened.get(uuids[0], SCALE) is None
+    assert reopened.get(uuids[1], SCALE) is not None
+
+
+def test_writes_are_atomic(tmp_path, raw_match, monkeypatch):
+    """Test that a failed write keeps the previous image and leaves no partial files."""
+    cache = ScoreboardCache(tmp_path)
+    original = _image(100, fill=b"a")
+    cache.put(raw_match["uuid"], SCALE, None, raw_match, original)
+
+    real_replace = os.replace
+
+    def failing_replace(src, dst):
+        if str(dst).endswith(".png"):
+            raise OSError("disk full")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(scoreboard_cache_module.os, "replace", failing_replace)
+    cache.put(raw_match["uuid"], SCALE, None, raw_match, _image(100, fill=b"b"))
+
+    assert cache.get(raw_match["uuid"], SCALE) == original
+    assert not [path.name for path in tmp_path.iterdir() if path.name.endswith(".tmp")]
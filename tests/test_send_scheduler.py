@@ -0,0 +1,139 @@
+"""Tests for the rate-limit-aware Discord send scheduler."""
+import asyncio
+
+import pytest
+
+from services.send_scheduler import (
+    SendPriority,
+    SendScheduler,
+    TokenBucket,
+    _SendJob,
+    parse_rate_limit,
+)
+
+
+def test_bucket_refills_continuously_up_to_capacity():
+    """Test that a drained bucket refills at capacity/period and never overfills."""
+    bucket = TokenBucket(2, 1.0)
+    now = bucket.updated
+    bucket.consume(now)
+    bucket.consume(now)
+
+    assert bucket.wait_time(now) == pytest.approx(0.5)
+    assert bucket.wait_time(now + 0.25) == pytest.approx(0.25)
+    assert bucket.wait_time(now + 0.5) == 0.0
+    assert not bucket.is_full(now + 0.5)
+    assert bucket.is_full(now + 10)
+    assert bucket.tokens == 2
+
+
+async def test_channel_cannot_borrow_from_exhausted_guild_bucket():
+    """Test that a job waits for its guild bucket even when its channel has tokens."""
+    scheduler = SendScheduler(channel_limit=(5, 5.0), guild_limit=(1, 2.0), global_limit=(40, 1.0))
+    first = _job(guild_id=1, channel_id=10)
+    other_channel = _job(guild_id=1, channel_id=11)
+    other_guild = _job(guild_id=2, channel_id=20)
+
+    now = scheduler._global_bucket.updated
+    for bucket in scheduler._buckets(first):
+        bucket.consume(now)
+
+    assert scheduler._wait_time(other_channel, now) == pytest.approx(2.0, abs=0.01)
+    assert scheduler._wait_time(other_guild, now) == 0.0
+
+
+@pytest.mark.parametrize("value", ["abc", "/5", "5/", "5/x", "0/5", "-1/5", "5/0", "5/-1", "5/inf", "5/nan"])
+def test_parse_rate_limit_rejects_malformed(value):
+    """Test that malformed or non-positive "n/s" strings raise ValueError."""
+    with pytest.raises(ValueError):
+        parse_rate_limit(value)
+
+
+def test_parse_rate_limit():
+    """Test that "n/s" strings parse, with a bare count meaning per second."""
+    assert parse_rate_limit("5/5") == (5, 5.0)
+    assert parse_rate_limit("40/1") == (40, 1.0)
+    assert parse_rate_limit("3/0.5") == (3, 0.5)
+    assert parse_rate_limit("10") == (10, 1.0)
+
+
+async def test_interactive_jumps_ahead_of_queued_bulk():
+    """Test that an interactive request is sent before bulk ones already waiting."""
+    scheduler = SendScheduler(global_limit=(1, 0.1))
+    scheduler.start()
+    sent: list[str] = []
+
+    def request(name):
+        async def send():
+            sent.append(name)
+        return send
+
+    try:
+        bulk = [
+            asyncio.create_task(scheduler.submit(1, 10, request(f"bulk-{i}"), SendPriority.BULK))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0.02)
+        assert sent == ["bulk-0"]  # The rest wait for the global bucket
+
+        interactive = scheduler.submit(1, 10, request("interactive"), SendPriority.INTERACTIVE)
+        await asyncio.wait_for(asyncio.gather(interactive, *bulk), timeout=2)
+    finally:
+        await scheduler.stop()
+
+    assert sent == ["bulk-0", "interactive", "bulk-1", "bulk-2"]
+
+
+async def test_max_in_flight_caps_concurrent_requests():
+    """Test that no more than max_in_flight requests await Discord at once."""
+    scheduler = SendScheduler(max_in_flight=2)
+    scheduler.start()
+    release = asyncio.Event()
+    active = 0
+    peak = 0
+
+    async def send():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await release.wait()
+        active -= 1
+
+    try:
+        jobs = [asyncio.create_task(scheduler.submit(i, i, send)) for i in range(5)]
+        await asyncio.sleep(0.05)
+        assert scheduler.stats()["in_flight"] == 2
+        assert scheduler.stats()["pending_bulk"] == 3
+
+        release.set()
+        await asyncio.wait_for(asyncio.gather(*jobs), timeout=2)
+    finally:
+        await scheduler.stop()
+
+    assert peak == 2
+    assert scheduler.dispatched["bulk"] == 5
+
+
+async def test_stop_waits_for_dispatched_requests():
+    """Test that stop() lets a request already sent finish and return its result."""
+    scheduler = SendScheduler()
+    scheduler.start()
+
+    async def send():
+        await asyncio.sleep(0.05)
+        return "sent"
+
+    job = asyncio.create_task(scheduler.submit(1, 10, send))
+    await asyncio.sleep(0.01)
+    await scheduler.stop()
+
+    assert await job == "sent"
+
+
+def _job(guild_id, channel_id):
+    """Build a queued-job record without submitting it."""
+    async def send():
+        pass
+
+    future = asyncio.get_running_loop().create_future()
+    return _SendJob(guild_id, channel_id, send, future, SendPriority.BULK)
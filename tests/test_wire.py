@@ -0,0 +1,119 @@
+"""Tests for the cron-to-bot match payload encodings."""
+import json
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from predecessor_api import (
+    JSON_CONTENT_TYPE,
+    MSGPACK_CONTENT_TYPE,
+    MatchService,
+    decode_match,
+    encode_match,
+)
+from predecessor_api.wire import slim_match_payload
+
+
+@pytest.mark.parametrize("content_type", [JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE])
+def test_round_trip_returns_equal_payload(raw_match, content_type):
+    """Test that both encodings decode to the fields transform_match_data reads."""
+    if content_type == MSGPACK_CONTENT_TYPE:
+        pytest.importorskip("msgpack")
+
+    decoded = decode_match(encode_match(raw_match, content_type), content_type)
+
+    assert decoded == slim_match_payload(raw_match)
+    service = MatchService(api=None)
+    assert service.transform_match_data(decoded) == service.transform_match_data(raw_match)
+
+
+def test_msgpack_is_smaller_than_json(raw_match):
+    """Test that the string-table encoding is the more compact one."""
+    pytest.importorskip("msgpack")
+
+    assert len(encode_match(raw_match, MSGPACK_CONTENT_TYPE)) < len(encode_match(raw_match, JSON_CONTENT_TYPE))
+
+
+def test_json_fallback_is_plain_json(raw_match):
+    """Test that the JSON encoding is readable by bots that predate msgpack."""
+    body = encode_match(raw_match, JSON_CONTENT_TYPE)
+
+    assert json.loads(body) == slim_match_payload(raw_match)
+
+
+def test_unknown_compact_version_is_rejected(raw_match):
+    """Test that a payload from a newer layout raises ValueError instead of misreading it."""
+    msgpack = pytest.importorskip("msgpack")
+    data = msgpack.unpackb(encode_match(raw_match, MSGPACK_CONTENT_TYPE), raw=False)
+    data[0] += 1
+
+    with pytest.raises(ValueError):
+        decode_match(msgpack.packb(data), MSGPACK_CONTENT_TYPE)
+
+
+def test_unsupported_content_type_is_rejected(raw_match):
+    """Test that encoding and decoding refuse unknown content types."""
+    with pytest.raises(ValueError):
+        encode_match(raw_match, "text/plain")
+    with pytest.raises(ValueError):
+        decode_match(b"{}", "text/plain")
+
+
+@pytest.fixture
+async def bot_client():
+    """An HTTP client for the bot's match endpoint (delivery workers not started)."""
+    from services.http_server import HTTPServer
+
+    server = HTTPServer(SimpleNamespace(match_service=MatchService(api=None)))
+    app = web.Application()
+    app.router.add_post("/api/matches", server._handle_match_notification)
+    async with TestClient(TestServer(app)) as client:
+        client.bot_server = server
+        yield client
+
+
+@pytest.mark.parametrize("content_type", [JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE])
+async def test_bot_accepts_both_encodings(bot_client, raw_match, content_type):
+    """Test that the bot queues a match sent in either encoding."""
+    if content_type == MSGPACK_CONTENT_TYPE:
+        pytest.importorskip("msgpack")
+
+    response = await bot_client.post(
+        "/api/matches",
+        data=encode_match(raw_match, content_type),
+        headers={"Content-Type": content_type},
+    )
+
+    assert response.status == 202
+    assert (await response.json())["match_uuid"] == raw_match["uuid"]
+    assert bot_client.bot_server.delivery_queue.stats()["depth"] == 1
+
+
+async def test_bot_rejects_unknown_content_type(bot_client, raw_match):
+    """Test that an unknown Content-Type gets 415 with the accepted types listed."""
+    response = await bot_client.post(
+        "/api/matches",
+        data=json.dumps(raw_match),
+        headers={"Content-Type": "application/x-protobuf"},
+    )
+
+    assert response.status == 415
+    assert JSON_CONTENT_TYPE in response.headers["Accept-Post"]
+    assert bot_client.bot_server.delivery_queue.stats()["depth"] == 0
+
+
+@pytest.mark.parametrize("content_type", [JSON_CONTENT_TYPE, MSGPACK_CONTENT_TYPE])
+def test_null_and_empty_fields_decode_alike(raw_match, content_type):
+    """Test that null fields and empty nested objects survive both encodings the same way."""
+    if content_type == MSGPACK_CONTENT_TYPE:
+        pytest.importorskip("msgpack")
+    match = dict(raw_match, region=None)
+    match["matchPlayers"] = [dict(mp, kills=None, hero={}, rating=None) for mp in raw_match["matchPlayers"]]
+
+    decoded = decode_match(encode_match(match, content_type), content_type)
+
+    assert decoded == slim_match_payload(match)
+    assert "region" not in decoded
+    assert all("kills" not in mp and mp["hero"] == {} and "rating" not in mp for mp in decoded["matchPlayers"])